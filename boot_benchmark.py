@@ -0,0 +1,111 @@
+"""Measures cold and warm start times of the GUI without showing a window.
+
+Each start runs in a separate process using the offscreen platform. The first start uses an empty bytecode cache (cold),
+all following starts reuse it (warm). All starts use a temporary ini file with temporary configuration and data paths in test mode,
+thus only default plugins are enabled, no device is connected, and the settings of the current user are not modified.
+Detailed timelines are saved to startup_trace.json in the temporary configuration path, which is removed afterwards.
+If --threshold is given, the run fails if the median warm start takes longer.
+
+Run with: python boot_benchmark.py --warm 3 --threshold 10
+"""
+import argparse
+import json
+import os
+import subprocess  # noqa: S404
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PHASES = ['PluginManager.loadPlugins', 'PluginManager.provideDocks', 'PluginManager.finalizeInit', 'PluginManager.afterFinalizeInit', 'Settings.init']
+
+
+def boot(settingsDir: str) -> None:
+    """Start the application, stop after all plugins are loaded, and print timings as json.
+
+    :param settingsDir: Directory for the temporary ini file, configuration, and data.
+    :type settingsDir: str
+    """
+    start = time.perf_counter()
+    import matplotlib as mpl  # noqa: PLC0415
+    import matplotlib.backends.backend_pdf  # pylint: disable = unused-import  # noqa: F401, PLC0415
+    from PyQt6.QtCore import QSettings, QTimer  # noqa: PLC0415
+
+    from esibd.const import CONFIGPATH, DATAPATH, GENERAL, TESTMODE, qSet  # noqa: PLC0415
+    # replace settings of the current user before any plugin reads them
+    qSet.settings = QSettings((Path(settingsDir) / 'settings.ini').as_posix(), QSettings.Format.IniFormat)
+    for key, path in ((CONFIGPATH, 'conf'), (DATAPATH, 'data')):
+        (Path(settingsDir) / path).mkdir(exist_ok=True)
+        qSet.setValue(f'{GENERAL}/{key}', (Path(settingsDir) / path).as_posix())
+    qSet.setValue(f'{GENERAL}/{TESTMODE}', True)  # noqa: FBT003
+    from esibd.core import Application, EsibdExplorer, MouseInterceptor, SplashScreen, colors, startupTimeline  # noqa: PLC0415
+
+    # same configuration as esibd.__main__
+    mpl.use('Qt5Agg')
+    mpl.rcParams['savefig.format'] = 'pdf'
+    mpl.rcParams['savefig.bbox'] = 'tight'
+    mpl.rcParams['savefig.facecolor'] = colors.fg_light
+    mpl.rcParams['figure.max_open_warning'] = 50
+    imported = time.perf_counter()
+    app = Application(sys.argv)
+    app.setStyle('Fusion')
+    app.splashScreen = SplashScreen(app=app)
+    app.mainWindow = EsibdExplorer(app=app)
+    app.mainWindow.show()
+    app.mouseInterceptor = MouseInterceptor(app.mainWindow)
+    app.installEventFilter(app.mouseInterceptor)
+
+    def finish() -> None:
+        result = {'import': imported - start, 'total': time.perf_counter() - start}
+        result.update({phase: startupTimeline.duration(phase) for phase in PHASES})
+        result['slowest'] = [(event['name'], event['dur'] / 1e6) for event in sorted(
+            (event for event in startupTimeline.events if event['cat'] in {'import', 'plugin'}), key=lambda event: event['dur'], reverse=True)[:5]]
+        app.mainWindow.closeApplication(confirm=False)
+        print(json.dumps(result))  # noqa: T201
+        app.quit()
+
+    app.mainWindow.loadPluginsSignal.connect(lambda: QTimer.singleShot(0, finish))  # executed after loadPlugins has completed
+    app.exec()
+
+
+def run(cacheDir: str, settingsDir: str) -> dict:
+    """Run a single start in a new process.
+
+    :param cacheDir: Bytecode cache directory.
+    :type cacheDir: str
+    :param settingsDir: Directory for the temporary ini file, configuration, and data.
+    :type settingsDir: str
+    :return: Timings in s.
+    :rtype: dict
+    """
+    environment = os.environ | {'QT_QPA_PLATFORM': 'offscreen', 'PYTHONPYCACHEPREFIX': cacheDir}
+    process = subprocess.run([sys.executable, __file__, '--boot', settingsDir], capture_output=True, text=True, env=environment,  # noqa: S603
+                             cwd=Path(__file__).parent, check=False)
+    lines = [line for line in process.stdout.splitlines() if line.startswith('{')]
+    if not lines:
+        raise RuntimeError(f'Start failed:\n{process.stdout}\n{process.stderr}')
+    return json.loads(lines[-1])
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Measure cold and warm start times.')
+    parser.add_argument('--warm', type=int, default=3, help='Number of warm starts.')
+    parser.add_argument('--threshold', type=float, default=None, help='Fail if the median warm start (cold start if --warm 0) takes longer than this in s.')
+    parser.add_argument('--boot', default=None, help='Internal: perform a single start using the given settings directory.')
+    args = parser.parse_args()
+    if args.boot:
+        boot(args.boot)
+    else:
+        with tempfile.TemporaryDirectory() as cache, tempfile.TemporaryDirectory() as settings:
+            results = [('cold', run(cache, settings))] + [('warm', run(cache, settings)) for _ in range(args.warm)]
+        for label, result in results:
+            print(f"{label}: total {result['total']:6.2f} s, import {result['import']:6.2f} s, "  # noqa: T201
+                  + ', '.join(f'{phase} {result[phase]:6.2f} s' for phase in PHASES))
+        print('Slowest imports and plugins of last start: ' + ', '.join(f'{name} {duration:.2f} s' for name, duration in results[-1][1]['slowest']))  # noqa: T201
+        warm = [result['total'] for label, result in results if label == 'warm']
+        median = sorted(warm)[len(warm) // 2] if warm else results[0][1]['total']
+        if warm:
+            print(f"cold {results[0][1]['total']:.2f} s, warm median {median:.2f} s")  # noqa: T201
+        if args.threshold is not None and median > args.threshold:
+            print(f'Start time {median:.2f} s exceeds threshold of {args.threshold:.2f} s.')  # noqa: T201
+            sys.exit(1)
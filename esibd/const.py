@@ -1,21 +1,27 @@
 """Defines constants used throughout the package."""
 
+import atexit
 import colorsys
 import importlib.util
+import json
 import math
+import os
 import re
 import subprocess  # noqa: S404
 import sys
+import threading
+import time
 import traceback
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from enum import Enum
 from functools import wraps
-from typing import TYPE_CHECKING, TypeVar, Union, cast
+from typing import TYPE_CHECKING, Any, TypeVar, Union, cast
 
 import h5py
 import numpy as np
-from PyQt6.QtCore import QSettings
+from PyQt6.QtCore import QCoreApplication, QSettings, QTimer
 from PyQt6.QtGui import QColor
 from scipy import signal
 
@@ -78,7 +84,122 @@ UTF8 = 'utf-8'
 ANSI = 'ANSI'
 valid_chars = r'^[a-zA-Z0-9\s\-_\(\)\[\]\{\}\.*;:" \'<>^?=\+,~!@#$%&/]*$'
 
-qSet = QSettings(COMPANY_NAME, PROGRAM_NAME)
+
+class BufferedSettings:
+    """Write-behind cache for QSettings.
+
+    Changed values are kept in memory and written together after :attr:`~esibd.const.BufferedSettings.flushDelay`,
+    when calling :meth:`~esibd.const.BufferedSettings.sync`, and on exit.
+    This avoids writing to the registry or ini file for every change of frequently changing settings.
+    Supports the subset of the QSettings interface used by ESIBD Explorer, other methods are forwarded after flushing.
+    """
+
+    flushDelay = 1000
+    """Time in ms after the first change before pending values are written."""
+
+    def __init__(self, settings: QSettings) -> None:
+        """Initialize a BufferedSettings.
+
+        :param settings: The QSettings used for persistence.
+        :type settings: QSettings
+        """
+        self.settings = settings
+        self.pending: dict[str, Any] = {}
+        self.lock = threading.Lock()  # setValue may be called from other threads
+        self.timer: 'QTimer | None' = None  # created when first needed, requires QCoreApplication
+
+    def value(self, key: str, defaultValue: Any = None, type: 'type | None' = None) -> Any:  # noqa: A002, ANN401
+        """Return value from pending changes or QSettings.
+
+        :param key: The key.
+        :type key: str
+        :param defaultValue: Value returned if key does not exist, defaults to None
+        :type defaultValue: Any, optional
+        :param type: Type to which the value is converted, defaults to None
+        :type type: type, optional
+        :return: The value.
+        :rtype: Any
+        """
+        with self.lock:
+            if key in self.pending:
+                value = self.pending[key]
+                if type is None or isinstance(value, type):
+                    return value
+                if type is bool:
+                    return value in {'True', 'true'} if isinstance(value, str) else bool(value)
+                return type(value)
+        if type is None:
+            return self.settings.value(key, defaultValue)
+        return self.settings.value(key, defaultValue, type=type)
+
+    def setValue(self, key: str, value: Any) -> None:  # noqa: ANN401
+        """Store value in memory and schedule writing.
+
+        :param key: The key.
+        :type key: str
+        :param value: The value.
+        :type value: Any
+        """
+        with self.lock:
+            self.pending[key] = value
+        if threading.current_thread() is not threading.main_thread():
+            return  # written by next flush from main thread or on exit
+        if QCoreApplication.instance() is None:
+            self.flush()  # no event loop to flush later, e.g. scripts
+            return
+        if self.timer is None:
+            self.timer = QTimer()
+            self.timer.setSingleShot(True)
+            self.timer.timeout.connect(self.flush)
+        if not self.timer.isActive():
+            self.timer.start(self.flushDelay)
+
+    def flush(self) -> None:
+        """Write all pending values at once."""
+        with self.lock:
+            pending, self.pending = self.pending, {}
+        if pending:
+            for key, value in pending.items():
+                self.settings.setValue(key, value)
+            self.settings.sync()  # ini files are replaced atomically
+
+    def sync(self) -> None:
+        """Write pending values and synchronize with persistent storage."""
+        self.flush()
+        self.settings.sync()
+
+    def remove(self, key: str) -> None:
+        """Remove key and pending value.
+
+        :param key: The key.
+        :type key: str
+        """
+        with self.lock:
+            self.pending.pop(key, None)
+        self.settings.remove(key)
+
+    def clear(self) -> None:
+        """Remove all pending and persisted values."""
+        with self.lock:
+            self.pending.clear()
+        self.settings.clear()
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        """Forward other methods to QSettings after writing pending values.
+
+        :param name: Attribute name.
+        :type name: str
+        :return: Attribute of QSettings.
+        :rtype: Any
+        """
+        if name in {'settings', 'pending', 'lock', 'timer'}:
+            raise AttributeError(name)  # not yet initialized
+        self.flush()
+        return getattr(self.settings, name)
+
+
+qSet = BufferedSettings(QSettings(COMPANY_NAME, PROGRAM_NAME))
+atexit.register(qSet.flush)  # fallback if application is not closed regularly
 
 
 class Colors:
@@ -387,11 +508,168 @@ def dynamicImport(module: str, path: Path | str) -> 'ModuleType | None':
     spec = importlib.util.spec_from_file_location(module, path)
     if spec and spec.loader:
         Module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(Module)
+        with startupTimeline.phase(f'import {module}', category='import'):
+            spec.loader.exec_module(Module)
         return Module
     return None
 
 
+class StartupTimeline:
+    """Record the duration of startup phases as complete events in Chrome trace format.
+
+    The resulting file can be inspected using the :ref:`sec:tree` plugin, chrome://tracing, or https://ui.perfetto.dev.
+    Recording stops when :meth:`~esibd.const.StartupTimeline.save` is called after startup to avoid any overhead at run time.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a StartupTimeline."""
+        self.events: list[dict] = []
+        self.start = time.perf_counter()
+        self.active = True
+
+    @contextmanager
+    def phase(self, name: str, category: str = 'startup') -> Iterator[None]:
+        """Context manager that records the duration of the enclosed code.
+
+        :param name: Name of the phase.
+        :type name: str
+        :param category: Category of the phase, e.g. import, plugin, or device, defaults to 'startup'
+        :type category: str, optional
+        """
+        if not self.active:
+            yield
+            return
+        begin = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.events.append({'name': name, 'cat': category, 'ph': 'X', 'pid': os.getpid(), 'tid': threading.get_ident(),
+                                'ts': round((begin - self.start) * 1e6), 'dur': round((time.perf_counter() - begin) * 1e6)})
+
+    def duration(self, name: str) -> float:
+        """Return the total duration of all phases with the given name in s.
+
+        :param name: Name of the phase.
+        :type name: str
+        :return: Duration in s.
+        :rtype: float
+        """
+        return sum(event['dur'] for event in self.events if event['name'] == name) / 1e6
+
+    def save(self, file: Path) -> None:
+        """Stop recording and save all events.
+
+        :param file: The .json file.
+        :type file: pathlib.Path
+        """
+        self.active = False
+        with file.open('w', encoding=UTF8) as traceFile:
+            json.dump({'traceEvents': self.events, 'displayTimeUnit': 'ms'}, traceFile)
+
+
+startupTimeline = StartupTimeline()  # module level instance, created when esibd is first imported
+
+
+def traceStartup(func: Callable) -> Callable:
+    """Decorate to record the duration of a method in the :class:`~esibd.const.StartupTimeline`.
+
+    The phase is named after the instance (if it has a name) and the method.
+
+    :param func: The method to be traced.
+    :type func: Callable
+    :return: decorated method
+    :rtype: Callable
+    """
+    @wraps(func)
+    def wrapper(self: 'Plugin', *args, **kwargs) -> 'Callable | None':
+        if not startupTimeline.active:
+            return func(self, *args, **kwargs)
+        with startupTimeline.phase(f"{getattr(self, 'name', type(self).__name__)}.{func.__name__}", category=type(self).__name__):
+            return func(self, *args, **kwargs)
+    return wrapper
+
+
+class HotPathMetrics:
+    """Count calls and accumulate durations of known hot paths.
+
+    Recording is always active as it only requires two calls of time.perf_counter per call. Results are shown by the Profiler plugin.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a HotPathMetrics."""
+        self.metrics: dict[str, list[float]] = {}  # name: [count, total, maximum] in s
+        self.lock = threading.Lock()  # hot paths are called from multiple threads
+
+    def add(self, name: str, duration: float) -> None:
+        """Add a single call.
+
+        :param name: Name of the hot path.
+        :type name: str
+        :param duration: Duration in s.
+        :type duration: float
+        """
+        with self.lock:
+            metric = self.metrics.get(name)
+            if metric is None:
+                self.metrics[name] = [1, duration, duration]
+            else:
+                metric[0] += 1
+                metric[1] += duration
+                metric[2] = max(metric[2], duration)
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """Context manager that records the duration of the enclosed code.
+
+        :param name: Name of the hot path.
+        :type name: str
+        """
+        begin = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - begin)
+
+    def snapshot(self) -> dict[str, list[float]]:
+        """Return a copy of all metrics.
+
+        :return: name: [count, total, maximum]
+        :rtype: dict[str, list[float]]
+        """
+        with self.lock:
+            return {name: metric.copy() for name, metric in self.metrics.items()}
+
+    def reset(self) -> None:
+        """Remove all metrics."""
+        with self.lock:
+            self.metrics.clear()
+
+
+hotPathMetrics = HotPathMetrics()  # module level instance, shared by all plugins
+
+
+def hotPath(func: Callable) -> Callable:
+    """Decorate to record calls and durations of a method in :class:`~esibd.const.HotPathMetrics`.
+
+    The hot path is named after the class that defines the method and the method.
+
+    :param func: The method to be measured.
+    :type func: Callable
+    :return: decorated method
+    :rtype: Callable
+    """
+    name = func.__qualname__
+
+    @wraps(func)
+    def wrapper(*args, **kwargs) -> 'Callable | None':
+        begin = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            hotPathMetrics.add(name, time.perf_counter() - begin)
+    return wrapper
+
+
 def getValidConfigPath() -> Path:
     """Get validated configuration path.
 
@@ -699,4 +977,4 @@ def datasetToStrList(dataset: h5py.Dataset) -> list[str]:
     :return: The list.
     :rtype: list[str]
     """
-    return [str(k) for k in dataset.asstr()]
+    return [str(k) for k in dataset.asstr()[()]]  # read entire dataset at once instead of element by element
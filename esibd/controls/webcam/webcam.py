@@ -1,12 +1,12 @@
-import time
-from threading import Thread
+from threading import Lock, Thread
 
 import cv2
-from PyQt6.QtCore import QRectF, Qt, pyqtSignal
+import numpy as np
+from PyQt6.QtCore import QPointF, QRect, QRectF, Qt, pyqtSignal
 from PyQt6.QtGui import QImage, QPixmap
 from PyQt6.QtWidgets import QGraphicsPixmapItem, QGraphicsScene, QGraphicsView, QGridLayout
 
-from esibd.core import PLUGINTYPE, RestoreIntComboBox
+from esibd.core import PLUGINTYPE, PRINT, RestoreIntComboBox
 from esibd.plugins import Plugin
 
 
@@ -18,26 +18,30 @@ def providePlugins() -> 'list[type[Plugin]]':
 class Webcam(Plugin):
     """Allows to display the stream from a webcam.
 
+    Only the latest frame is displayed, frames that arrive while the GUI is busy are skipped.
+    Frames can be downscaled and cropped to a region of interest before they are displayed and optionally saved to a video file.
     More advanced use cases where the frames are part of measurement data have to be implemented separately.
     """
 
     name = 'Webcam'
-    version = '1.0'
+    version = '1.1'
     pluginType = PLUGINTYPE.CONTROL
     iconFile = 'webcam.png'
+    deferGUI = True
     signalComm: 'SignalCommunicate'
 
     class SignalCommunicate(Plugin.SignalCommunicate):  # signals that can be emitted by external threads
         """Bundle pyqtSignals."""
 
-        frameCaptured = pyqtSignal(object)
-        """Emit frame data"""
+        frameCaptured = pyqtSignal()
+        """Indicate that a new frame is available in the mailbox."""
 
     def initGUI(self) -> None:
         super().initGUI()
         lay = QGridLayout()
         self.recording = False
         self.graphicsView = QGraphicsView()
+        self.graphicsView.rubberBandChanged.connect(self.rubberBandChanged)
         lay.addWidget(self.graphicsView)
         self.addContentLayout(lay)
         self.scene = QGraphicsScene()
@@ -45,16 +49,34 @@ class Webcam(Plugin):
         self.scenePixmapItem = None
         self.signalComm.frameCaptured.connect(self.processFrame)
         self.runThread: 'Thread | None' = None
+        self.frameLock = Lock()
+        self.latestFrame: 'np.ndarray | None' = None  # mailbox: only the latest frame is kept
+        self.framePending = False  # True while a frameCaptured signal has not been processed
+        self.displayedFrame: 'np.ndarray | None' = None  # keeps buffer of displayed QImage alive
+        self.roi: 'tuple[int, int, int, int] | None' = None  # x, y, width, height in camera pixels
+        self.rubberBand: 'tuple[QPointF, QPointF] | None' = None
+        self.frameOffset = (0, 0)  # position of displayed frame in camera pixels
+        self.frameScale = 1  # downscaling of displayed frame
+        self.videoFile = None
+        self.downscale = 1
 
     def finalizeInit(self) -> None:
         self.recordingAction = self.addStateAction(event=self.toggleRecording,
                                                    toolTipFalse='Start recording.', iconFalse=self.makeIcon('webcam.png'),
                                                    toolTipTrue='Stop recording.', iconTrue=self.makeIcon('webcam.png'))
+        self.saveVideoAction = self.addStateAction(event=self.toggleSaveVideo, toolTipFalse='Save video to file.', iconFalse=self.makeCoreIcon('record_start.png'),
+                                                   toolTipTrue='Stop saving video.', iconTrue=self.makeCoreIcon('record_stop.png'), restore=False)
+        self.roiAction = self.addStateAction(event=self.toggleRoi, toolTipFalse='Drag to crop to region of interest.', iconFalse=self.makeCoreIcon('zoom_to_rect_large.png'),
+                                             toolTipTrue='Show full frame.', iconTrue=self.makeCoreIcon('zoom_to_rect_large.png'), restore=False)
         super().finalizeInit()
         self.cameraIndexComboBox = RestoreIntComboBox(parentPlugin=self, default='0', items='0,1,2,3,4,5', attr='cameraIndex',
                                                         event=self.cameraIndexChanged, minimum=0, maximum=100, toolTip='Webcam index.')
+        self.downscaleComboBox = RestoreIntComboBox(parentPlugin=self, default='1', items='1,2,4,8', attr='downscale',
+                                                    event=self.downscaleChanged, minimum=1, maximum=16, toolTip='Downscale frames by this factor.')
         if self.titleBar:
             self.titleBar.insertWidget(self.aboutAction, self.cameraIndexComboBox)
+            self.titleBar.insertWidget(self.aboutAction, self.downscaleComboBox)
+        self.downscaleChanged()
         self.copyAction = self.addAction(event=self.copyClipboard, toolTip=f'{self.name} to clipboard.', icon=self.imageClipboardIcon, before=self.aboutAction)
 
     def copyClipboard(self) -> None:
@@ -74,32 +96,85 @@ class Webcam(Plugin):
                 self.recording = False
                 self.runThread.join()
             self.recording = True
-            self.runThread = Thread(target=self.recordVideo, name=f'{self.name} recordThread')
+            self.runThread = Thread(target=self.recordVideo, args=(int(self.cameraIndexComboBox.currentText()),), name=f'{self.name} recordThread')
             self.runThread.daemon = True
             self.runThread.start()
         else:
             self.recording = False
+            self.saveVideoAction.state = False
+            self.toggleSaveVideo()
+
+    def downscaleChanged(self) -> None:
+        """Store downscaling factor for use in recordThread."""
+        self.downscale = int(self.downscaleComboBox.currentText())
+
+    def toggleSaveVideo(self) -> None:
+        """Start or stop saving frames to a video file. The file is written by the recordThread."""
+        if self.saveVideoAction.state:
+            self.pluginManager.Settings.incrementMeasurementNumber()
+            self.videoFile = self.pluginManager.Settings.getMeasurementFileName(f'_{self.name}.mp4')
+            self.print(f'Start saving {self.videoFile.name}')
+            if not self.recordingAction.state:
+                self.recordingAction.state = True
+                self.toggleRecording()
+        else:
+            self.videoFile = None  # recordThread releases the video writer
 
-    def processFrame(self, frame: cv2.typing.MatLike) -> None:
-        """Convert the frame to a format that Qt can use.
-
-        :param frame: Video frame.
-        :type frame: cv2.typing.MatLike
+    def toggleRoi(self) -> None:
+        """Select region of interest by dragging or return to full frame."""
+        self.rubberBand = None
+        if self.roiAction.state:
+            self.graphicsView.setDragMode(QGraphicsView.DragMode.RubberBandDrag)
+        else:
+            self.graphicsView.setDragMode(QGraphicsView.DragMode.NoDrag)
+            self.roi = None
+
+    def rubberBandChanged(self, rect: QRect, fromScenePoint: QPointF, toScenePoint: QPointF) -> None:
+        """Use the selected rectangle as region of interest once the selection is completed.
+
+        :param rect: Selection in viewport coordinates. Null when the selection is completed.
+        :type rect: QRect
+        :param fromScenePoint: Start of selection in scene coordinates.
+        :type fromScenePoint: QPointF
+        :param toScenePoint: End of selection in scene coordinates.
+        :type toScenePoint: QPointF
         """
-        image = QImage(
-            frame.data,
-            frame.shape[1],
-            frame.shape[0],
-            QImage.Format.Format_BGR888,
-        )
+        if not rect.isNull():
+            self.rubberBand = fromScenePoint, toScenePoint
+        elif self.rubberBand:
+            # convert from displayed frame to camera pixels
+            (x0, x1), (y0, y1) = [sorted(self.frameOffset[i] + int(getattr(point, axis)() * self.frameScale) for point in self.rubberBand)
+                                  for i, axis in enumerate(('x', 'y'))]
+            if x1 - x0 > 1 and y1 - y0 > 1:
+                self.roi = max(x0, 0), max(y0, 0), x1 - max(x0, 0), y1 - max(y0, 0)
+                self.scenePixmapItem = None  # fit new frame size to view
+            self.rubberBand = None
+            self.graphicsView.setDragMode(QGraphicsView.DragMode.NoDrag)
+
+    def processFrame(self) -> None:
+        """Display the latest frame. Frames that arrived while the GUI was busy have been replaced in the mailbox."""
+        with self.frameLock:
+            frame = self.latestFrame
+            self.latestFrame = None
+            self.framePending = False
+        if frame is None:
+            return
+        self.displayedFrame = frame
+        # QImage uses the frame buffer directly, QPixmap.fromImage is the only copy
+        image = QImage(frame.data, frame.shape[1], frame.shape[0], frame.strides[0], QImage.Format.Format_BGR888)
         pixmap = QPixmap.fromImage(image)
 
         if self.scenePixmapItem is None:
+            self.scene.clear()
             self.scenePixmapItem = QGraphicsPixmapItem(pixmap)
             self.scene.addItem(self.scenePixmapItem)
             self.scenePixmapItem.setZValue(0)
+            self.scene.setSceneRect(self.scenePixmapItem.boundingRect())
             self.fitInView(self.scene.sceneRect(), Qt.AspectRatioMode.KeepAspectRatio)
         else:
+            if self.scenePixmapItem.pixmap().size() != pixmap.size():
+                self.scene.setSceneRect(QRectF(pixmap.rect()))
+                self.fitInView(self.scene.sceneRect(), Qt.AspectRatioMode.KeepAspectRatio)
             self.scenePixmapItem.setPixmap(pixmap)
 
     def fitInView(self, rect: QRectF, aspectRatioMode: Qt.AspectRatioMode) -> None:
@@ -112,15 +187,65 @@ class Webcam(Plugin):
         """
         self.graphicsView.fitInView(rect, aspectRatioMode)
 
-    def recordVideo(self) -> None:
-        """Record video frames in parallel thread."""
-        cap = cv2.VideoCapture(int(self.cameraIndexComboBox.currentText()))
+    def prepareFrame(self, frame: np.ndarray) -> np.ndarray:
+        """Crop frame to region of interest and downscale it.
+
+        :param frame: Video frame as provided by the camera.
+        :type frame: np.ndarray
+        :return: Processed frame.
+        :rtype: np.ndarray
+        """
+        roi = self.roi
+        if roi:
+            x, y, width, height = roi
+            frame = frame[y:y + height, x:x + width]  # view, no copy
+        scale = self.downscale
+        if scale > 1 and frame.shape[0] >= scale and frame.shape[1] >= scale:
+            frame = cv2.resize(frame, (frame.shape[1] // scale, frame.shape[0] // scale), interpolation=cv2.INTER_AREA)
+        self.frameOffset = (roi[0], roi[1]) if roi else (0, 0)
+        self.frameScale = scale
+        return np.ascontiguousarray(frame)
+
+    def recordVideo(self, cameraIndex: int) -> None:
+        """Record video frames in parallel thread. Capture is paced by the camera.
+
+        :param cameraIndex: Index of the camera.
+        :type cameraIndex: int
+        """
+        cap = cv2.VideoCapture(cameraIndex)
+        fps = cap.get(cv2.CAP_PROP_FPS) or 30
+        video_writer = None
+        videoFile = None
+        videoSize = (0, 0)
         while self.recording:
-            ret, frame = cap.read()
-            if ret:
-                self.signalComm.frameCaptured.emit(frame)
-                time.sleep(0.033)  # Limit to ~30 FPS
-            else:
+            ret, frame = cap.read()  # blocks until the camera provides the next frame
+            if not ret:
                 break
+            frame = self.prepareFrame(frame)
+            if self.videoFile != videoFile:  # started, stopped, or replaced
+                if video_writer is not None:
+                    video_writer.release()
+                    self.print(f'Saved {videoFile.name}' if videoFile else 'Saved video.')
+                    video_writer = None
+                videoFile = self.videoFile
+                if videoFile is not None:
+                    videoSize = (frame.shape[1], frame.shape[0])
+                    video_writer = cv2.VideoWriter(videoFile.as_posix(), cv2.VideoWriter.fourcc(*'mp4v'), fps, videoSize)
+            if video_writer is not None:
+                try:
+                    video_writer.write(frame if (frame.shape[1], frame.shape[0]) == videoSize else cv2.resize(frame, videoSize))
+                except cv2.error as e:
+                    self.print(f'Could not save video frame: {e}', flag=PRINT.ERROR)
+                    video_writer.release()
+                    video_writer = None
+            with self.frameLock:
+                self.latestFrame = frame  # replace frame that has not been displayed yet
+                emit = not self.framePending
+                self.framePending = True
+            if emit:  # at most one signal is queued in the event loop
+                self.signalComm.frameCaptured.emit()
+        if video_writer is not None:
+            video_writer.release()
+            self.print(f'Saved {videoFile.name}' if videoFile else 'Saved video.')
         cap.release()
         self.scenePixmapItem = None
@@ -5,8 +5,11 @@ Whenever it is possible to make definitions only locally where they are needed,
 For now, English is the only supported language and use of hard coded error messages etc. in other files is tolerated if they are unique.
 """
 
+import bisect
 import configparser
+import mmap
 import os
+import queue
 import re
 import sys
 import threading
@@ -41,7 +44,7 @@ from matplotlib.widgets import Cursor
 from PIL import Image
 from PIL.ImageQt import ImageQt
 from PyQt6 import QtWidgets, sip
-from PyQt6.QtCore import QEvent, QObject, QPoint, QPointF, QRect, QSharedMemory, QSize, Qt, QTimer, pyqtBoundSignal, pyqtSignal
+from PyQt6.QtCore import QAbstractItemModel, QEvent, QModelIndex, QObject, QPoint, QPointF, QRect, QSharedMemory, QSize, Qt, QTimer, pyqtBoundSignal, pyqtSignal
 from PyQt6.QtGui import (
     QAction,
     QBrush,
@@ -67,9 +70,11 @@ from PyQt6.QtWebEngineWidgets import (
 )
 from PyQt6.QtWidgets import (
     QAbstractButton,
+    QAbstractItemView,
     QAbstractSpinBox,
     QApplication,
     QCheckBox,
+    QColorDialog,
     QComboBox,
     QCompleter,
     QDialog,
@@ -90,10 +95,13 @@ from PyQt6.QtWidgets import (
     QSplashScreen,
     QStackedLayout,
     QStatusBar,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
     QTabBar,
     QTabWidget,
     QTextEdit,
     QToolButton,
+    QTreeView,
     QTreeWidget,
     QTreeWidgetItem,
     QTreeWidgetItemIterator,
@@ -151,6 +159,11 @@ class EsibdExplorer(QMainWindow):
         """Load :class:`plugins<esibd.plugins.Plugin>` in main thread."""
         self.pluginManager = PluginManager()
         self.pluginManager.loadPlugins()
+        if startupTimeline.active:
+            traceFile = getValidConfigPath() / 'startup_trace.json'
+            startupTimeline.save(traceFile)
+            self.pluginManager.logger.print(f"Loaded plugins in {startupTimeline.duration('PluginManager.loadPlugins'):.2f} s. Startup timeline saved to {traceFile}.",
+                                            flag=PRINT.DEBUG)
 
     def toggleFullscreen(self) -> None:
         """Toggles full screen mode."""
@@ -212,6 +225,7 @@ class EsibdExplorer(QMainWindow):
         if restart:
             self.pluginManager.logger.print('Restarting.', flag=PRINT.EXPLORER)
         self.pluginManager.closePlugins()
+        qSet.sync()  # write settings changed while closing
         if restart:
             self.app.sharedAppStr.detach()
             python = sys.executable
@@ -255,6 +269,10 @@ class PluginManager:  # noqa: PLR0904
     SOURCECODEPATH = 'sourceCodePath'
     ICONFILE = 'iconFile'
     ICONFILEDARK = 'iconFileDark'
+    MTIME = 'mtime'
+    PLUGINS = 'plugins'
+    MANIFESTKEYS = (PLUGIN_TYPE, VERSION, SUPPORTEDVERSION, SOURCECODEPATH, DEPENDENCYPATH, PREVIEWFILETYPES, ICONFILE, ICONFILEDARK)
+    """Plugin metadata that is cached in the plugin manifest and restored for plugins of modules that are not imported."""
 
     def __init__(self) -> None:
         """Initialize PluginManager."""
@@ -263,6 +281,7 @@ class PluginManager:  # noqa: PLR0904
         self.testing_state = False  # has to be defined before logger
         self.logger = Logger(pluginManager=self)
         self.logger.print('Loading.', flag=PRINT.EXPLORER)
+        self.analysisPool = AnalysisPool(pluginManager=self)
         self.pluginFile: 'Path | None' = None
         self.tree: 'TreeWidget | None' = None
         self.mainWindow.setTabPosition(Qt.DockWidgetArea.LeftDockWidgetArea, QTabWidget.TabPosition.North)
@@ -315,6 +334,7 @@ class PluginManager:  # noqa: PLR0904
         else:
             self._loading -= 1
 
+    @traceStartup
     def loadPlugins(self) -> None:  # noqa: C901, PLR0915
         """Load all enabled plugins."""
         self.updateTheme()
@@ -335,6 +355,14 @@ class PluginManager:  # noqa: PLR0904
         if self.pluginFile.exists():
             self.confParser.read(self.pluginFile)
         self.confParser[INFO] = infoDict('PluginManager')
+        # The manifest remembers which plugins are provided by which file, and the type, version, file, mtime, preview file types, and icons of each plugin.
+        # Files that have not been modified since the last start and only provide disabled plugins are not imported.
+        self.manifestFile = getValidConfigPath() / 'plugins_manifest.ini'
+        self.previousManifest = configparser.ConfigParser(interpolation=None)
+        if self.manifestFile.exists():
+            self.previousManifest.read(self.manifestFile, encoding=UTF8)
+        self.manifest = configparser.ConfigParser(interpolation=None)
+        self.manifest[INFO] = infoDict('PluginManager')
 
         import esibd.provide_plugins  # pylint: disable = import-outside-toplevel  # avoid circular import  # noqa: PLC0415
         self.loadPluginsFromModule(Module=esibd.provide_plugins, dependencyPath=internalMediaPath,
@@ -354,6 +382,8 @@ class PluginManager:  # noqa: PLR0904
         if self.pluginFile:
             with self.pluginFile.open('w', encoding=UTF8) as configFile:
                 self.confParser.write(configFile)
+        with self.manifestFile.open('w', encoding=UTF8) as manifestFile:
+            self.manifest.write(manifestFile)
 
         if hasattr(self, 'Settings'):
             self.Settings.init()  # init internal settings and settings of devices and scans which have been added in the meantime
@@ -380,6 +410,7 @@ class PluginManager:  # noqa: PLR0904
         if getTestMode():
             self.logger.print('Test mode is active! Simulating Data!', flag=PRINT.WARNING)
         self.logger.print('Ready.', flag=PRINT.EXPLORER)
+        QTimer.singleShot(1000, self.initDeferredGUIs)  # complete deferred plugins when idle
 
     def loadPluginsFromPath(self, path: 'Path | None') -> None:
         """Load plugins from a path.
@@ -390,6 +421,8 @@ class PluginManager:  # noqa: PLR0904
         if path:  # noqa: PLR1702
             for directory in [directory for directory in path.iterdir() if directory.is_dir()]:
                 for file in [file for file in directory.iterdir() if file.name.endswith('.py')]:
+                    if self.skipUnchangedModule(file):
+                        continue
                     try:
                         Module = dynamicImport(file.stem, file)
                     except Exception as e:  # pylint: disable = broad-except  # we have no control about the exception a plugin can possibly throw here  # noqa: BLE001
@@ -401,12 +434,44 @@ class PluginManager:  # noqa: PLR0904
                         self.qm.open()
                         self.qm.raise_()
                     else:
+                        pluginNames = []
                         if hasattr(Module, 'providePlugins'):
                             if Module and type(Module.providePlugins()) is list:
+                                pluginNames = [Plugin.name for Plugin in Module.providePlugins()]
                                 self.loadPluginsFromModule(Module=Module, dependencyPath=file.parent, sourceCodePath=file)
                             else:
                                 self.logger.print(f'Could not load module {file.stem}. Make sure providePlugins returns list of valid plugins.', flag=PRINT.ERROR)
                         # silently ignore dependencies which do not define providePlugins
+                        self.manifest[file.as_posix()] = {self.MTIME: str(file.stat().st_mtime_ns), self.PLUGINS: ', '.join(pluginNames)}
+
+    def skipUnchangedModule(self, file: Path) -> bool:
+        """Check the plugin manifest to decide if a module has to be imported.
+
+        Modules are skipped if they have not been modified since they have been added to the manifest
+        and all plugins they provide are disabled. Modules that do not provide plugins are skipped as well.
+        Skipped plugins remain in the plugin list so they can be enabled later.
+
+        :param file: The module file.
+        :type file: pathlib.Path
+        :return: True if the module does not need to be imported.
+        :rtype: bool
+        """
+        key = file.as_posix()
+        if key not in self.previousManifest or self.previousManifest[key].get(self.MTIME) != str(file.stat().st_mtime_ns):
+            return False
+        pluginNames = [name.strip() for name in self.previousManifest[key].get(self.PLUGINS, '').split(',') if name.strip()]
+        if any(name not in self.confParser or self.confParser[name][self.ENABLED] == 'True' for name in pluginNames):
+            return False  # plugin has to be instantiated or registered in plugins.ini
+        self.logger.print(f'Skipping import of {file.name} as it only provides disabled plugins.', flag=PRINT.DEBUG)
+        self.pluginNames.extend(pluginNames)  # keep information about disabled plugins
+        self.manifest[key] = self.previousManifest[key]
+        for name in pluginNames:
+            if name in self.previousManifest:  # restore metadata for plugin dialog
+                self.manifest[name] = self.previousManifest[name]
+                for metadataKey in self.MANIFESTKEYS:
+                    if metadataKey in self.previousManifest[name]:
+                        self.confParser[name][metadataKey] = self.previousManifest[name][metadataKey]
+        return True
 
     def loadPluginsFromModule(self, Module: 'ModuleType', dependencyPath: Path, sourceCodePath: Path) -> None:
         """Load plugins from a module.
@@ -419,9 +484,8 @@ class PluginManager:  # noqa: PLR0904
         :type sourceCodePath: Path
         """
         for Plugin in Module.providePlugins():
-            # requires loading all dependencies, no matter if plugin is used or not
-            # if a dependency of an unused plugin causes issues, report it and remove the corresponding file from the plugin folder until fixed.
-            # might consider different import mechanism which does not require import unless plugins are enabled.
+            # modules are only imported if they are new, have been modified, or provide enabled plugins. See skipUnchangedModule.
+            # if a dependency of an enabled plugin causes issues, report it and remove the corresponding file from the plugin folder until fixed.
             self.pluginNames.append(Plugin.name)
             if Plugin.name not in self.confParser:  # add plugin to confParser
                 self.confParser.read_dict({Plugin.name: {self.ENABLED: not Plugin.optional, self.VERSION: Plugin.version, self.SUPPORTEDVERSION: Plugin.supportedVersion,
@@ -442,6 +506,7 @@ class PluginManager:  # noqa: PLR0904
                 plugin = self.loadPlugin(Plugin, dependencyPath=dependencyPath, sourceCodePath=sourceCodePath)
                 if plugin:
                     self.confParser[Plugin.name][self.PREVIEWFILETYPES] = ', '.join(plugin.getSupportedFiles())  # requires instance
+            self.manifest[Plugin.name] = {key: self.confParser[Plugin.name][key] for key in self.MANIFESTKEYS} | {self.MTIME: str(sourceCodePath.stat().st_mtime_ns)}
 
     def loadPlugin(self, Plugin: 'type[Plugin]', dependencyPath: Path, sourceCodePath: Path) -> 'Plugin | None':
         """Load a single plugin.
@@ -470,7 +535,8 @@ class PluginManager:  # noqa: PLR0904
             self.logger.print(f'Ignoring duplicate plugin {Plugin.name}.', flag=PRINT.WARNING)
         else:
             try:
-                plugin = Plugin(pluginManager=self, dependencyPath=dependencyPath, sourceCodePath=sourceCodePath)
+                with startupTimeline.phase(f'loadPlugin {Plugin.name}', category='plugin'):
+                    plugin = Plugin(pluginManager=self, dependencyPath=dependencyPath, sourceCodePath=sourceCodePath)
                 setattr(self.__class__, plugin.name, plugin)  # use attributes to access for communication between plugins
             except Exception:  # pylint: disable = broad-except  # we have no control about the exception a plugin can possibly throw  # noqa: BLE001
                 # No unpredictable exception in a single plugin should break the whole application
@@ -480,6 +546,17 @@ class PluginManager:  # noqa: PLR0904
                 return plugin
         return None
 
+    def initDeferredGUIs(self) -> None:
+        """Build the GUI of deferred plugins one at a time while the application is idle. See :attr:`~esibd.plugins.Plugin.deferGUI`."""
+        if self.closing or self.loading:
+            return
+        deferredPlugins = [plugin for plugin in self.plugins if plugin.deferredGUI]
+        if deferredPlugins:
+            deferredPlugins[0].initDeferredGUI()
+            if len(deferredPlugins) > 1:
+                QTimer.singleShot(200, self.initDeferredGUIs)  # allow processing of user events in between
+
+    @traceStartup
     def provideDocks(self) -> None:
         """Create docks and positions them as defined by :attr:`~esibd.core.PluginManager.pluginType`."""
         if not hasattr(self, 'topDock'):  # else reuse old
@@ -493,7 +570,7 @@ class PluginManager:  # noqa: PLR0904
         self.DeviceManager.provideDock()
         self.Settings.provideDock()
         self.Console.provideDock()
-        self.Browser.provideDock()
+        self.Browser.provideDock()  # only adds placeholder dock that defines the position of display plugins, see Browser.deferGUI
         pluginTypeOrder = [PLUGINTYPE.DEVICEMGR, PLUGINTYPE.CONTROL, PLUGINTYPE.CONSOLE, PLUGINTYPE.CHANNELMANAGER,
                             PLUGINTYPE.INPUTDEVICE, PLUGINTYPE.OUTPUTDEVICE, PLUGINTYPE.SCAN]
         for plugin in sorted((plugin for plugin in self.plugins if plugin.pluginType in pluginTypeOrder),
@@ -508,6 +585,7 @@ class PluginManager:  # noqa: PLR0904
                 self.plugins.pop(self.plugins.index(plugin))  # avoid any further undefined interaction
             self.app.splashScreen.raise_()  # some operations (likely tabifyDockWidget) will cause the main window to get on top of the splash screen
 
+    @traceStartup
     def finalizeInit(self) -> None:
         """Finalize initialization after all other plugins have been initialized."""
         removePlugins: 'list[Plugin]' = []
@@ -523,6 +601,7 @@ class PluginManager:  # noqa: PLR0904
         for plugin in removePlugins:
             self.plugins.pop(self.plugins.index(plugin))  # avoid any further undefined interaction
 
+    @traceStartup
     def afterFinalizeInit(self) -> None:
         """Finalize initialization after all other plugins have been initialized."""
         removePlugins: 'list[Plugin]' = []
@@ -769,6 +848,7 @@ class PluginManager:  # noqa: PLR0904
             except Exception:  # pylint: disable = broad-except  # we have no control about the exception a plugin can possibly throw  # noqa: BLE001
                 # No unpredictable exception in a single plugin should break the whole application
                 self.logger.print(f'Could not close plugin {name} {version}: {traceback.format_exc()}', flag=PRINT.ERROR)
+        self.analysisPool.close()
         self.logger.close()
 
     def finalizeUiState(self) -> None:
@@ -985,6 +1065,12 @@ class Logger(QObject):
 
     printFromThreadSignal = pyqtSignal(str, str, PRINT)
     maxErrorCount = 10
+    maxLogSize = 5 * 1024 * 1024
+    """The log file is rotated once it exceeds this size in bytes. The previous log is kept with suffix .1."""
+    maxBatchSize = 1000
+    """Maximum number of messages written to the log file at once."""
+    statusInterval = 100
+    """Minimum interval between status bar updates in ms."""
 
     def __init__(self, pluginManager: PluginManager) -> None:
         """Initialize a logger.
@@ -997,17 +1083,21 @@ class Logger(QObject):
         self.active = False
         self.testLogFileActive = False
         self.lock = TimeoutLock(lockParent=self)
-        self.purgeTo = 10000
-        self.purgeLimit = 30000
         self.lastCallTime = None
         self.logFile: 'TextIO | None' = None
         self.testLogFile: 'TextIO | None' = None
         self.logFilePath: 'Path | None' = None
         self.testLogFilePath: 'Path | None' = None
         self.errorCount = 0
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.purge)
-        self.timer.setInterval(3600000)  # every 1 hour
+        self.logLevel = cast('int', getLogLevel())
+        self.logLevelTime = time.monotonic()
+        self.messageQueue: queue.Queue[str | None] = queue.Queue()
+        self.writerThread: 'Thread | None' = None
+        self.statusMessage: 'tuple[str, PRINT] | None' = None  # latest message that has not yet been shown in the status bar
+        self.statusTimer = QTimer()
+        self.statusTimer.setSingleShot(True)
+        self.statusTimer.setInterval(self.statusInterval)
+        self.statusTimer.timeout.connect(self.updateStatusBar)
         self.printFromThreadSignal.connect(self.print)
         self.backLog = []  # stores messages to be displayed later if console is not initialized
         self.open()
@@ -1021,7 +1111,9 @@ class Logger(QObject):
             sys.stderr = sys.stdout = self  # redirect all calls to stdout and stderr to the write function of our logger
             self.log = self.logFilePath.open('a', encoding='utf-8-sig')  # pylint: disable=consider-using-with  # keep file open instead of reopening for every new line
             self.active = True
-            self.timer.start()
+            self.writerThread = Thread(target=self.runWriter, name='Logger writerThread')
+            self.writerThread.daemon = True
+            self.writerThread.start()
 
     def openLog(self) -> None:
         """Open the log file in an external program."""
@@ -1053,6 +1145,7 @@ class Logger(QObject):
         self.pluginManager.Explorer.goToCurrentSession()
         self.pluginManager.Explorer.raiseDock(showPlugin=True)
         self.testLogFileActive = False
+        self.waitForWriter()  # make sure all messages have been written before closing
         self.testLogFile.close()
         seconds = int((datetime.now() - self.testStartTime).total_seconds())
         with self.testLogFilePath.open('r', encoding='utf-8-sig') as original:
@@ -1104,31 +1197,88 @@ Generated files: {len(list(self.testLogFilePath.parent.glob('*')))}
     def writeToLogAndTerminal(self, message: str) -> None:
         """Write to log files only. Save to use without creating stdout recursion.
 
+        Messages are queued and written by the writerThread. This does not block the calling thread.
+
         :param message: The message.
         :type message: str
         """
+        self.messageQueue.put(message)
+
+    def runWriter(self) -> None:
+        """Write queued messages to terminal and log files in batches. Runs in writerThread until None is queued."""
+        running = True
+        while running:
+            messages = [self.messageQueue.get()]  # wait for next message
+            while len(messages) < self.maxBatchSize:  # collect all other messages that are already waiting
+                try:
+                    messages.append(self.messageQueue.get_nowait())
+                except queue.Empty:
+                    break
+            if None in messages:  # stop after writing all messages that have been queued before
+                running = False
+            text = ''.join(message for message in messages if message is not None)
+            try:
+                if text:
+                    self.writeBatch(text)
+            except (OSError, ValueError) as e:  # ValueError if writing to closed file
+                if self.terminalErr:
+                    self.terminalErr.write(f'Could not write to log file: {e}\n')
+            finally:
+                for _ in messages:
+                    self.messageQueue.task_done()
+
+    def writeBatch(self, text: str) -> None:
+        """Write a batch of messages to terminal and log files and rotate the log file if needed. Only call from writerThread.
+
+        :param text: The messages.
+        :type text: str
+        """
         with self.lock.acquire_timeout(1) as lock_acquired:
             if self.terminalOut:  # after packaging with pyinstaller the program will not be connected to a terminal
-                self.terminalOut.write(message)  # write to original stdout
+                self.terminalOut.write(text)  # write to original stdout
             if lock_acquired:
-                self.log.write(message)  # write to log file
+                self.log.write(text)  # write to log file
                 self.log.flush()
+                if self.log.tell() > self.maxLogSize:
+                    self.rotate()
             if self.testLogFile and self.testLogFileActive:
-                self.testLogFile.write(message)  # write to test log file
+                self.testLogFile.write(text)  # write to test log file
                 self.testLogFile.flush()
 
-    def purge(self) -> None:
-        """Purges the log file to keep it below purgeLimit."""
-        # ca. 12 ms, only call once per hour. lock makes sure there is not race conditions with open reference
+    def rotate(self) -> None:
+        """Rename the current log file and continue logging in a new file. Only call from writerThread.
+
+        If the file cannot be renamed (e.g. while it is opened by another program) logging continues in the current file and rotation is tried again after the next write.
+        """
         assert self.logFilePath
-        with self.lock.acquire_timeout(1) as lock_acquired:
-            if lock_acquired:
-                with self.logFilePath.open('r', encoding=UTF8) as original:
-                    lines = original.readlines()
-                if len(lines) > self.purgeLimit:
-                    with self.logFilePath.open('w', encoding='utf-8-sig') as purged:
-                        for line in lines[-self.purgeTo:]:
-                            purged.write(line)
+        self.log.close()
+        try:
+            self.logFilePath.replace(self.logFilePath.with_name(f'{self.logFilePath.name}.1'))  # overwrites previous backup
+        finally:  # reopen even if renaming failed, otherwise all following messages would be lost
+            self.log = self.logFilePath.open('a', encoding='utf-8-sig')  # pylint: disable=consider-using-with  # keep file open instead of reopening for every new line
+
+    def enabled(self, flag: PRINT) -> bool:
+        """Indicate if messages with the given flag will be logged at the current log level.
+
+        Use to skip formatting of expensive messages, e.g. `if self.pluginManager.logger.enabled(PRINT.TRACE):`.
+
+        :param flag: The message flag.
+        :type flag: :class:`~esibd.const.PRINT`
+        :return: True if messages with this flag are logged.
+        :rtype: bool
+        """
+        if time.monotonic() - self.logLevelTime > 1:  # avoid reading setting for every message
+            self.logLevel = cast('int', getLogLevel())
+            self.logLevelTime = time.monotonic()
+        match flag:
+            case PRINT.DEBUG:
+                return self.logLevel >= 1
+            case PRINT.VERBOSE:
+                return self.logLevel >= 2  # noqa: PLR2004
+            case PRINT.TRACE:
+                return self.logLevel >= 3  # noqa: PLR2004
+            case _:
+                return True
 
     def print(self, message: str, sender: str = f'{PROGRAM_NAME} {PROGRAM_VERSION}', flag: PRINT = PRINT.MESSAGE) -> None:  # only used for program messages  # noqa: C901, PLR0912
         """Augments messages and redirects to log file, statusbar, and console.
@@ -1140,11 +1290,13 @@ Generated files: {len(list(self.testLogFilePath.parent.glob('*')))}
         :param flag: Signals the status of the message, defaults to :attr:`~esibd.const.PRINT.MESSAGE`
         :type flag: :class:`~esibd.const.PRINT`, optional
         """
+        if not self.enabled(flag):
+            return  # exit before any formatting or signaling
         if current_thread() is not main_thread():
             # redirect to main thread if needed to avoid changing GUI from parallel thread.
             self.printFromThreadSignal.emit(message, sender, flag)
             return
-        logLevel = cast('int', getLogLevel())
+        logLevel = self.logLevel
         match flag:
             case PRINT.EXPLORER:
                 flagString = '❖ '  # noqa: RUF001
@@ -1157,27 +1309,23 @@ Generated files: {len(list(self.testLogFilePath.parent.glob('*')))}
                 sender = ''  # obvious due to unicode symbol
             case PRINT.DEBUG:
                 flagString = '🪲'
-                if logLevel < 1:
-                    return
             case PRINT.VERBOSE:
                 flagString = '🆅'
-                if logLevel < 2:  # noqa: PLR2004
-                    return
             case PRINT.TRACE:
                 flagString = '🆃'
-                if logLevel < 3:  # noqa: PLR2004
-                    return
             case _:  # PRINT.MESSAGE
                 flagString = 'ℹ️'  # noqa: RUF001
+        now = datetime.now()
+        timeString = now.strftime('%Y-%m-%d %H:%M:%S')
         timerString = ''
         if logLevel > 0:
-            ms = ((datetime.now() - self.lastCallTime).total_seconds() * 1000) if self.lastCallTime is not None else 0
+            ms = ((now - self.lastCallTime).total_seconds() * 1000) if self.lastCallTime is not None else 0
             timerString = f'🕐 {ms:5.0f} ms '
-            self.lastCallTime = datetime.now()
+            self.lastCallTime = now
         first_line = message.split('\n', maxsplit=1)[0]
         sender = sender + ':' if sender else ''  # no : needed if no explicit sender
-        message_status = f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} {sender} {first_line}"
-        message = f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} {timerString}{flagString} {sender} {message}"
+        message_status = f'{timeString} {sender} {first_line}'
+        message = f'{timeString} {timerString}{flagString} {sender} {message}'
         if flag == PRINT.CONSOLE:
             self.writeToLogAndTerminal(f'{message}\n')
         elif self.active:
@@ -1185,24 +1333,39 @@ Generated files: {len(list(self.testLogFilePath.parent.glob('*')))}
         else:
             print(message)  # only to stdout if not active  # noqa: T201
             self.write(f'\n{message}')  # call explicitly
-        statusBar = cast('IconStatusBar', self.pluginManager.mainWindow.statusBar())
-        if statusBar:
-            statusBar.showMessage(message_status)
-            statusBar.setFlag(flag)
+        self.statusMessage = (message_status, flag)
+        if not self.statusTimer.isActive():  # show first message immediately and limit rate of following updates
+            self.updateStatusBar()
+            self.statusTimer.start()
+
+    def updateStatusBar(self) -> None:
+        """Show latest message in status bar."""
+        if self.statusMessage:
+            statusBar = cast('IconStatusBar', self.pluginManager.mainWindow.statusBar())
+            if statusBar:
+                statusBar.showMessage(self.statusMessage[0])
+                statusBar.setFlag(self.statusMessage[1])
+            self.statusMessage = None
 
     def flush(self) -> None:
-        """Flushes content to log file."""
-        if self.active:
-            self.log.flush()
+        """Flushes content to log file. Nothing to do as the writerThread flushes after every batch."""
+
+    def waitForWriter(self) -> None:
+        """Wait until all queued messages have been written."""
+        if self.active and self.writerThread and self.writerThread.is_alive() and current_thread() is not self.writerThread:
+            self.messageQueue.join()
 
     def close(self) -> None:
         """Disables logging and restores stdout and stderr."""
         if self.active:
-            self.log.close()
-            self.active = False
             sys.stdout = self.terminalOut  # restore previous
             sys.stderr = self.terminalErr  # restore previous
-        self.timer.stop()
+            self.messageQueue.put(None)  # write all remaining messages and stop writerThread
+            if self.writerThread:
+                self.writerThread.join(timeout=5)
+            self.active = False
+            self.log.close()
+        self.statusTimer.stop()
 
 
 class CloseDialog(QDialog):
@@ -1331,6 +1494,198 @@ class DynamicNp:
         return self.data[:self.size][::n]  # returns everything
 
 
+@dataclass
+class StepStatistics:
+    """Statistics of all values recorded during a single scan step."""
+
+    mean: float
+    std: float
+    count: int
+    min: float
+    max: float
+
+    @classmethod
+    def fromValues(cls, values: np.ndarray) -> 'StepStatistics':
+        """Aggregate values. NaN values (e.g. recorded while waiting to stabilize) are ignored.
+
+        :param values: Values recorded during the step.
+        :type values: np.ndarray
+        :return: Statistics of the values. Mean, std, min, and max are NaN if no valid value is available.
+        :rtype: StepStatistics
+        """
+        values = values[np.isfinite(values)]
+        if values.shape[0] == 0:
+            return cls(mean=np.nan, std=np.nan, count=0, min=np.nan, max=np.nan)
+        return cls(mean=float(values.mean()), std=float(values.std()), count=values.shape[0], min=float(values.min()), max=float(values.max()))
+
+    @classmethod
+    def fromRows(cls, values: np.ndarray) -> 'list[StepStatistics]':
+        """Aggregate each row of a 2D array at once, e.g. the values of all channels of a device during the same step. NaN values are ignored.
+
+        :param values: Values recorded during the step, one row per channel.
+        :type values: np.ndarray
+        :return: Statistics of each row. Mean, std, min, and max are NaN for rows without valid values.
+        :rtype: list[StepStatistics]
+        """
+        finite = np.isfinite(values)
+        count = finite.sum(axis=1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(finite, values, 0).sum(axis=1) / count
+            std = np.sqrt(np.where(finite, (values - mean[:, None]) ** 2, 0).sum(axis=1) / count)
+        empty = count == 0
+        minimum = np.where(empty, np.nan, np.where(finite, values, np.inf).min(axis=1, initial=np.inf))
+        maximum = np.where(empty, np.nan, np.where(finite, values, -np.inf).max(axis=1, initial=-np.inf))
+        return [cls(mean=float(mean[i]), std=float(std[i]), count=int(count[i]), min=float(minimum[i]), max=float(maximum[i])) for i in range(values.shape[0])]
+
+
+class ChangeTransaction:
+    """Collects change events of :class:`Parameters<esibd.core.Parameter>` and dispatches them when the outermost transaction ends.
+
+    Use for bulk updates to avoid redundant calls of events and extraEvents, e.g. ``with Parameter.changeTransaction:``.
+    Identical events of different Parameters are dispatched once. Expensive updates that are triggered by many events, e.g.
+    :meth:`~esibd.plugins.DeviceManager.globalUpdate`, can be deferred using :meth:`~esibd.core.ChangeTransaction.defer`
+    and are called once after all events of a round.
+    Parameters are dispatched in dependency order: sources of relay channels and channels referenced in equations before the Parameters
+    that depend on them. Parameters in circular dependencies are dispatched in the order of their first change.
+    Changes caused by dispatched events are collected and dispatched in following rounds.
+    An exception raised by one event is reported and does not prevent dispatching the remaining events.
+    Only changes from the main thread are collected, changes from other threads are dispatched directly as before.
+    """
+
+    maxRounds = 10
+    """Maximum number of dispatch rounds, prevents endless loops caused by circular dependencies."""
+
+    def __init__(self) -> None:
+        """Initialize a ChangeTransaction."""
+        self.depth = 0
+        self.pending: dict[int, Parameter] = {}  # id: Parameter, keeps first occurrence order
+        self.deferred: dict[tuple, tuple[Callable, dict[str, Any]]] = {}  # key: callback, keyword arguments
+        self.dispatching: 'tuple | None' = None  # key of deferred call that is currently dispatched
+
+    def __enter__(self) -> 'ChangeTransaction':
+        """Start or nest a transaction.
+
+        :return: The transaction.
+        :rtype: ChangeTransaction
+        """
+        self.depth += 1
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """End a transaction and dispatch events if it is the outermost one.
+
+        :param args: Exception information, events are dispatched even after exceptions as values have already changed.
+        :type args: object
+        """
+        self.depth -= 1
+        if self.depth == 0:
+            self.commit()
+
+    @property
+    def active(self) -> bool:
+        """Indicate if changes should be collected."""
+        return self.depth > 0 and current_thread() is main_thread()
+
+    def add(self, parameter: 'Parameter') -> None:
+        """Collect a changed Parameter. Multiple changes of the same Parameter are dispatched once.
+
+        :param parameter: The changed Parameter.
+        :type parameter: Parameter
+        """
+        self.pending.setdefault(id(parameter), parameter)
+
+    def defer(self, callback: Callable, **kwargs: Any) -> bool:  # noqa: ANN401
+        """Defer a call until all events of the current round have been dispatched. Identical calls are executed once.
+
+        :param callback: Bound method of a Plugin.
+        :type callback: Callable
+        :param kwargs: Keyword arguments for callback. Must be hashable.
+        :type kwargs: Any
+        :return: True if the call has been deferred. False if the caller has to execute it now, as there is no active transaction or the call is being dispatched.
+        :rtype: bool
+        """
+        if not self.active:
+            return False
+        key = (callback, *sorted(kwargs.items(), key=lambda item: item[0]))
+        if key == self.dispatching:
+            return False
+        self.deferred.setdefault(key, (callback, kwargs))
+        return True
+
+    def sortByDependencies(self, parameters: 'list[Parameter]') -> 'list[Parameter]':
+        """Sort Parameters such that each Parameter is dispatched after the Parameters it depends on.
+
+        A Parameter depends on another Parameter if its channel is updated by an extraEvent of the other Parameter (e.g. relay channels)
+        or if the equation of its channel references the channel of the other Parameter.
+
+        :param parameters: Parameters in order of their first change.
+        :type parameters: list[Parameter]
+        :return: Sorted Parameters.
+        :rtype: list[Parameter]
+        """
+        byChannel: dict[int, list[Parameter]] = {}
+        for parameter in parameters:
+            if isinstance(parameter.parameterParent, Channel):
+                byChannel.setdefault(id(parameter.parameterParent), []).append(parameter)
+        dependencies: dict[int, set[int]] = {id(parameter): set() for parameter in parameters}
+        for source in parameters:
+            for event in source.extraEvents:
+                for parameter in byChannel.get(id(getattr(event, '__self__', None)), []):
+                    if parameter is not source:
+                        dependencies[id(parameter)].add(id(source))
+        sources = [parameter for parameter in parameters if isinstance(parameter.parameterParent, Channel)]
+        for parameter in sources:
+            equation = getattr(parameter.parameterParent, 'equation', '')
+            if equation:
+                for source in sources:
+                    if source.parameterParent is not parameter.parameterParent and cast('Channel', source.parameterParent).name in equation:
+                        dependencies[id(parameter)].add(id(source))
+        sortedParameters: list[Parameter] = []
+        dispatched: set[int] = set()
+        remaining = parameters
+        while remaining:
+            ready = [parameter for parameter in remaining if dependencies[id(parameter)] <= dispatched] or remaining[:1]  # break circular dependencies
+            sortedParameters.extend(ready)
+            dispatched.update(id(parameter) for parameter in ready)
+            remaining = [parameter for parameter in remaining if id(parameter) not in dispatched]
+        return sortedParameters
+
+    def commit(self) -> None:
+        """Dispatch events of all collected Parameters and deferred calls."""
+        self.depth += 1  # collect changes caused by dispatched events for next round
+        try:
+            for _ in range(self.maxRounds):
+                if not self.pending and not self.deferred:
+                    break
+                parameters = self.sortByDependencies(list(self.pending.values()))
+                self.pending = {}
+                events: dict[Callable, Parameter] = {}  # identical events are dispatched once
+                for parameter in parameters:
+                    for event in parameter.getChangedEvents():
+                        events.setdefault(event, parameter)
+                for event, parameter in events.items():
+                    try:
+                        event()
+                    except Exception:  # noqa: BLE001
+                        parameter.print(f'Event of {parameter.fullName} failed: {traceback.format_exc()}', flag=PRINT.ERROR)
+                deferred, self.deferred = self.deferred, {}
+                for key, (callback, kwargs) in deferred.items():
+                    self.dispatching = key
+                    try:
+                        callback(**kwargs)
+                    except Exception:  # noqa: BLE001
+                        cast('Plugin', callback.__self__).print(f'Deferred call of {callback.__name__} failed: {traceback.format_exc()}', flag=PRINT.ERROR)
+                    finally:
+                        self.dispatching = None
+            if self.pending or self.deferred:
+                reporter = next(iter(self.pending.values())) if self.pending else cast('Plugin', next(iter(self.deferred.values()))[0].__self__)
+                reporter.print(f'Skipping {len(self.pending)} events and {len(self.deferred)} deferred calls after {self.maxRounds} rounds. '
+                               'Check for circular dependencies.', flag=PRINT.WARNING)
+                self.pending, self.deferred = {}, {}
+        finally:
+            self.depth -= 1
+
+
 class Parameter:  # noqa: PLR0904
     """Parameters are used by Settings and Channels.
 
@@ -1434,6 +1789,11 @@ class Parameter:  # noqa: PLR0904
     """Will contain path of Setting in HDF5 file if applicable."""
     tree: 'QTreeWidget | None'
     """None, unless the parameter is used for settings."""
+    virtual: bool
+    """Indicates that the parameter is displayed in a :class:`~esibd.core.ChannelTreeView`.
+    Virtual parameters store their value without creating a widget. Editors are only created on demand by the view."""
+    visible: bool
+    """Visibility of virtual parameters. Other parameters use the visibility of their widget."""
     itemWidget: 'QTreeWidgetItem | None'
     """Widget used to display the value of the parameter. None if parameter is part of a channel. Defined if it is part of a Setting."""
     extraEvents: list[Callable]
@@ -1444,6 +1804,8 @@ class Parameter:  # noqa: PLR0904
     """Indicates if logarithmic controls and scales should be used."""
     clearingPlotCurve = False
     """Flag to prevent multiple clearing attempts at the same time."""
+    changeTransaction = ChangeTransaction()
+    """Shared :class:`~esibd.core.ChangeTransaction`. Events of changes within ``with Parameter.changeTransaction:`` are dispatched once at the end."""
 
     class SignalCommunicate(QObject):
         """Bundle pyqtSignals."""
@@ -1517,6 +1879,9 @@ class Parameter:  # noqa: PLR0904
         self._items = items.split(',') if items else []
         self.fixedItems = fixedItems
         self.tree = tree
+        self.virtual = isinstance(tree, ChannelTreeView)
+        self.visible = True
+        self._value = None
         self.itemWidget = itemWidget
         self.widget = widget
         self.extraEvents = []
@@ -1551,6 +1916,8 @@ class Parameter:  # noqa: PLR0904
     @property
     def value(self) -> 'ParameterType | None':  # noqa: C901
         """Return value in correct format, based on parameterType."""
+        if self.virtual:
+            return self.getVirtualValue()
         # use widget even for internal settings, should always be synchronized to allow access via both attribute and qSet
         value = None
         if self.parameterType == PARAMETERTYPE.COMBO:
@@ -1583,6 +1950,9 @@ class Parameter:  # noqa: PLR0904
             qSet.setValue(self.fullName, value)
             if self._items is not None:
                 qSet.setValue(self.fullName + self.ITEMS, ','.join(self.items))
+        if self.virtual:
+            self.setVirtualValue(value)
+            return
         if self.parameterType == PARAMETERTYPE.BOOL:
             value = value if isinstance(value, (bool, np.bool_)) else value in {'True', 'true'}  # accepts strings (from ini file or qSet) and bools
             if self.check:
@@ -1620,6 +1990,63 @@ class Parameter:  # noqa: PLR0904
             if not self.indicator:
                 self.changedEvent()  # emit here as it is not emitted by the label
 
+    def getVirtualValue(self) -> 'ParameterType | None':
+        """Return the stored value of a virtual Parameter in the same format as provided by the corresponding widget."""
+        if self._value is None:
+            return None
+        if self.parameterType == PARAMETERTYPE.INTCOMBO:
+            return int(cast('str', self._value))
+        if self.parameterType == PARAMETERTYPE.FLOATCOMBO:
+            return float(cast('str', self._value))
+        if self.parameterType == PARAMETERTYPE.PATH:
+            return Path(cast('str', self._value))
+        return self._value
+
+    def setVirtualValue(self, value: 'ParameterType | None') -> None:  # noqa: C901, PLR0912
+        """Store the value of a virtual Parameter and trigger the same events the corresponding widget would trigger.
+
+        :param value: The new value.
+        :type value: ParameterType | None
+        """
+        if self.parameterType == PARAMETERTYPE.BOOL:
+            value = bool(value) if isinstance(value, (bool, np.bool_)) else value in {'True', 'true'}
+        elif self.parameterType in {PARAMETERTYPE.INT, PARAMETERTYPE.FLOAT, PARAMETERTYPE.EXP}:
+            value = float(cast('float | str', value))
+            if not np.isnan(value):  # spin boxes coerce values to their limits
+                if self.min is not None:
+                    value = max(value, self.min)
+                if self.max is not None:
+                    value = min(value, self.max)
+                if self.parameterType == PARAMETERTYPE.INT:
+                    value = int(value)
+        elif self.parameterType == PARAMETERTYPE.COLOR:
+            value = QColor(cast('str', value)).name()
+        elif self.parameterType in {PARAMETERTYPE.COMBO, PARAMETERTYPE.INTCOMBO, PARAMETERTYPE.FLOATCOMBO}:
+            items = self.items
+            text = str(value)
+            if value is None:
+                text = items[0] if items else ''
+            elif text not in items and self.parameterType is PARAMETERTYPE.FLOATCOMBO and str(int(float(cast('str | float', value)))) in items:
+                text = str(int(float(cast('str | float', value))))  # try to find int version if float version not found. e.g. 1 instead of 1.0
+            elif text not in items:
+                self.print(f'Value {value} not found for {self.fullName}. Defaulting to {items[0] if items else ""}.', flag=PRINT.WARNING)
+                text = items[0] if items else ''
+            value = text
+        else:  # PARAMETERTYPE.TEXT, PARAMETERTYPE.LABEL, PARAMETERTYPE.PATH
+            value = str(value)
+        changed = not (self._value == value or (isinstance(value, float) and isinstance(self._value, float) and np.isnan(value) and np.isnan(self._value)))
+        self._value = value
+        if isinstance(self.tree, ChannelTreeView):
+            self.tree.updateParameter(self)
+        if self.parameterType in {PARAMETERTYPE.LABEL, PARAMETERTYPE.PATH}:
+            if not self.indicator:
+                self.changedEvent()  # emit here as it is not emitted by the label
+        elif changed and self.parameterType != PARAMETERTYPE.TEXT:  # text events are only triggered by the user
+            if not self.instantUpdate and self.parameterType in {PARAMETERTYPE.INT, PARAMETERTYPE.FLOAT, PARAMETERTYPE.EXP}:
+                self.setValueChanged()
+            else:
+                self.changedEvent()
+
     def setValueWithoutEvents(self, value: 'ParameterType | None') -> None:
         """Set the parameter value without triggering valueChanged Events.
 
@@ -1761,6 +2188,8 @@ class Parameter:  # noqa: PLR0904
     @property
     def items(self) -> list[str]:
         """List of items for parameters with a combobox."""
+        if self.virtual:
+            return [item.strip(' ') for item in self._items]
         if self.parameterType in {PARAMETERTYPE.COMBO, PARAMETERTYPE.INTCOMBO, PARAMETERTYPE.FLOATCOMBO}:
             return [self.combo.itemText(i) for i in range(self.combo.count())]
         return []
@@ -1785,16 +2214,31 @@ class Parameter:  # noqa: PLR0904
             # ! adding a print statement to the terminal, console plugin, and statusbar at that rate might make the application unresponsive.
             # ! only uncomment for specific tests.
             # self.print(f'ChangedEvent for {self.fullName}.', flag=PRINT.VERBOSE)  # noqa: ERA001
-            for event in self.extraEvents:
-                # extraEvents should be triggered even if value is NaN, e.g. to update relay channels to NaN
-                if event:
-                    event()
-            if self.event:
-                if isinstance(self.value, float) and np.isnan(self.value):
-                    # do not trigger events after changing value to NaN
-                    self._valueChanged = False
-                    return
-                self.event()
+            if self.changeTransaction.active:
+                self.changeTransaction.add(self)  # dispatched once when transaction ends
+            else:
+                self.dispatchChangedEvent()
+
+    def dispatchChangedEvent(self) -> None:
+        """Trigger extraEvents and event after a change."""
+        for event in self.getChangedEvents():
+            event()
+
+    def getChangedEvents(self) -> list[Callable]:
+        """Return extraEvents and event that have to be triggered after a change.
+
+        :return: The events in order of execution.
+        :rtype: list[Callable]
+        """
+        # extraEvents should be triggered even if value is NaN, e.g. to update relay channels to NaN
+        events = [event for event in self.extraEvents if event]
+        if self.event:
+            if isinstance(self.value, float) and np.isnan(self.value):
+                # do not trigger events after changing value to NaN
+                self._valueChanged = False
+            else:
+                events.append(self.event)
+        return events
 
     def applyChangedEvent(self) -> None:  # noqa: C901
         """Assign events to the corresponding controls.
@@ -1866,7 +2310,10 @@ class Parameter:  # noqa: PLR0904
         """Create UI widget depending on :attr:`~esibd.core.Parameter.parameterType`.
 
         Links dedicated :attr:`~esibd.core.Parameter.widget` if provided.
+        Virtual parameters do not use widgets.
         """
+        if self.virtual:
+            return
         if self.parameterType in {PARAMETERTYPE.COMBO, PARAMETERTYPE.INTCOMBO, PARAMETERTYPE.FLOATCOMBO}:
             self.combo = CompactComboBox() if self.widget is None else cast('CompactComboBox', self.widget)
             self.combo.setMaximumWidth(100)
@@ -1996,8 +2443,10 @@ class Parameter:  # noqa: PLR0904
                 self.label.setFont(font)
 
     def getWidget(self) -> 'ParameterWidgetType | None':
-        """Return the widget used to display the Parameter value in the user interface."""
+        """Return the widget used to display the Parameter value in the user interface. Virtual parameters have no widget."""
         widget = None
+        if self.virtual:
+            return widget
         if self.parameterType in {PARAMETERTYPE.COMBO, PARAMETERTYPE.INTCOMBO, PARAMETERTYPE.FLOATCOMBO}:
             widget = self.combo
         elif self.parameterType == PARAMETERTYPE.TEXT:
@@ -2031,6 +2480,11 @@ class Parameter:  # noqa: PLR0904
         :param visible: Visible or hidden.
         :type visible: bool
         """
+        if self.virtual:
+            if visible != self.visible:
+                self.visible = visible
+                cast('ChannelTreeView', self.tree).updateParameter(self)
+            return
         widget = self.getWidget()
         if widget:
             widget.setVisible(visible)
@@ -2309,6 +2763,8 @@ class RelayChannel:
     sourceParameter: 'Parameter | None' = None
     recordingData: 'np.ndarray | DynamicNp | None' = None
     recordingBackground: 'np.ndarray | DynamicNp | None' = None
+    recordingDataStd: 'np.ndarray | DynamicNp | None' = None
+    """Standard deviation of the values averaged for each entry in recordingData."""
     channelParent: 'Device'
     unit: 'str'
 
@@ -2316,6 +2772,10 @@ class RelayChannel:
         """SourceChannel.getRecordingData() if available. Default provided."""
         return self.recordingData.get() if isinstance(self.recordingData, DynamicNp) else self.recordingData
 
+    def getRecordingDataStd(self) -> 'np.ndarray | None':
+        """Return the standard deviation corresponding to recordingData if available."""
+        return self.recordingDataStd.get() if isinstance(self.recordingDataStd, DynamicNp) else self.recordingDataStd
+
     def getDevice(self) -> 'ChannelManager | Device | Scan':
         """SourceChannel.getDevice() if available. Default provided."""
         return self.sourceChannel.getDevice() if self.sourceChannel else self.channelParent
@@ -2348,6 +2808,60 @@ class RelayChannel:
         """
         return self.sourceChannel.getValues(length=length, index_min=index_min, index_max=index_max, n=n, subtractBackground=subtractBackground) if self.sourceChannel else None
 
+    def getStepValues(self, t_min: float, t_max: 'float | None' = None, subtractBackground: bool = False,
+                      indexWindows: 'dict[Device, tuple[int, int]] | None' = None) -> 'np.ndarray | None':
+        """Return all values of the sourceChannel that have been recorded within a time window.
+
+        Samples are selected based on the time axis of the source device rather than by number of samples.
+        This makes the result independent of the acquisition interval and excludes samples recorded before the step has settled.
+
+        :param t_min: Start of the time window in s, typically the time at which the step has settled.
+        :type t_min: float
+        :param t_max: End of the time window in s, defaults to now.
+        :type t_max: float, optional
+        :param subtractBackground: Indicates if the background should be subtracted, defaults to False
+        :type subtractBackground: bool, optional
+        :param indexWindows: Index windows by device. Pass the same dict for all channels of a step to search the time axis of each device only once, defaults to None
+        :type indexWindows: dict[Device, tuple[int, int]], optional
+        :return: Values within the time window, empty if no sample has been recorded, or None if there is no source device with a time axis.
+        :rtype: np.ndarray | None
+        """
+        if not self.sourceChannel:
+            return None
+        device = self.sourceChannel.getDevice()
+        if not isinstance(device, self.sourceChannel.pluginManager.Device):
+            return None
+        if indexWindows is not None and device in indexWindows:
+            index_min, index_max = indexWindows[device]
+        else:
+            time_axis = device.time.get()
+            # time axis is sorted -> binary search instead of comparing every time stamp
+            index_min = int(np.searchsorted(time_axis, t_min, side='left'))
+            index_max = int(np.searchsorted(time_axis, time.time() if t_max is None else t_max, side='right'))
+            if indexWindows is not None:
+                indexWindows[device] = index_min, index_max
+        if index_max > index_min:
+            return self.getValues(index_min=index_min, index_max=index_max, subtractBackground=subtractBackground)
+        return np.zeros(0)
+
+    def getStepStatistics(self, t_min: float, t_max: 'float | None' = None, subtractBackground: bool = False,
+                          indexWindows: 'dict[Device, tuple[int, int]] | None' = None) -> 'StepStatistics | None':
+        """Aggregate all values of the sourceChannel that have been recorded within a time window. See :meth:`~esibd.core.RelayChannel.getStepValues`.
+
+        :param t_min: Start of the time window in s, typically the time at which the step has settled.
+        :type t_min: float
+        :param t_max: End of the time window in s, defaults to now.
+        :type t_max: float, optional
+        :param subtractBackground: Indicates if the background should be subtracted, defaults to False
+        :type subtractBackground: bool, optional
+        :param indexWindows: Index windows by device. Pass the same dict for all channels of a step to search the time axis of each device only once, defaults to None
+        :type indexWindows: dict[Device, tuple[int, int]], optional
+        :return: Statistics of values within the time window with count 0 if no sample has been recorded, or None if there is no source device with a time axis.
+        :rtype: StepStatistics | None
+        """
+        values = self.getStepValues(t_min=t_min, t_max=t_max, subtractBackground=subtractBackground, indexWindows=indexWindows)
+        return StepStatistics.fromValues(values) if values is not None else None
+
     @property
     def value(self) -> int | float:  # | None:
         """SourceChannel.value if available. Default provided."""
@@ -2551,8 +3065,12 @@ class Channel(QTreeWidgetItem):  # noqa: PLR0904
     """The Device or Scan containing this channel."""
     print: Callable
     """Reference to :meth:`~esibd.plugins.Plugin.print`."""
-    tree: 'QTreeWidget | None'
+    tree: 'QTreeWidget | ChannelTreeView | None'
     """TreeWidget containing the channel widgets."""
+    virtual: bool
+    """Indicates that the channel is displayed in a :class:`~esibd.core.ChannelTreeView` and does not create widgets for its parameters."""
+    backgroundColor: 'QColor | None' = None
+    """Background color of the channel row, updated by :meth:`~esibd.core.Channel.updateColor`."""
     inout: INOUT = INOUT.NONE
     """Reference to :class:`~esibd.plugins.Device.inout`."""
     plotCurve: 'PlotCurveItem | PlotDataItem | None'
@@ -2602,6 +3120,7 @@ class Channel(QTreeWidgetItem):  # noqa: PLR0904
             if self.channelParent.logY:
                 self.logY = self.channelParent.logY
         self.tree = tree  # may be None for internal default channels
+        self.virtual = isinstance(tree, ChannelTreeView)
         self.plotCurve = None
         self.rowHeight = QLineEdit().sizeHint().height() - 4
         self.signalComm = self.SignalCommunicate()
@@ -2813,7 +3332,7 @@ class Channel(QTreeWidgetItem):  # noqa: PLR0904
             channel[self.MAX] = parameterDict(value=+50, parameterType=PARAMETERTYPE.FLOAT, advanced=True,
                                     event=self.updateMax, attr='max', header='Max       ')
             channel[self.OPTIMIZE] = parameterDict(value=False, parameterType=PARAMETERTYPE.BOOL, advanced=False,
-                                    header='O', toolTip='Selected channels will be optimized using GA.', attr='optimize')
+                                    header='O', toolTip='Selected channels will be optimized using GA or BO.', attr='optimize')
         if self.useBackgrounds:
             channel[self.BACKGROUND] = parameterDict(value=0, parameterType=PARAMETERTYPE.FLOAT, advanced=False,
                                 header='BG      ', attr='background')
@@ -2822,7 +3341,8 @@ class Channel(QTreeWidgetItem):  # noqa: PLR0904
     def getSortedDefaultChannel(self) -> dict[str, dict]:
         """Return default Channel parameters sorted in the order defined by :attr:`~esibd.core.Channel.displayedParameters`."""
         self.setDisplayedParameters()
-        return {k: self.getDefaultChannel()[k] for k in self.displayedParameters}
+        defaultChannel = self.getDefaultChannel()
+        return {k: defaultChannel[k] for k in self.displayedParameters}
 
     def insertDisplayedParameter(self, parameter: str, before: str) -> None:
         """Insert your custom Parameter before an existing Parameter in :attr:`~esibd.core.Channel.displayedParameters`.
@@ -2947,7 +3467,9 @@ class Channel(QTreeWidgetItem):  # noqa: PLR0904
         :param toggle: Toggles display of visible channels, defaults to True
         :type toggle: bool, optional
         """
-        cast('QPushButton', self.getParameterByName(self.COLLAPSE).getWidget()).setIcon(self.channelParent.makeCoreIcon('toggle-expand.png' if self.collapse else 'toggle.png'))
+        collapseWidget = self.getParameterByName(self.COLLAPSE).getWidget()
+        if collapseWidget:
+            cast('QPushButton', collapseWidget).setIcon(self.channelParent.makeCoreIcon('toggle-expand.png' if self.collapse else 'toggle.png'))
         if toggle and not self.channelParent.loading:  # otherwise only update icon
             self.channelParent.toggleAdvanced()
 
@@ -3091,9 +3613,12 @@ class Channel(QTreeWidgetItem):  # noqa: PLR0904
             color = QColor(self.color).darker(150) if self.active else QColor(self.color).darker(200)  # indicate passive channels by darker color
         else:
             color = QColor(self.color) if self.active else QColor(self.color).darker(115)  # indicate passive channels by darker color
+        self.backgroundColor = color
         qb = QBrush(color)
         for i in range(len(self.parameters) + 1):  # use highest index
             self.setBackground(i, qb)  # use correct color even when widgets are hidden
+        if isinstance(self.tree, ChannelTreeView):
+            self.tree.updateChannel(self)
         i = 0
         for parameter in self.parameters:
             if parameter.recorded:
@@ -3153,16 +3678,12 @@ class Channel(QTreeWidgetItem):  # noqa: PLR0904
     def realChanged(self) -> None:
         """Extend as needed. Already linked to real checkbox."""
         if self.ENABLED in self.displayedParameters:
-            enabledWidget = self.getParameterByName(self.ENABLED).getWidget()
-            if enabledWidget:
-                enabledWidget.setVisible(self.real)
-                self.toggleBackgroundVisible()
-                if self.useMonitors:
-                    monitorWidget = self.getParameterByName(self.MONITOR).getWidget()
-                    if monitorWidget:
-                        monitorWidget.setVisible(self.real)
-                if not self.channelParent.loading:
-                    self.pluginManager.DeviceManager.globalUpdate(inout=self.inout)
+            self.getParameterByName(self.ENABLED).setVisible(self.real)
+            self.toggleBackgroundVisible()
+            if self.useMonitors:
+                self.getParameterByName(self.MONITOR).setVisible(self.real)
+            if not self.channelParent.loading:
+                self.pluginManager.DeviceManager.globalUpdate(inout=self.inout)
 
     def enabledChanged(self) -> None:
         """Extend as needed. Already linked to enabled checkbox."""
@@ -3218,7 +3739,10 @@ class Channel(QTreeWidgetItem):  # noqa: PLR0904
         """
         if warn != self.warningState:
             self.warningState = warn
-            monitorWidget = self.getParameterByName(self.MONITOR).getWidget()
+            monitorParameter = self.getParameterByName(self.MONITOR)
+            if monitorParameter.virtual:
+                cast('ChannelTreeView', self.tree).updateParameter(monitorParameter)  # ChannelModel shows warningState as background
+            monitorWidget = monitorParameter.getWidget()
             if monitorWidget:
                 monitorWidget.setStyleSheet(self.warningStyleSheet if warn else self.defaultStyleSheet)
 
@@ -3231,6 +3755,9 @@ class Channel(QTreeWidgetItem):  # noqa: PLR0904
         :param item: Dictionary containing all channel information.
         :type item: dict
         """
+        if self.virtual:
+            self.initVirtualGUI(item)
+            return
         for parameter in self.parameters:
             parameter.applyWidget()
         name_parameter = self.getParameterByName(self.NAME)
@@ -3240,16 +3767,7 @@ class Channel(QTreeWidgetItem):  # noqa: PLR0904
             lineEdit = cast('LineEdit', name_parameter.getWidget())
             for invalid_char in self.invalid_chars:
                 lineEdit.valid_chars = lineEdit.valid_chars.replace(invalid_char, '')
-        for name, default in self.getSortedDefaultChannel().items():
-            # add default value if not found in file. Will be saved to file later.
-            if name in item and name not in self.tempParameters() and default[Parameter.RESTORE]:
-                self.getParameterByName(name).value = item[name]
-            else:
-                self.getParameterByName(name).value = default[self.VALUE]
-                if isinstance(self.channelParent, self.pluginManager.ChannelManager) and name not in self.tempParameters() and default[Parameter.RESTORE] and not len(item) < 2:  # noqa: PLR2004
-                    # len(item) < 2 -> only provided name -> generating default file
-                    self.print(f'Added missing parameter {name} to channel {item[self.NAME]} using default value {default[self.VALUE]}.')
-                    self.channelParent.channelsChanged = True
+        self.loadParameterValues(item)
         if name_parameter.parameterType == PARAMETERTYPE.TEXT:
             name_parameter.line.allowEmptyText = False  # names cannot be empty
         if self.inout != INOUT.NONE and self.EQUATION in self.displayedParameters:
@@ -3289,20 +3807,80 @@ class Channel(QTreeWidgetItem):  # noqa: PLR0904
                 self.updateMax()
         self.scalingChanged()
 
+    def initVirtualGUI(self, item: dict) -> None:
+        """Initialize a Channel that is displayed in a :class:`~esibd.core.ChannelTreeView`.
+
+        Only values are assigned. Painting and editing is handled by the view.
+
+        :param item: Dictionary containing all channel information.
+        :type item: dict
+        """
+        self.loadParameterValues(item)
+        if self.DISPLAY in self.displayedParameters:
+            display = self.getParameterByName(self.DISPLAY)
+            for parameter in self.getRecordedParameters():
+                display.extraContextActions.append(ContextAction(text=f'Toggle display of {parameter.name}', event=parameter.updateDisplay))
+        if self.inout != INOUT.NONE:
+            self.updateColor()
+            self.realChanged()
+        self.scalingChanged()
+
+    def loadParameterValues(self, item: dict) -> None:
+        """Assign values from item and use defaults for parameters that are missing in item.
+
+        :param item: Dictionary containing all channel information.
+        :type item: dict
+        """
+        tempParameters = self.tempParameters()
+        parameters = {parameter.name: parameter for parameter in self.parameters}
+        for name, default in self.getSortedDefaultChannel().items():
+            # add default value if not found in file. Will be saved to file later.
+            if name in item and name not in tempParameters and default[Parameter.RESTORE]:
+                parameters[name].value = item[name]
+            else:
+                parameters[name].value = default[self.VALUE]
+                if isinstance(self.channelParent, self.pluginManager.ChannelManager) and name not in tempParameters and default[Parameter.RESTORE] and not len(item) < 2:  # noqa: PLR2004
+                    # len(item) < 2 -> only provided name -> generating default file
+                    self.print(f'Added missing parameter {name} to channel {item[self.NAME]} using default value {default[self.VALUE]}.')
+                    self.channelParent.channelsChanged = True
+
+    def setHidden(self, hide: bool) -> None:  # pylint: disable = missing-param-doc, missing-type-doc  # noqa: D102
+        if isinstance(self.tree, ChannelTreeView):
+            self.tree.setChannelHidden(self, hide)
+        else:
+            super().setHidden(hide)
+
+    def isHidden(self) -> bool:  # noqa: D102
+        if isinstance(self.tree, ChannelTreeView):
+            return self.tree.isChannelHidden(self)
+        return super().isHidden()
+
     def updateMin(self) -> None:
-        """Apply new minimum to value widget."""
-        spin = self.getParameterByName(self.VALUE).spin
+        """Apply new minimum to value widget. Virtual parameters apply the limit to their value and to editors created later."""
+        valueParameter = self.getParameterByName(self.VALUE)
+        if valueParameter.virtual:
+            valueParameter.min = self.min
+            if valueParameter.value is not None:
+                valueParameter.value = valueParameter.value  # coerce value to new limit like a spin box
+            cast('ChannelTreeView', self.tree).updateParameter(valueParameter)
+        spin = valueParameter.spin
         if spin:
             if isinstance(spin, LabviewSpinBox):
                 spin.setMinimum(int(self.min))
             else:
                 spin.setMinimum(self.min)
-            if not self.channelParent.loading:
-                self.pluginManager.reconnectSource(self.name)  # update limits in relay channels
+        if not self.channelParent.loading:
+            self.pluginManager.reconnectSource(self.name)  # update limits in relay channels
 
     def updateMax(self) -> None:
-        """Apply new maximum to value widget."""
-        spin = self.getParameterByName(self.VALUE).spin
+        """Apply new maximum to value widget. Virtual parameters apply the limit to their value and to editors created later."""
+        valueParameter = self.getParameterByName(self.VALUE)
+        if valueParameter.virtual:
+            valueParameter.max = self.max
+            if valueParameter.value is not None:
+                valueParameter.value = valueParameter.value  # coerce value to new limit like a spin box
+            cast('ChannelTreeView', self.tree).updateParameter(valueParameter)
+        spin = valueParameter.spin
         if spin:
             if isinstance(spin, LabviewSpinBox):
                 spin.setMaximum(int(self.max))
@@ -4591,6 +5169,373 @@ class TreeWidget(QTreeWidget):
         return QSize(self.width(), self.tree_height_hint_minimal() if self.minimizeHeight else self.tree_height_hint_complete())
 
 
+class ChannelModel(QAbstractItemModel):
+    """Item model that exposes the Parameters of a list of :class:`channels<esibd.core.Channel>` to a :class:`~esibd.core.ChannelTreeView`.
+
+    Each channel corresponds to a row and each Parameter to a column. Values are read from the Parameters when the view paints visible rows.
+    """
+
+    def __init__(self, parent: 'ChannelTreeView') -> None:
+        """Initialize a ChannelModel.
+
+        :param parent: The view using this model.
+        :type parent: ChannelTreeView
+        """
+        super().__init__(parent)
+        self.channels: list[Channel] = []
+        self.headerLabels: list[str] = []
+        self._rows: dict[int, int] | None = None  # maps id(channel) to row, rebuilt after rows changed
+
+    def row(self, channel: Channel) -> int:
+        """Return the row of a channel.
+
+        :param channel: The channel.
+        :type channel: esibd.core.Channel
+        :return: The row or -1 if the channel is not part of the model.
+        :rtype: int
+        """
+        if self._rows is None:
+            self._rows = {id(channel): row for row, channel in enumerate(self.channels)}
+        return self._rows.get(id(channel), -1)
+
+    def insertChannel(self, row: int, channel: Channel) -> None:
+        """Insert a channel.
+
+        :param row: Row at which the channel will be inserted.
+        :type row: int
+        :param channel: The channel.
+        :type channel: esibd.core.Channel
+        """
+        if not self.channels and not self.headerLabels:  # column count is defined by first channel
+            self.beginResetModel()
+            self.channels.insert(row, channel)
+            self._rows = None
+            self.endResetModel()
+            return
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.channels.insert(row, channel)
+        self._rows = None
+        self.endInsertRows()
+
+    def takeChannel(self, row: int) -> 'Channel | None':
+        """Remove and return a channel.
+
+        :param row: Row of the channel.
+        :type row: int
+        :return: The removed channel.
+        :rtype: esibd.core.Channel
+        """
+        if not 0 <= row < len(self.channels):
+            return None
+        self.beginRemoveRows(QModelIndex(), row, row)
+        channel = self.channels.pop(row)
+        self._rows = None
+        self.endRemoveRows()
+        return channel
+
+    def clear(self) -> None:
+        """Remove all channels."""
+        self.beginResetModel()
+        self.channels = []
+        self._rows = None
+        self.endResetModel()
+
+    def parameter(self, index: QModelIndex) -> 'Parameter | None':
+        """Return the Parameter corresponding to an index.
+
+        :param index: The model index.
+        :type index: QModelIndex
+        :return: The Parameter or None if the index is not valid.
+        :rtype: esibd.core.Parameter
+        """
+        if not index.isValid() or index.row() >= len(self.channels):
+            return None
+        parameters = self.channels[index.row()].parameters
+        return parameters[index.column()] if index.column() < len(parameters) else None
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:  # pylint: disable = missing-param-doc, missing-type-doc  # noqa: B008, D102
+        if parent.isValid() or not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index: QModelIndex = QModelIndex()) -> QModelIndex:  # pylint: disable = missing-param-doc, missing-type-doc, unused-argument  # noqa: ARG002, B008, D102
+        return QModelIndex()  # flat list of channels
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # pylint: disable = missing-param-doc, missing-type-doc  # noqa: B008, D102
+        return 0 if parent.isValid() else len(self.channels)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # pylint: disable = missing-param-doc, missing-type-doc, unused-argument  # noqa: ARG002, B008, D102
+        return len(self.headerLabels) if self.headerLabels else (len(self.channels[0].parameters) if self.channels else 0)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:  # pylint: disable = missing-param-doc, missing-type-doc  # noqa: ANN401, D102
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole and section < len(self.headerLabels):
+            return self.headerLabels[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:  # pylint: disable = missing-param-doc, missing-type-doc  # noqa: ANN401, C901, PLR0911, D102
+        parameter = self.parameter(index)
+        if parameter is None:
+            return None
+        channel = cast('Channel', parameter.parameterParent)
+        if not parameter.visible and role in {Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole, Qt.ItemDataRole.CheckStateRole, Qt.ItemDataRole.DecorationRole}:
+            return None  # hidden Parameters leave an empty cell, like a hidden widget
+        if role == Qt.ItemDataRole.DisplayRole:
+            if parameter.parameterType in {PARAMETERTYPE.BOOL, PARAMETERTYPE.COLOR}:
+                return None
+            return parameter.formatValue()
+        if role == Qt.ItemDataRole.EditRole:
+            return parameter.value
+        if role == Qt.ItemDataRole.CheckStateRole and parameter.parameterType == PARAMETERTYPE.BOOL:
+            return Qt.CheckState.Checked if parameter.value else Qt.CheckState.Unchecked
+        if role == Qt.ItemDataRole.DecorationRole and parameter.parameterType == PARAMETERTYPE.COLOR:
+            return QColor(cast('str', parameter.value))
+        if role == Qt.ItemDataRole.BackgroundRole and parameter.name == channel.MONITOR and channel.warningState:
+            return QBrush(QColor(255, 0, 0))  # same as warningStyleSheet
+        if role == Qt.ItemDataRole.BackgroundRole and channel.backgroundColor:
+            return QBrush(channel.backgroundColor)
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return parameter.toolTip or None
+        if role == Qt.ItemDataRole.SizeHintRole:
+            return QSize(10, int(channel.rowHeight))
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:  # pylint: disable = missing-param-doc, missing-type-doc  # noqa: D102
+        parameter = self.parameter(index)
+        if parameter is None:
+            return Qt.ItemFlag.NoItemFlags
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if parameter.visible and not parameter.indicator:
+            if parameter.parameterType == PARAMETERTYPE.BOOL:
+                flags |= Qt.ItemFlag.ItemIsUserCheckable
+            elif parameter.parameterType not in {PARAMETERTYPE.LABEL, PARAMETERTYPE.PATH, PARAMETERTYPE.COLOR}:
+                flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:  # pylint: disable = missing-param-doc, missing-type-doc  # noqa: ANN401, D102
+        parameter = self.parameter(index)
+        if parameter is None:
+            return False
+        if role == Qt.ItemDataRole.CheckStateRole and parameter.parameterType == PARAMETERTYPE.BOOL:
+            parameter.value = Qt.CheckState(value) == Qt.CheckState.Checked
+            return True
+        if role == Qt.ItemDataRole.EditRole:
+            channel = cast('Channel', parameter.parameterParent)
+            if parameter.name == channel.NAME:  # names cannot be empty and should not contain invalid characters
+                value = re.sub('|'.join(channel.invalid_chars), '', str(value))
+                if not value:
+                    return False
+            parameter.value = value
+            if parameter.parameterType == PARAMETERTYPE.TEXT or (not parameter.instantUpdate and
+                                                                  parameter.parameterType in {PARAMETERTYPE.INT, PARAMETERTYPE.FLOAT, PARAMETERTYPE.EXP}):
+                parameter.changedEvent()  # corresponds to editingFinished of the widget
+            return True
+        return False
+
+
+class ChannelDelegate(QStyledItemDelegate):
+    """Creates editors for Parameters of a :class:`~esibd.core.ChannelTreeView` only while they are edited."""
+
+    def createEditor(self, parent: 'QWidget | None', option: QStyleOptionViewItem, index: QModelIndex) -> 'QWidget | None':  # pylint: disable = missing-param-doc, missing-type-doc  # noqa: ARG002, D102
+        parameter = cast('ChannelModel', index.model()).parameter(index)
+        if parameter is None:
+            return None
+        editor = None
+        if parameter.parameterType in {PARAMETERTYPE.COMBO, PARAMETERTYPE.INTCOMBO, PARAMETERTYPE.FLOATCOMBO}:
+            editor = CompactComboBox()
+            editor.addItems(parameter.items)
+        elif parameter.parameterType == PARAMETERTYPE.TEXT:
+            editor = QLineEdit()
+            editor.setFrame(False)
+        elif parameter.parameterType in {PARAMETERTYPE.INT, PARAMETERTYPE.FLOAT, PARAMETERTYPE.EXP}:
+            if parameter.parameterType == PARAMETERTYPE.INT:
+                editor = LabviewSpinBox()
+            elif parameter.parameterType == PARAMETERTYPE.FLOAT:
+                editor = LabviewDoubleSpinBox(displayDecimals=parameter.displayDecimals)
+            else:  # PARAMETERTYPE.EXP
+                editor = LabviewSciSpinBox(displayDecimals=parameter.displayDecimals)
+            if parameter.min is not None:
+                editor.setMinimum(int(parameter.min)) if isinstance(editor, LabviewSpinBox) else editor.setMinimum(parameter.min)
+            if parameter.max is not None:
+                editor.setMaximum(int(parameter.max)) if isinstance(editor, LabviewSpinBox) else editor.setMaximum(parameter.max)
+        if editor:
+            editor.setParent(parent)
+        return editor
+
+    def setEditorData(self, editor: 'QWidget | None', index: QModelIndex) -> None:  # pylint: disable = missing-param-doc, missing-type-doc  # noqa: D102
+        parameter = cast('ChannelModel', index.model()).parameter(index)
+        if parameter is None:
+            return
+        if isinstance(editor, QComboBox):
+            editor.setCurrentIndex(max(editor.findText(str(parameter.value)), 0))
+        elif isinstance(editor, QLineEdit):
+            editor.setText(str(parameter.value))
+        elif isinstance(editor, (LabviewSpinBox, LabviewDoubleSpinBox)) and parameter.value is not None:
+            editor.setValue(parameter.value)  # type: ignore  # noqa: PGH003
+
+    def setModelData(self, editor: 'QWidget | None', model: 'QAbstractItemModel | None', index: QModelIndex) -> None:  # pylint: disable = missing-param-doc, missing-type-doc  # noqa: D102
+        if model is None:
+            return
+        if isinstance(editor, QComboBox):
+            model.setData(index, editor.currentText(), Qt.ItemDataRole.EditRole)
+        elif isinstance(editor, QLineEdit):
+            model.setData(index, editor.text(), Qt.ItemDataRole.EditRole)
+        elif isinstance(editor, (LabviewSpinBox, LabviewDoubleSpinBox)):
+            model.setData(index, editor.value(), Qt.ItemDataRole.EditRole)
+
+    def updateEditorGeometry(self, editor: 'QWidget | None', option: QStyleOptionViewItem, index: QModelIndex) -> None:  # pylint: disable = missing-param-doc, missing-type-doc  # noqa: ARG002, D102
+        if editor:
+            editor.setGeometry(option.rect)
+
+    def editorEvent(self, event: 'QEvent | None', model: 'QAbstractItemModel | None', option: QStyleOptionViewItem, index: QModelIndex) -> bool:  # pylint: disable = missing-param-doc, missing-type-doc  # noqa: D102
+        parameter = cast('ChannelModel', index.model()).parameter(index)
+        if (event and model and parameter and parameter.parameterType == PARAMETERTYPE.COLOR and not parameter.indicator and
+            event.type() == QEvent.Type.MouseButtonDblClick):
+            color = QColorDialog.getColor(QColor(cast('str', parameter.value)))
+            if color.isValid():
+                parameter.value = color.name()
+            return True
+        return super().editorEvent(event, model, option, index)
+
+
+class ChannelTreeView(QTreeView):
+    """Virtualized alternative to the :class:`~esibd.core.TreeWidget` used by :class:`~esibd.plugins.ChannelManager`.
+
+    Channels do not create widgets for their Parameters. Instead, visible rows are painted based on the :class:`~esibd.core.ChannelModel`
+    and editors are only created by the :class:`~esibd.core.ChannelDelegate` while a value is edited.
+    Thus, load time and memory scale with the number of visible rows, which is important for devices with thousands of channels.
+    Implements the subset of the QTreeWidget API used by ChannelManager, so channels can be added, moved, and removed as usual.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a ChannelTreeView."""
+        super().__init__()
+        self.channelModel = ChannelModel(self)
+        self.setModel(self.channelModel)
+        self.setItemDelegate(ChannelDelegate(self))
+        self.setUniformRowHeights(True)  # allows to skip measuring every row
+        self.setRootIsDecorated(False)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.DoubleClicked | QAbstractItemView.EditTrigger.EditKeyPressed |
+                             QAbstractItemView.EditTrigger.SelectedClicked)
+        self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.customContextMenuRequested.connect(self.initContextMenu)
+
+    def initContextMenu(self, pos: QPoint) -> None:
+        """Show the context menu of the Parameter at the given position.
+
+        :param pos: The position of the context menu.
+        :type pos: QPoint
+        """
+        parameter = self.channelModel.parameter(self.indexAt(pos))
+        viewport = self.viewport()
+        if parameter and viewport:
+            cast('Channel', parameter.parameterParent).initSettingsContextMenuBase(parameter, viewport.mapToGlobal(pos))
+
+    def addTopLevelItem(self, channel: Channel) -> None:
+        """Append a channel.
+
+        :param channel: The channel.
+        :type channel: esibd.core.Channel
+        """
+        self.channelModel.insertChannel(len(self.channelModel.channels), channel)
+
+    def insertTopLevelItem(self, index: int, channel: Channel) -> None:
+        """Insert a channel.
+
+        :param index: The row at which to insert the channel.
+        :type index: int
+        :param channel: The channel.
+        :type channel: esibd.core.Channel
+        """
+        self.channelModel.insertChannel(index, channel)
+
+    def takeTopLevelItem(self, index: int) -> 'Channel | None':
+        """Remove a channel.
+
+        :param index: The row of the channel.
+        :type index: int
+        :return: The removed channel.
+        :rtype: esibd.core.Channel
+        """
+        return self.channelModel.takeChannel(index)
+
+    def topLevelItemCount(self) -> int:
+        """Return the number of channels."""
+        return len(self.channelModel.channels)
+
+    def topLevelItem(self, index: int) -> 'Channel | None':
+        """Return the channel at a given row.
+
+        :param index: The row of the channel.
+        :type index: int
+        :return: The channel.
+        :rtype: esibd.core.Channel
+        """
+        return self.channelModel.channels[index] if 0 <= index < len(self.channelModel.channels) else None
+
+    def clear(self) -> None:
+        """Remove all channels."""
+        self.channelModel.clear()
+
+    def setHeaderLabels(self, labels: list[str]) -> None:
+        """Set the header labels. Also defines the number of columns.
+
+        :param labels: Header labels.
+        :type labels: list[str]
+        """
+        self.channelModel.beginResetModel()
+        self.channelModel.headerLabels = labels
+        self.channelModel.endResetModel()
+
+    def updateParameter(self, parameter: Parameter) -> None:
+        """Repaint the cell of a Parameter if it is visible.
+
+        :param parameter: The Parameter that changed.
+        :type parameter: esibd.core.Parameter
+        """
+        row = self.channelModel.row(cast('Channel', parameter.parameterParent))
+        if row >= 0:
+            index = self.channelModel.index(row, parameter.column)
+            self.channelModel.dataChanged.emit(index, index)
+
+    def updateChannel(self, channel: Channel) -> None:
+        """Repaint the row of a channel if it is visible.
+
+        :param channel: The channel that changed.
+        :type channel: esibd.core.Channel
+        """
+        row = self.channelModel.row(channel)
+        if row >= 0:
+            self.channelModel.dataChanged.emit(self.channelModel.index(row, 0), self.channelModel.index(row, max(self.channelModel.columnCount() - 1, 0)))
+
+    def setChannelHidden(self, channel: Channel, hide: bool) -> None:
+        """Hide or show the row of a channel.
+
+        :param channel: The channel.
+        :type channel: esibd.core.Channel
+        :param hide: Hide if True.
+        :type hide: bool
+        """
+        row = self.channelModel.row(channel)
+        if row >= 0 and self.isRowHidden(row, QModelIndex()) != hide:
+            self.setRowHidden(row, QModelIndex(), hide)
+
+    def isChannelHidden(self, channel: Channel) -> bool:
+        """Return True if the row of the channel is hidden.
+
+        :param channel: The channel.
+        :type channel: esibd.core.Channel
+        :return: Hidden state.
+        :rtype: bool
+        """
+        row = self.channelModel.row(channel)
+        return row >= 0 and self.isRowHidden(row, QModelIndex())
+
+    def grabItems(self) -> QPixmap:
+        """Grab a QPixmap of the visible rows."""
+        return self.grab()
+
+
 class LedIndicator(QAbstractButton, ParameterWidget):
     """Simple custom LED indicator."""
 
@@ -4971,6 +5916,7 @@ class NumberBar(QWidget):
         self.editor.updateRequest.connect(self.update_on_scroll)
         self.update_width('1')
         self.lineBarColor = Qt.GlobalColor.black
+        self.lineOffset = 0  # number of lines before the first line in the editor, e.g. when only showing part of a file
 
     def updateTheme(self) -> None:
         """Change between dark and light themes."""
@@ -4994,13 +5940,13 @@ class NumberBar(QWidget):
         if self.isVisible() and a0:
             block = self.editor.firstVisibleBlock()
             height = self.fontMetrics().height()
-            number = block.blockNumber()
+            number = block.blockNumber() + self.lineOffset
             painter = QPainter(self)
             painter.fillRect(a0.rect(), self.lineBarColor)
             painter.drawRect(0, 0, a0.rect().width() - 1, a0.rect().height() - 1)
             font = painter.font()
 
-            current_block = self.editor.textCursor().block().blockNumber() + 1
+            current_block = self.editor.textCursor().block().blockNumber() + 1 + self.lineOffset
 
             condition = True
             while block.isValid() and condition:
@@ -5027,6 +5973,156 @@ class NumberBar(QWidget):
             painter.end()
 
 
+class MappedTextFile:
+    """Read-only access to any region of an arbitrarily large text file.
+
+    The file is memory mapped and only the offset of every :attr:`checkpointInterval` th line is indexed,
+    so opening the file and memory usage do not depend on the file size.
+    """
+
+    checkpointInterval = 1024
+    """Number of lines between indexed line offsets."""
+    chunkSize = 16 * 1024**2
+    """Number of bytes that are indexed at once."""
+    searchChunkSize = 4 * 1024**2
+    """Number of bytes that are searched at once. Searching can be stopped between chunks."""
+
+    def __init__(self, file: Path) -> None:
+        """Map a file into memory. Call :meth:`~esibd.core.MappedTextFile.index` in a separate thread to index lines.
+
+        :param file: The text file.
+        :type file: pathlib.Path
+        """
+        self.file = file
+        self.map: 'mmap.mmap | None' = None
+        self.checkpoints: list[int] = [0]  # byte offsets of lines 0, checkpointInterval, 2*checkpointInterval, ...
+        self.lineCount = 0  # number of complete lines that have been indexed
+        self.indexedBytes = 0
+        self.stop = False
+        self.refresh()
+
+    @property
+    def size(self) -> int:
+        """Return the mapped size in bytes."""
+        return len(self.map) if self.map else 0
+
+    def refresh(self) -> bool:
+        """Map the file again if it has grown, e.g. if it is a log file that is still being written.
+
+        :return: True if the file has grown.
+        :rtype: bool
+        """
+        size = self.file.stat().st_size
+        if size <= self.size:
+            return False
+        with self.file.open('rb') as file:
+            self.map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)  # previous map is closed when no longer referenced
+        return True
+
+    def index(self, progress: 'Callable[[], None] | None' = None) -> None:
+        """Index line offsets of the part of the file that has not been indexed yet. Can run in a separate thread.
+
+        Parts that are mapped by :meth:`~esibd.core.MappedTextFile.refresh` while indexing are included.
+
+        :param progress: Called after every indexed chunk, defaults to None
+        :type progress: Callable, optional
+        """
+        while (fileMap := self.map) and self.indexedBytes < len(fileMap) and not self.stop:
+            start = self.indexedBytes
+            chunk = np.frombuffer(fileMap, dtype=np.uint8, count=min(self.chunkSize, len(fileMap) - start), offset=start)
+            newlines = np.flatnonzero(chunk == ord('\n')) + start  # only used temporarily, limited by chunkSize
+            firstCheckpoint = -(self.lineCount + 1) % self.checkpointInterval  # index of first newline that ends a line preceding a checkpoint
+            self.checkpoints.extend((newlines[firstCheckpoint::self.checkpointInterval] + 1).tolist())
+            self.lineCount += len(newlines)
+            self.indexedBytes = start + len(chunk)
+            del chunk, fileMap  # release buffer of the map
+            if progress:
+                progress()
+
+    def lineStart(self, line: int) -> int:
+        """Return the byte offset of a line.
+
+        :param line: Line number starting at 0. Limited to indexed lines.
+        :type line: int
+        :return: Byte offset.
+        :rtype: int
+        """
+        if not self.map:
+            return 0
+        line = max(0, min(line, self.lineCount))
+        offset = self.checkpoints[min(line // self.checkpointInterval, len(self.checkpoints) - 1)]
+        for _ in range(line - (line // self.checkpointInterval) * self.checkpointInterval):
+            offset = self.map.find(b'\n', offset) + 1
+        return offset
+
+    def lineAt(self, offset: int) -> int:
+        """Return the number of the line that contains the byte offset.
+
+        :param offset: Byte offset inside the indexed part of the file.
+        :type offset: int
+        :return: Line number starting at 0.
+        :rtype: int
+        """
+        if not self.map:
+            return 0
+        checkpoint = bisect.bisect_right(self.checkpoints, offset) - 1
+        return checkpoint * self.checkpointInterval + self.map[self.checkpoints[checkpoint]:offset].count(b'\n')  # at most checkpointInterval lines are copied
+
+    def readLines(self, start: int, count: int) -> str:
+        """Return decoded lines.
+
+        :param start: First line starting at 0.
+        :type start: int
+        :param count: Maximum number of lines.
+        :type count: int
+        :return: The lines.
+        :rtype: str
+        """
+        if not self.map:
+            return ''
+        begin = self.lineStart(start)
+        end = begin
+        for _ in range(count):
+            end = self.map.find(b'\n', end) + 1
+            if end == 0:
+                end = len(self.map)
+                break
+        return self.map[begin:end].decode(UTF8, errors='replace')
+
+    def find(self, text: str, offset: int, stop: 'Callable[[], bool] | None' = None) -> int:
+        """Find text ignoring case without loading the file into memory. Can run in a separate thread.
+
+        The file is searched in chunks of :attr:`~esibd.core.MappedTextFile.searchChunkSize` bytes.
+
+        :param text: The search text.
+        :type text: str
+        :param offset: Byte offset from where to start searching.
+        :type offset: int
+        :param stop: Searching is stopped if this returns True, defaults to None
+        :type stop: Callable, optional
+        :return: Byte offset of the match or -1 if not found or stopped.
+        :rtype: int
+        """
+        fileMap = self.map
+        if not fileMap or not text:
+            return -1
+        encodedText = text.encode(UTF8)
+        pattern = re.compile(re.escape(encodedText), re.IGNORECASE)
+        overlap = len(encodedText) - 1  # find matches that span two chunks
+        for start in range(offset, len(fileMap), self.searchChunkSize):
+            if self.stop or (stop and stop()):
+                return -1
+            match = pattern.search(fileMap, start, min(start + self.searchChunkSize + overlap, len(fileMap)))
+            if match:
+                return match.start()
+        return -1
+
+    def close(self) -> None:
+        """Stop indexing and release the file."""
+        self.stop = True
+        self.map = None
+
+
 class ReplWidget(pyqtgraph.console.repl_widget.ReplWidget):
     """Add logging to terminal and log files. See original class for Documentation."""
 
@@ -5692,7 +6788,12 @@ class TimeoutLock:
         :yield: True if lock is acquired
         :rtype: bool
         """
-        result = already_acquired or self._lock.acquire(timeout=timeout)
+        if already_acquired:
+            result = True
+        else:
+            begin = time.perf_counter()
+            result = self._lock.acquire(timeout=timeout)
+            hotPathMetrics.add('TimeoutLock.wait', time.perf_counter() - begin)
         logLevel = cast('int', getLogLevel())
         if logLevel > 1:  # VERBOSE/TRACE
             # get more information on errors (file and line number not available when using except)
@@ -5731,6 +6832,135 @@ class TimeoutLock:
         self._lock.__exit__(exc_type, exc_val, exc_tb)
 
 
+class AnalysisPool(QObject):
+    """Run analysis jobs, such as fits or predictions, in background threads and post results back to the main thread.
+
+    Jobs are identified by a key, e.g. combining plugin and channel name. Only the latest job for each key is relevant:
+    jobs that are replaced before they start are dropped and results of jobs that have been replaced while running are discarded.
+    The last result for each key is passed to the next job with the same key, e.g. to warm start fits.
+    The :class:`~esibd.core.AnalysisPool` can be accessed as `pluginManager.analysisPool`.
+    """
+
+    class SignalCommunicate(QObject):
+        """Bundle pyqtSignals."""
+
+        resultSignal = pyqtSignal(str, int, object)
+        """Signal that posts the result of a job to the main thread."""
+
+    def __init__(self, pluginManager: PluginManager, workers: int = 2) -> None:
+        """Initialize an AnalysisPool.
+
+        :param pluginManager: The central pluginManager.
+        :type pluginManager: PluginManager
+        :param workers: Number of worker threads, defaults to 2
+        :type workers: int, optional
+        """
+        super().__init__()
+        self.pluginManager = pluginManager
+        self.signalComm = self.SignalCommunicate()
+        self.signalComm.resultSignal.connect(self.postResult)
+        self.condition = threading.Condition()
+        self.pendingJobs: dict[str, tuple[int, Callable]] = {}  # only latest job per key
+        self.runningKeys: set[str] = set()
+        self.jobIds: dict[str, int] = {}
+        self.callbacks: dict[str, Callable] = {}
+        self.lastResults: dict[str, Any] = {}
+        self.closing = False
+        for i in range(workers):
+            workerThread = Thread(target=self.runJobs, name=f'AnalysisPool workerThread {i}')
+            workerThread.daemon = True
+            workerThread.start()
+
+    def print(self, message: str, flag: PRINT = PRINT.MESSAGE) -> None:
+        """Send a message to stdout, the statusbar, the Console, and to the logfile.
+
+        :param message: A short informative message.
+        :type message: str
+        :param flag: Flag used to adjust message display, defaults to :attr:`~esibd.const.PRINT.MESSAGE`
+        :type flag: :meth:`~esibd.const.PRINT`, optional
+        """
+        self.pluginManager.logger.print(message, sender='AnalysisPool', flag=flag)
+
+    def submit(self, key: str, job: Callable, callback: Callable) -> int:
+        """Submit a job. A pending job with the same key will be dropped.
+
+        :param key: Identifies jobs that replace each other.
+        :type key: str
+        :param job: Executed in a worker thread. Has to accept the result of the previous job with the same key (or None) and return the new result.
+            Make sure to only pass copies of data that may change while the job is running.
+        :type job: Callable
+        :param callback: Executed in the main thread with the result of the job, unless the job has been replaced in the meantime.
+        :type callback: Callable
+        :return: The id of the job.
+        :rtype: int
+        """
+        with self.condition:
+            jobId = self.jobIds.get(key, 0) + 1
+            self.jobIds[key] = jobId
+            self.callbacks[key] = callback
+            self.pendingJobs[key] = (jobId, job)
+            self.condition.notify()
+        return jobId
+
+    def cancel(self, key: str) -> None:
+        """Drop pending job and discard result of running job with given key.
+
+        :param key: Job key.
+        :type key: str
+        """
+        with self.condition:
+            self.pendingJobs.pop(key, None)
+            self.jobIds[key] = self.jobIds.get(key, 0) + 1
+
+    def runJobs(self) -> None:
+        """Execute pending jobs. Jobs with the same key are never executed in parallel."""
+        while True:
+            with self.condition:
+                key = None
+                while not self.closing:
+                    key = next((key for key in self.pendingJobs if key not in self.runningKeys), None)
+                    if key is not None:
+                        break
+                    self.condition.wait()
+                if self.closing or key is None:
+                    return
+                jobId, job = self.pendingJobs.pop(key)
+                self.runningKeys.add(key)
+                lastResult = self.lastResults.get(key)
+            result = None
+            try:
+                result = job(lastResult)
+            except Exception:  # noqa: BLE001  # we have no control about the exception a job can possibly throw
+                self.print(f'Analysis {key} failed: {traceback.format_exc()}', flag=PRINT.ERROR)
+            with self.condition:
+                self.runningKeys.discard(key)
+                if result is not None:
+                    self.lastResults[key] = result
+                self.condition.notify()  # a job with the same key may have been submitted in the meantime
+            if not self.closing:
+                self.signalComm.resultSignal.emit(key, jobId, result)
+
+    def postResult(self, key: str, jobId: int, result: Any) -> None:  # noqa: ANN401
+        """Pass result to callback if the job has not been replaced in the meantime.
+
+        :param key: Job key.
+        :type key: str
+        :param jobId: Job id.
+        :type jobId: int
+        :param result: Job result.
+        :type result: Any
+        """
+        if jobId == self.jobIds.get(key) and not self.pluginManager.closing:
+            self.callbacks[key](result)
+
+    def close(self) -> None:
+        """Stop all worker threads. Pending jobs are dropped."""
+        with self.condition:
+            self.closing = True
+            self.pendingJobs.clear()
+            self.condition.notify_all()
+
+
 class DeviceController(QObject):  # noqa: PLR0904
     """Each :class:`~esibd.plugins.Device` or :class:`~esibd.core.Channel` comes with a :class:`~esibd.core.DeviceController`.
 
@@ -5799,7 +7029,7 @@ class DeviceController(QObject):  # noqa: PLR0904
         self.port = None
         self.signalComm = self.SignalCommunicate()
         self.signalComm.initCompleteSignal.connect(self.initComplete)
-        self.signalComm.updateValuesSignal.connect(self.updateValues)
+        self.signalComm.updateValuesSignal.connect(self.measureUpdateValues)
         self.signalComm.closeCommunicationSignal.connect(self.closeCommunication)
         self._errorCount = 0
         self.errorCountTimer = QTimer()
@@ -5963,6 +7193,11 @@ class DeviceController(QObject):  # noqa: PLR0904
         """
         # Extend to add functionality
 
+    def measureUpdateValues(self) -> None:
+        """Call updateValues and record its duration as hot path, including overrides. Connected to updateValuesSignal."""
+        with hotPathMetrics.measure('DeviceController.updateValues'):
+            self.updateValues()
+
     def updateValues(self) -> None:
         """Update the value or monitor of the channel(s) in the main thread. Called from acquisitionThread."""
         # Overwrite with specific update code if applicable.
@@ -5989,7 +7224,8 @@ class DeviceController(QObject):  # noqa: PLR0904
         while self.acquiring:
             with self.lock.acquire_timeout(1, timeoutMessage='Could not acquire lock to acquire data') as lock_acquired:
                 if lock_acquired:
-                    self.fakeNumbers() if getTestMode() else self.readNumbers()
+                    with hotPathMetrics.measure('DeviceController.runAcquisition'):
+                        self.fakeNumbers() if getTestMode() else self.readNumbers()
                     self.signalComm.updateValuesSignal.emit()
             # release lock before waiting!
             time.sleep(self.getDevice().interval / 1000)
@@ -6189,10 +7425,18 @@ class SplashScreen(QSplashScreen):
 
 
 class VideoRecorder:
-    """Allows to record videos of a plugin."""
+    """Allows to record videos of a plugin.
+
+    Only the screen grab is done in the main thread. Cursor overlay, color conversion, and encoding are done in the encoderThread.
+    Frames are dropped if the encoderThread cannot keep up to avoid affecting the GUI and acquisition.
+    Frames are written according to the time they have been grabbed, gaps from dropped or delayed frames are filled by repeating the previous frame.
+    """
 
     # ! capture real contextual cursor instead of drawing fixed cursor requires recording with external library FFmpeg -> not supported
 
+    maxQueuedFrames = 10
+    """Frames that have been grabbed but not yet encoded. Additional frames are dropped."""
+
     def __init__(self, parentPlugin: 'Plugin') -> None:
         """Initialize a VideoRecorder.
 
@@ -6204,16 +7448,24 @@ class VideoRecorder:
         self.timer = QTimer()
         self.timer.timeout.connect(self.capture_frame)
         self.fps = 10  # Frames per second
-        self.frameCount = 0
+        self.frameCount = 0  # frames passed to encoderThread
+        self.droppedFrames = 0
+        self.grabTime = 0  # total time spent in main thread in s
         self.is_recording = False
-        self.cursor_pixmap = self.parentPlugin.makeCoreIcon('cursor.png').pixmap(32)
+        self.cursor_image = self.parentPlugin.makeCoreIcon('cursor.png').pixmap(32).toImage()  # QImage can be used outside main thread
+        self.startTime = 0.0
+        self.frameQueue: queue.Queue[tuple[QImage, QPoint, float] | None] = queue.Queue(maxsize=self.maxQueuedFrames)
+        self.encoderThread: 'Thread | None' = None
+        self.encoderError = ''
 
     def startRecording(self) -> None:
         """Initialize video recorder and starts recording."""
         if not self.recordWidget or (self.parentPlugin.pluginManager.testing and not self.parentPlugin.pluginManager.Settings.showVideoRecorders):
             return
         self.frameCount = 0
-        self.video_writer: cv2.VideoWriter
+        self.droppedFrames = 0
+        self.grabTime = 0
+        self.encoderError = ''
         self.screen = QGuiApplication.screenAt(self.recordWidget.mapToGlobal(QPoint(0, 0)))
         if self.screen:
             self.is_recording = True
@@ -6222,63 +7474,104 @@ class VideoRecorder:
             self.parentPlugin.videoRecorderAction.state = True
             self.parentPlugin.videoRecorderAction.setVisible(True)
             self.screen_geometry = self.screen.geometry()
-            self.dpr = self.screen.devicePixelRatio()
+            self.size = self.recordWidget.size()
+            self.frameQueue = queue.Queue(maxsize=self.maxQueuedFrames)
+            self.startTime = time.perf_counter()  # same clock as grab times
+            self.encoderThread = Thread(target=self.encodeFrames, args=(self.frameQueue,), name=f'{self.parentPlugin.name} encoderThread')
+            self.encoderThread.daemon = True
+            self.encoderThread.start()
             self.timer.start(int(1000 / self.fps))
             self.parentPlugin.print(f'Start recording {self.file.name}')
         else:
             self.parentPlugin.print('Cannot start recording. Screen not found.', flag=PRINT.ERROR)
 
     def capture_frame(self) -> None:
-        """Capture a single video frame."""
+        """Capture a single video frame and pass it to the encoderThread."""
         if not self.is_recording or not self.screen or not self.recordWidget:
             return
-        full_screenshot = self.screen.grabWindow(sip.voidptr(0))  # should be called from main thread
-
-        # Capture the current mouse position
-        cursor_pos_global = QCursor().pos()
-        # Overlay the cursor on the full-screen image
-        painter = QPainter(full_screenshot)
-        painter.drawPixmap(int(cursor_pos_global.x() - self.screen_geometry.x()), int(cursor_pos_global.y() - self.screen_geometry.y()), self.cursor_pixmap)
-        painter.end()
-        global_pos = self.recordWidget.mapToGlobal(QPoint(0, 0))  # Widget's global position
-        screen_x = global_pos.x() - self.screen_geometry.x()
-        screen_y = global_pos.y() - self.screen_geometry.y()
-        # Define cropping rectangle in local screen coordinates
-        rect = QRect(int(screen_x * self.dpr), int(screen_y * self.dpr), int(self.recordWidget.width() * self.dpr), int(self.recordWidget.height() * self.dpr))
-        cropped_screenshot = full_screenshot.copy(rect)
-        image = cropped_screenshot.toImage().convertToFormat(QImage.Format.Format_RGBA8888)  # Ensure correct format
-        if self.frameCount == 0:
-            self.width, self.height = image.width(), image.height()
-            # Note cv2.VideoWriter_fourcc(*'H264') H.264 codec (MPEG-4 AVC) would achieve smaller file sizes,
-            # but requires independent codec installation and would not work out of the box
-            self.video_writer = cv2.VideoWriter(self.file.as_posix(), cv2.VideoWriter.fourcc(*'mp4v'), self.fps, (self.width, self.height))
-        elif (image.width(), image.height()) != (self.width, self.height):
+        if self.recordWidget.size() != self.size:
             self.parentPlugin.print('Resizing during video recording not supported. Stopping recording.', flag=PRINT.WARNING)
             self.stopRecording()
             return
-        elif self.frameCount > 600 * self.fps:  # limit recording to 10 minutes
-            self.parentPlugin.print('Stopping video recording after reaching 5 minute limit.', flag=PRINT.WARNING)
+        if time.perf_counter() - self.startTime > 600:  # limit recording to 10 minutes  # noqa: PLR2004
+            self.parentPlugin.print('Stopping video recording after reaching 10 minute limit.', flag=PRINT.WARNING)
+            self.stopRecording()
+            return
+        if self.encoderError:
+            self.parentPlugin.print(f'Stopping video recording: {self.encoderError}', flag=PRINT.ERROR)
             self.stopRecording()
             return
-        buffer = image.bits()  # Get image data as a bytes object
-        if buffer:
-            buffer.setsize(image.sizeInBytes())
-            frame = np.asarray(buffer, dtype=np.uint8).reshape((self.height, self.width, 4))  # Convert to NumPy array
-            frame_bgr = cv2.cvtColor(frame, cv2.COLOR_RGBA2BGR)  # Convert RGBA to BGR for OpenCV
-            self.video_writer.write(frame_bgr)
-            self.frameCount += 1
+        if self.frameQueue.full():
+            self.droppedFrames += 1  # do not spend time grabbing frames that cannot be encoded
+            return
+        start = time.perf_counter()
+        global_pos = self.recordWidget.mapToGlobal(QPoint(0, 0))  # Widget's global position
+        # grab only the recorded area in local screen coordinates, should be called from main thread
+        image = self.screen.grabWindow(sip.voidptr(0), global_pos.x() - self.screen_geometry.x(), global_pos.y() - self.screen_geometry.y(),
+                                       self.size.width(), self.size.height()).toImage()
+        self.frameQueue.put((image, QCursor().pos() - global_pos, start))
+        self.frameCount += 1
+        self.grabTime += time.perf_counter() - start
+
+    def encodeFrames(self, frameQueue: 'queue.Queue[tuple[QImage, QPoint, float] | None]') -> None:
+        """Overlay cursor, convert, and encode frames until None is queued. Runs in encoderThread.
+
+        :param frameQueue: Grabbed frames, cursor positions relative to the recorded widget, and grab times. Each encoderThread uses its own queue.
+        :type frameQueue: queue.Queue
+        """
+        video_writer = None
+        width, height = 0, 0
+        writtenFrames = 0
+        previous_frame = None
+        while True:
+            item = frameQueue.get()
+            if item is None:
+                break
+            if self.encoderError:
+                continue  # discard remaining frames
+            image, cursor_pos, grabTime = item
+            # Overlay the cursor, QImage uses same logical coordinates as the widget
+            painter = QPainter(image)
+            painter.drawImage(cursor_pos, self.cursor_image)
+            painter.end()
+            image = image.convertToFormat(QImage.Format.Format_RGBA8888)  # Ensure correct format
+            if video_writer is None:
+                width, height = image.width(), image.height()
+                # Note cv2.VideoWriter_fourcc(*'H264') H.264 codec (MPEG-4 AVC) would achieve smaller file sizes,
+                # but requires independent codec installation and would not work out of the box
+                video_writer = cv2.VideoWriter(self.file.as_posix(), cv2.VideoWriter.fourcc(*'mp4v'), self.fps, (width, height))
+            buffer = image.bits()  # Get image data as a bytes object
+            if buffer and (image.width(), image.height()) == (width, height):
+                buffer.setsize(image.sizeInBytes())
+                frame = np.asarray(buffer, dtype=np.uint8).reshape((height, width, 4))  # Convert to NumPy array
+                frame_bgr = cv2.cvtColor(frame, cv2.COLOR_RGBA2BGR)  # Convert RGBA to BGR for OpenCV
+                targetFrames = max(int((grabTime - self.startTime) * self.fps) + 1, writtenFrames + 1)  # position of this frame in the video
+                try:
+                    while previous_frame is not None and writtenFrames < targetFrames - 1:
+                        video_writer.write(previous_frame)  # keep showing previous frame for dropped or delayed frames
+                        writtenFrames += 1
+                    video_writer.write(frame_bgr)
+                    writtenFrames += 1
+                except cv2.error as e:
+                    self.encoderError = str(e)  # reported and handled in main thread
+                previous_frame = frame_bgr
+        if video_writer is not None:
+            video_writer.release()
 
     def stopRecording(self) -> None:
         """Stop recording and finalizes the video file."""
         if self.is_recording:
             self.timer.stop()
             self.parentPlugin.videoRecorderAction.state = False
+            self.is_recording = False
+            self.frameQueue.put(None)  # blocks at most until the encoderThread has taken the next frame
+            if self.encoderThread:
+                self.encoderThread.join(timeout=5)  # wait for remaining frames, at most maxQueuedFrames
             if self.frameCount == 0:
                 self.parentPlugin.print('No frames have been recorded')
                 return
-            self.is_recording = False
-            self.video_writer.release()
-            self.parentPlugin.print(f'Saved {self.file.name}')
+            self.parentPlugin.print(f'Saved {self.file.name}: {self.frameCount} frames, {self.droppedFrames} dropped, '
+                                    f'{self.grabTime / self.frameCount * 1000:.1f} ms per frame in main thread.')
             self.parentPlugin.pluginManager.Explorer.populateTree()
 
 
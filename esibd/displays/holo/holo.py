@@ -1,9 +1,12 @@
+import queue
+from collections import OrderedDict
 from pathlib import Path
+from threading import Thread
 
 import numpy as np
 import pyqtgraph as pg
 import pyqtgraph.opengl as gl
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtWidgets import QHBoxLayout, QSlider
 
 from esibd.core import PLUGINTYPE
@@ -19,21 +22,39 @@ class HOLO(Plugin):
     r"""Display 3D NumPy arrays such as holograms from low energy electron holography (LEEH)\ :cite:`longchamp_imaging_2017, ochner_low-energy_2021, ochner_electrospray_2023`.
 
     Interactive 3D surface plots with density thresholds allow for efficient visualization of very large files.
+    Surfaces are computed in the background. A preview based on a downsampled volume is shown first and refined afterwards.
+    Files are memory mapped, volumes that exceed the maximum resolution are shown downsampled.
     """
 
     documentation = """The Holo plugin was designed to display 3D NumPy arrays such as
     holograms from low energy electron holography (LEEH).
     Interactive 3D surface plots with density thresholds allow for efficient visualization of very large files.
+    Surfaces are computed in the background. A preview based on a downsampled volume is shown first and refined afterwards.
+    Files are memory mapped, volumes that exceed the maximum resolution are shown downsampled.
     """
 
     name = 'Holo'
     version = '1.0'
     pluginType = PLUGINTYPE.DISPLAY
     iconFile = 'holo.png'
+    previewVoxels = 64**3
+    """Maximum number of voxels used for the first preview."""
+    maxVoxels = 256**3
+    """Maximum number of voxels used for the final surface. Larger volumes are downsampled."""
+    maxMeshes = 20
+    """Maximum number of cached surfaces."""
+
+    signalComm: 'SignalCommunicate'
+
+    class SignalCommunicate(Plugin.SignalCommunicate):
+        """Bundle pyqtSignals."""
+
+        meshSignal = pyqtSignal(bool, int, object, object, int)
 
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         self.previewFileTypes = ['.npy']
+        self.signalComm.meshSignal.connect(self.drawMesh)
 
     def initGUI(self) -> None:
         """Initialize GUI to display Holograms."""
@@ -54,8 +75,17 @@ class HOLO(Plugin):
         if self.titleBar:
             self.titleBar.addWidget(self.angleSlider)
             self.titleBar.addWidget(self.amplitudeSlider)
-        self.angle = None
-        self.amplitude = None
+        self.data: 'np.ndarray | None' = None  # memory mapped, only downsampled volumes are loaded
+        self.strides: list[int] = []  # downsampling of volumes from preview to final resolution
+        self.volumes: dict[tuple[int, bool, int], np.ndarray] = {}  # (generation, plotAngle, stride): volume
+        self.ranges: dict[tuple[int, bool], tuple[float, float]] = {}  # (generation, plotAngle): (min, max) used for all strides of a file
+        self.meshes: OrderedDict[tuple[int, bool, int, int], tuple[np.ndarray, np.ndarray]] = OrderedDict()  # (generation, plotAngle, stride, slider value): (vertexes, faces)
+        self.generation = 0  # incremented when loading a new file to discard outdated surfaces
+        self.latestRequests: dict[bool, tuple[int, int]] = {}  # plotAngle: (generation, slider value)
+        self.requestQueue: queue.Queue[tuple[int, bool, int] | None] = queue.Queue()
+        self.surfaceThread = Thread(target=self.runSurfaceWorker, args=(self.requestQueue,), name=f'{self.name} surfaceThread')
+        self.surfaceThread.daemon = True
+        self.surfaceThread.start()
         self.plotAngle = None
         self.update_timer = QTimer()
         self.update_timer.setSingleShot(True)
@@ -77,29 +107,26 @@ class HOLO(Plugin):
     def loadData(self, file, showPlugin=True) -> None:
         self.provideDock()
         self.file = file
-        data = np.load(file)
-        self.angle = np.ascontiguousarray(np.angle(data))  # make c contiguous
-        self.amplitude = np.ascontiguousarray(np.abs(data))  # make c contiguous
-        self.glAngleView.setCameraPosition(distance=max(self.angle.shape) * 2)
-        self.glAmplitudeView.setCameraPosition(distance=max(self.amplitude.shape) * 2)
+        self.generation += 1
+        self.data = np.load(file, mmap_mode='r')  # only read parts that are needed for downsampled volumes
+        self.volumes = {}
+        self.ranges = {}
+        self.meshes.clear()
+        stride = 1
+        self.strides = []
+        while self.data.size / stride**3 > self.previewVoxels:
+            if self.data.size / stride**3 <= self.maxVoxels:
+                self.strides.insert(0, stride)
+            stride *= 2
+        self.strides.insert(0, stride)  # coarsest first
+        self.glAngleView.setCameraPosition(distance=max(self.data.shape) * 2)
+        self.glAmplitudeView.setCameraPosition(distance=max(self.data.shape) * 2)
         self.angleSlider.setValue(10)
         self.amplitudeSlider.setValue(10)
         self.drawSurface(plotAngle=True)
         self.drawSurface(plotAngle=False)
         self.raiseDock(showPlugin)
 
-    def mapSliderToData(self, slider, data) -> np.ndarray:
-        """Map the position of the slider in percent to the corresponding data value.
-
-        :param slider: Slider providing threshold for drawing.
-        :type slider: QSlider
-        :param data: The data to be mapped.
-        :type data: np.ndarray
-        :return: Mapped data.
-        :rtype: np.ndarray
-        """
-        return data.min() + slider.value() / 100 * (data.max() - data.min())
-
     def value_changed(self, plotAngle=True) -> None:
         """Triggers delayed plot after slider value change.
 
@@ -110,37 +137,128 @@ class HOLO(Plugin):
         self.update_timer.start(200)
 
     def drawSurface(self, plotAngle: 'bool | None' = None) -> None:
-        """Draw an isosurface at a value defined by the sliders.
+        """Request an isosurface at a value defined by the sliders. The surface is computed in the background.
 
         :param plotAngle: True for angle, False for amplitude, defaults to None
         :type plotAngle: bool, optional
         """
         if plotAngle is not None:
             self.plotAngle = plotAngle
-        if self.angle is not None:
-            if self.plotAngle:
-                self.glAngleView.clear()
-                verts, faces = pg.isosurface(self.angle, self.mapSliderToData(self.angleSlider, self.angle))
-            else:
-                self.glAmplitudeView.clear()
-                verts, faces = pg.isosurface(self.amplitude, self.mapSliderToData(self.amplitudeSlider, self.amplitude))
-
-            md = gl.MeshData(vertexes=verts, faces=faces)
-            faceCount = md.faceCount()
-            if faceCount:
-                faceColors = np.ones((faceCount, 4), dtype=float)
-                faceColors[:, 3] = 0.2
-                faceColors[:, 2] = np.linspace(0, 1, faceColors.shape[0])
-                md.setFaceColors(faceColors)
-
-                m1 = gl.GLMeshItem(meshdata=md, smooth=True, shader='balloon')
-                m1.setGLOptions('additive')
-                m1.translate(-self.angle.shape[0] / 2, -self.angle.shape[1] / 2, -self.angle.shape[2] / 2)
-
-                if self.plotAngle:
-                    self.glAngleView.addItem(m1)
+        if self.data is not None:
+            value = (self.angleSlider if self.plotAngle else self.amplitudeSlider).value()
+            self.latestRequests[bool(self.plotAngle)] = (self.generation, value)  # requests that are replaced before they are processed are skipped
+            self.requestQueue.put((self.generation, bool(self.plotAngle), value))
+
+    def isStale(self, generation: int, plotAngle: bool, value: int) -> bool:
+        """Test if a newer surface has been requested.
+
+        :param generation: Generation of the request.
+        :type generation: int
+        :param plotAngle: True for angle, False for amplitude
+        :type plotAngle: bool
+        :param value: Slider value of the request.
+        :type value: int
+        :return: True if the request is outdated.
+        :rtype: bool
+        """
+        return self.latestRequests.get(plotAngle) != (generation, value) or self.pluginManager.closing
+
+    def runSurfaceWorker(self, requestQueue: 'queue.Queue[tuple[int, bool, int] | None]') -> None:
+        """Compute requested surfaces from coarse to final resolution. Runs in surfaceThread until None is queued.
+
+        :param requestQueue: Queue of requested surfaces. Each surfaceThread uses its own queue.
+        :type requestQueue: queue.Queue
+        """
+        while True:
+            request = requestQueue.get()
+            if request is None:
+                break
+            generation, plotAngle, value = request
+            for stride in self.strides:
+                if self.isStale(generation, plotAngle, value):
+                    break  # stop refining outdated surface
+                key = (generation, plotAngle, stride, value)
+                mesh = self.meshes.get(key)
+                if mesh is None:
+                    volume = self.getVolume(generation, plotAngle, stride)
+                    if volume is None or self.isStale(generation, plotAngle, value):
+                        break
+                    minimum, maximum = self.ranges[(generation, plotAngle)]
+                    mesh = pg.isosurface(volume, minimum + value / 100 * (maximum - minimum))
+                    if self.isStale(generation, plotAngle, value):
+                        break  # do not cache surfaces of replaced files
+                    self.meshes[key] = mesh
+                    if len(self.meshes) > self.maxMeshes:
+                        self.meshes.popitem(last=False)  # remove least recently used
                 else:
-                    self.glAmplitudeView.addItem(m1)
+                    self.meshes.move_to_end(key)
+                self.signalComm.meshSignal.emit(plotAngle, stride, mesh[0], mesh[1], generation)
+
+    def getVolume(self, generation: int, plotAngle: bool, stride: int) -> 'np.ndarray | None':
+        """Return a downsampled volume of the angle or amplitude. Volumes are only read from file once.
+
+        The range used to map slider values is determined once per file from the first (coarsest) volume,
+        so that the same slider value results in the same threshold at all strides.
+
+        :param generation: Generation of the request.
+        :type generation: int
+        :param plotAngle: True for angle, False for amplitude
+        :type plotAngle: bool
+        :param stride: Use every stride th voxel in each dimension.
+        :type stride: int
+        :return: volume, None if the file has been replaced in the meantime.
+        :rtype: np.ndarray | None
+        """
+        key = (generation, plotAngle, stride)
+        if key not in self.volumes:
+            data = self.data
+            if data is None or generation != self.generation:
+                return None
+            data = data[::stride, ::stride, ::stride]
+            volume = np.ascontiguousarray(np.angle(data) if plotAngle else np.abs(data), dtype=np.float32)  # make c contiguous
+            if generation != self.generation:
+                return None  # do not cache volumes of replaced files
+            self.volumes[key] = volume
+            if (generation, plotAngle) not in self.ranges:
+                self.ranges[(generation, plotAngle)] = (float(volume.min()), float(volume.max()))
+        return self.volumes[key]
+
+    def drawMesh(self, plotAngle: bool, stride: int, verts: np.ndarray, faces: np.ndarray, generation: int) -> None:
+        """Draw an isosurface computed by the surfaceThread.
+
+        :param plotAngle: True for angle, False for amplitude
+        :type plotAngle: bool
+        :param stride: Downsampling of the volume used to compute the surface.
+        :type stride: int
+        :param verts: Vertexes of the surface.
+        :type verts: np.ndarray
+        :param faces: Faces of the surface.
+        :type faces: np.ndarray
+        :param generation: Generation of the request.
+        :type generation: int
+        """
+        if generation != self.generation or self.data is None or not self.initializedDock:
+            return
+        view = self.glAngleView if plotAngle else self.glAmplitudeView
+        view.clear()
+        md = gl.MeshData(vertexes=verts, faces=faces)
+        faceCount = md.faceCount()
+        if faceCount:
+            faceColors = np.ones((faceCount, 4), dtype=float)
+            faceColors[:, 3] = 0.2
+            faceColors[:, 2] = np.linspace(0, 1, faceColors.shape[0])
+            md.setFaceColors(faceColors)
+
+            m1 = gl.GLMeshItem(meshdata=md, smooth=True, shader='balloon')
+            m1.setGLOptions('additive')
+            m1.scale(stride, stride, stride)  # show downsampled surfaces at the same size
+            m1.translate(-self.data.shape[0] / 2, -self.data.shape[1] / 2, -self.data.shape[2] / 2)
+            view.addItem(m1)
+
+    def close(self) -> bool:  # noqa: D102
+        if hasattr(self, 'requestQueue'):
+            self.requestQueue.put(None)  # stop surfaceThread
+        return super().close()
 
     def generatePythonPlotCode(self) -> str:
         return f"""import pyqtgraph as pg
@@ -1,9 +1,17 @@
+import hashlib
+import warnings
 from pathlib import Path
+from threading import Thread
 
+import keyboard as kb
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.backend_bases import MouseButton, MouseEvent
+from PyQt6.QtCore import pyqtSignal
+from scipy.signal import find_peaks
 
-from esibd.core import PLUGINTYPE, MZCalculator, StateAction, colors, getDarkMode
+from esibd.core import PLUGINTYPE, PRINT, MZCalculator, StateAction, colors, getDarkMode, getValidConfigPath
 from esibd.plugins import Plugin
 
 
@@ -19,7 +27,9 @@ class MS(Plugin):
     quick estimate of charge state and mass, based on minimizing the standard
     deviation of the mass as a function of possible charge states. The
     detailed results are shown in the graph, and help to evaluate the
-    quality of the estimate. Use Ctrl + right mouse click to reset. In most cases you will need to create your own version of this plugin
+    quality of the estimate. Use Ctrl + right mouse click to reset. Clicks are snapped to the nearest peak.
+    The most intense peaks in the visible range are labeled. Large spectra are shown with a min/max envelope that is refined when zooming.
+    In most cases you will need to create your own version of this plugin
     that is inheriting from the built-in version and redefines how data is
     loaded for your specific data format. See :ref:`sec:plugin_system` for more information.
     """
@@ -29,19 +39,39 @@ class MS(Plugin):
     quick estimate of charge state and mass, based on minimizing the standard
     deviation of the mass as a function of possible charge states. The
     detailed results are shown in the graph, and help to evaluate the
-    quality of the estimate. Use Ctrl + right mouse click to reset.
+    quality of the estimate. Use Ctrl + right mouse click to reset. Clicks are snapped to the nearest peak.
+    The most intense peaks in the visible range are labeled. Large spectra are shown with a min/max envelope that is refined when zooming.
     """
 
     name = 'MS'
-    version = '1.0'
+    version = '1.1'
     pluginType = PLUGINTYPE.DISPLAY
     iconFile = 'MS.png'
+    maxPoints = 4000
+    """Maximum number of points or min/max pairs that are plotted."""
+    peakLabels = 5
+    """Number of peaks labeled in the visible range."""
+    skiprows = 10
+    """Number of header lines."""
+    maxSidecarSize = 500 * 1024**2
+    """Maximum total size in bytes of binary copies of spectra in the configuration path. The least recently used copies are removed first."""
+    signalComm: 'SignalCommunicate'
+
+    class SignalCommunicate(Plugin.SignalCommunicate):
+        """Bundle pyqtSignals."""
+
+        peaksFoundSignal = pyqtSignal(object, object, object)
+        """Emit file, peak positions, and peak intensities."""
 
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         self.previewFileTypes = ['.txt']
         self.file = Path()
         self._x = self._y = None
+        self.pyramids: dict[bool, list[tuple[np.ndarray, np.ndarray, np.ndarray]]] = {}  # paper style: levels of (x, min, max)
+        self.peakX = self.peakY = np.array([])
+        self.peakAnnotations = []
+        self.signalComm.peaksFoundSignal.connect(self.peaksFound)
         self.paperAction: 'StateAction | None' = None
         self.dataClipboardIcon = self.makeIcon('clipboard-paste-document-text.png')
 
@@ -56,7 +86,7 @@ class MS(Plugin):
             self.axes.append(self.fig.add_subplot(111))
             self.mzCalc.setAxis(self.axes[0])  # update axis but reuse picked positions until reset explicitly
         if self.canvas:
-            self.canvas.mpl_connect('button_press_event', self.mzCalc.msOnClick)
+            self.canvas.mpl_connect('button_press_event', self.msOnClick)
         self.line = None  # type: ignore  # noqa: PGH003 # self.axes[0].plot([],[])[0]  # dummy plot
 
     def provideDock(self) -> bool:
@@ -100,19 +130,225 @@ class MS(Plugin):
         self.provideDock()
         self.file = file
         self.mzCalc.clear()
-        self._x, self._y = np.loadtxt(self.file, skiprows=10, usecols=[0, 1], unpack=True)
+        self._x, self._y = self.loadSpectrum(file)
+        if self._x.shape[0] > 1 and np.any(np.diff(self._x) < 0):
+            sort_indices = self._x.argsort()  # sorted m/z required for zooming and peak lookup
+            self._x, self._y = self._x[sort_indices], self._y[sort_indices]
+        self.pyramids = {}
+        self.peakX = self.peakY = np.array([])
+        peakThread = Thread(target=self.findPeaks, args=(file, self._x, self._y), name=f'{self.name} peakThread')
+        peakThread.daemon = True
+        peakThread.start()
         self.plot()
         self.raiseDock(showPlugin)
 
+    def getSidecarFile(self, file: Path) -> Path:
+        """Return the binary copy of a spectrum. The name changes if the spectrum is modified.
+
+        :param file: The spectrum file.
+        :type file: pathlib.Path
+        :return: The .npy file in the configuration path.
+        :rtype: pathlib.Path
+        """
+        stat = file.stat()
+        return getValidConfigPath() / self.name / f'{hashlib.sha1(file.resolve().as_posix().encode()).hexdigest()}_{stat.st_size}_{stat.st_mtime_ns}.npy'  # noqa: S324
+
+    def loadSpectrum(self, file: Path) -> tuple[np.ndarray, np.ndarray]:
+        """Load m/z and intensity from a cached binary copy or parse the text file and create the binary copy.
+
+        :param file: The spectrum file.
+        :type file: pathlib.Path
+        :return: x, y
+        :rtype: tuple[np.ndarray, np.ndarray]
+        """
+        sidecar = self.getSidecarFile(file)
+        if sidecar.exists():
+            try:
+                data = np.load(sidecar)
+                sidecar.touch()  # mark as recently used
+                return data[0], data[1]
+            except (OSError, ValueError) as e:
+                self.print(f'Could not load {sidecar.name}: {e}', flag=PRINT.VERBOSE)
+        data = self.parseSpectrum(file)
+        try:
+            sidecar.parent.mkdir(parents=True, exist_ok=True)
+            for outdated in sidecar.parent.glob(f'{sidecar.name.split("_")[0]}_*.npy'):
+                outdated.unlink(missing_ok=True)
+            np.save(sidecar, data)
+            self.pruneSidecars(sidecar.parent)
+        except OSError as e:
+            self.print(f'Could not save {sidecar.name}: {e}', flag=PRINT.VERBOSE)
+        return data[0], data[1]
+
+    def pruneSidecars(self, directory: Path) -> None:
+        """Remove the least recently used binary copies of spectra beyond :attr:`~esibd.displays.ms.ms.MS.maxSidecarSize`.
+
+        :param directory: The directory containing the binary copies.
+        :type directory: pathlib.Path
+        """
+        totalSize = 0
+        sidecars = sorted(((sidecar, sidecar.stat()) for sidecar in directory.glob('*.npy')), key=lambda item: item[1].st_mtime, reverse=True)
+        for i, (sidecar, stat) in enumerate(sidecars):
+            totalSize += stat.st_size
+            if totalSize > self.maxSidecarSize and i > 0:  # always keep the most recent copy
+                sidecar.unlink(missing_ok=True)
+
+    def parseSpectrum(self, file: Path) -> np.ndarray:
+        """Parse the first two columns of a whitespace separated text file.
+
+        :param file: The spectrum file.
+        :type file: pathlib.Path
+        :return: Array with x and y in first and second row.
+        :rtype: np.ndarray
+        """
+        lines = file.read_bytes().split(b'\n', self.skiprows)
+        if len(lines) > self.skiprows:
+            body = lines[self.skiprows].decode(self.UTF8, errors='replace')
+            body = body.strip()
+            columns = len(body.split('\n', 1)[0].split())
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', DeprecationWarning)  # raised for invalid values, detected below
+                values = np.fromstring(body, sep=' ')  # parses all values in C, line breaks and tabs count as white space
+            if columns >= 2 and values.shape[0] == columns * (body.count('\n') + 1):  # noqa: PLR2004
+                return np.ascontiguousarray(values.reshape(-1, columns)[:, :2].T)
+        return np.loadtxt(file, skiprows=self.skiprows, usecols=[0, 1], unpack=True)  # fallback for unusual formats
+
+    def getPyramid(self, paperStyle: bool) -> list[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Return levels of min/max envelopes of the spectrum, each level has half the points of the previous one.
+
+        :param paperStyle: Use smoothed and normalized intensity.
+        :type paperStyle: bool
+        :return: Levels of x, minimum, maximum.
+        :rtype: list[tuple[np.ndarray, np.ndarray, np.ndarray]]
+        """
+        if paperStyle not in self.pyramids and self._x is not None and self._y is not None:
+            y = self.map_percent(self._x, self.smooth(self._y, 10)) if paperStyle else self._y  # computed once per file
+            levels = [(self._x, y, y)]
+            while levels[-1][0].shape[0] > self.maxPoints:
+                x, minimum, maximum = levels[-1]
+                indices = np.arange(0, x.shape[0], 2)
+                levels.append((x[indices], np.minimum.reduceat(minimum, indices), np.maximum.reduceat(maximum, indices)))
+            self.pyramids[paperStyle] = levels
+        return self.pyramids.get(paperStyle, [])
+
+    def getVisibleData(self, xlim: 'tuple[float, float] | None' = None) -> tuple[np.ndarray, np.ndarray]:
+        """Return data from the finest level that does not exceed maxPoints in the visible range.
+
+        :param xlim: Visible range, defaults to full range.
+        :type xlim: tuple[float, float], optional
+        :return: x, y
+        :rtype: tuple[np.ndarray, np.ndarray]
+        """
+        levels = self.getPyramid(bool(self.paperAction and self.paperAction.state))
+        if not levels:
+            return np.array([]), np.array([])
+        for i, (x, minimum, maximum) in enumerate(levels):
+            start, end = (0, x.shape[0]) if xlim is None else (max(int(np.searchsorted(x, xlim[0])) - 1, 0), int(np.searchsorted(x, xlim[1])) + 1)
+            if end - start <= self.maxPoints or i == len(levels) - 1:
+                if i == 0:
+                    return x[start:end], minimum[start:end]
+                return np.repeat(x[start:end], 2), np.column_stack((minimum[start:end], maximum[start:end])).ravel()  # envelope keeps all peaks visible
+        return np.array([]), np.array([])
+
+    def updateLine(self, ax: Axes) -> None:
+        """Replot visible range with suitable resolution and label peaks after zooming.
+
+        :param ax: The axis that changed its limits.
+        :type ax: matplotlib.axes.Axes
+        """
+        if self.line is not None and self.line.axes is ax:
+            xlim = ax.get_xlim()
+            self.line.set_data(*self.getVisibleData(xlim))
+            self.labelPeaks(xlim)
+            if self.canvas:
+                self.canvas.draw_idle()
+
+    def findPeaks(self, file: Path, x: np.ndarray, y: np.ndarray) -> None:
+        """Find peaks once after loading. Runs in peakThread.
+
+        :param file: The spectrum file.
+        :type file: pathlib.Path
+        :param x: m/z values.
+        :type x: np.ndarray
+        :param y: Intensities.
+        :type y: np.ndarray
+        """
+        if y.shape[0] > 2:  # noqa: PLR2004
+            noise = np.median(np.abs(y - np.median(y)))
+            indices, _ = find_peaks(y, prominence=max(5 * noise, (y.max() - y.min()) * 1e-3))
+            self.signalComm.peaksFoundSignal.emit(file, x[indices], y[indices])
+
+    def peaksFound(self, file: Path, peakX: np.ndarray, peakY: np.ndarray) -> None:
+        """Store peak table and label peaks.
+
+        :param file: The spectrum file.
+        :type file: pathlib.Path
+        :param peakX: Peak positions.
+        :type peakX: np.ndarray
+        :param peakY: Peak intensities.
+        :type peakY: np.ndarray
+        """
+        if file == self.file and self.axes:
+            self.peakX, self.peakY = peakX, peakY
+            self.labelPeaks(self.axes[0].get_xlim())
+            if self.canvas:
+                self.canvas.draw_idle()
+
+    def nearestPeak(self, x: float) -> 'tuple[float, float] | None':
+        """Return the peak nearest to x.
+
+        :param x: m/z value.
+        :type x: float
+        :return: m/z and intensity of peak, None if no peaks are known.
+        :rtype: tuple[float, float] | None
+        """
+        if not self.peakX.shape[0]:
+            return None
+        index = int(np.clip(np.searchsorted(self.peakX, x), 1, self.peakX.shape[0] - 1)) if self.peakX.shape[0] > 1 else 0
+        if index > 0 and abs(self.peakX[index - 1] - x) < abs(self.peakX[index] - x):
+            index -= 1
+        return float(self.peakX[index]), float(self.peakY[index])
+
+    def labelPeaks(self, xlim: tuple[float, float]) -> None:
+        """Label the most intense peaks in the visible range.
+
+        :param xlim: Visible range.
+        :type xlim: tuple[float, float]
+        """
+        for annotation in self.peakAnnotations:
+            annotation.remove()
+        self.peakAnnotations = []
+        if self.peakX.shape[0] and not (self.paperAction and self.paperAction.state):
+            start, end = np.searchsorted(self.peakX, xlim[0]), np.searchsorted(self.peakX, xlim[1])
+            for i in start + np.argsort(self.peakY[start:end])[::-1][:self.peakLabels]:
+                self.peakAnnotations.append(self.axes[0].annotate(f'{self.peakX[i]:.2f}', xy=(self.peakX[i], self.peakY[i]), xytext=(0, 3),
+                                                                  textcoords='offset points', ha='center', va='bottom', fontsize=8))
+
+    def msOnClick(self, event: MouseEvent) -> None:
+        """Snap Ctrl+left mouse clicks to the nearest peak before passing them to the m/z calculator.
+
+        :param event: The click event.
+        :type event: MouseEvent
+        """
+        if event.button == MouseButton.LEFT and kb.is_pressed('ctrl') and event.xdata and event.ydata and not (self.paperAction and self.paperAction.state):
+            peak = self.nearestPeak(event.xdata)
+            if peak:
+                self.mzCalc.addMZ(*peak)
+                return
+        self.mzCalc.msOnClick(event)
+
     def plot(self) -> None:
         """Plot MS data."""
         self.axes[0].clear()
+        self.axes[0].callbacks.connect('xlim_changed', self.updateLine)  # clear replaces the callback registry
+        self.peakAnnotations = []  # removed by clear
+        self.line = None
         self.axes[0].set_xlabel('m/z (Th)')
         if self.paperAction and self.paperAction.state:
             self.axes[0].spines['right'].set_visible(False)
             self.axes[0].spines['top'].set_visible(False)
             if self._x is not None and self._y is not None:
-                self.line = self.axes[0].plot(self._x, self.map_percent(self._x, self.smooth(self._y, 10)),
+                self.line = self.axes[0].plot(*self.getVisibleData(),
                                             color=colors.fg if plt.rcParams['axes.facecolor'] == colors.bg else colors.bg)[0]
             self.axes[0].set_ylabel('')
             self.axes[0].set_ylim((1, 100 + 2))
@@ -121,7 +357,7 @@ class MS(Plugin):
         else:
             self.axes[0].set_ylabel('Intensity')
             if self._x is not None and self._y is not None:
-                self.line = self.axes[0].plot(self._x, self._y)[0]
+                self.line = self.axes[0].plot(*self.getVisibleData())[0]
             self.axes[0].ticklabel_format(axis='y', style='sci', scilimits=(0, 0))  # use shared exponent for short y labels, even for smaller numbers
 
         self.axes[0].set_autoscale_on(True)
@@ -134,6 +370,8 @@ class MS(Plugin):
             self.canvas.get_default_filename = lambda: self.file.with_suffix('.pdf').as_posix() if self.file else self.name  # set up save file dialog
         self.mzCalc.update_mass_to_charge()
         self.labelPlot('' if self.paperAction and self.paperAction.state else (self.file.name if self.file else self.name))
+        if self.line is not None:
+            self.labelPeaks(self.axes[0].get_xlim())
 
     def find_nearest(self, array, value) -> float:
         """Return the nearest value in the given array.
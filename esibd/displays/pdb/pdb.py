@@ -1,8 +1,12 @@
+import mmap
+import re
 from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
 import numpy as np
+from Bio.PDB.MMCIFParser import MMCIFParser
 from Bio.PDB.PDBParser import PDBParser
+from matplotlib.backend_bases import MouseEvent
 from mpl_toolkits.mplot3d.axes3d import Axes3D
 
 from esibd.core import PLUGINTYPE, PRINT
@@ -18,27 +22,44 @@ def providePlugins() -> 'list[type[Plugin]]':
 
 
 class PDB(Plugin):
-    """The PDB plugin allows to display atoms defined in the .pdb and .pdb1 file formats used by the protein data bank.
+    """The PDB plugin allows to display atoms defined in the .pdb, .pdb1, and .cif file formats used by the protein data bank.
 
     While the visualization is
     not very sophisticated it may get you started on interacting
     programmatically with those files.
+    Large structures are shown with a subset of atoms while rotating and in full detail otherwise.
     """
 
     name = 'PDB'
-    version = '1.0'
+    version = '1.1'
     pluginType = PLUGINTYPE.DISPLAY
     iconFile = 'pdb.png'
+    lodAtoms = 20000
+    """Maximum number of atoms shown while rotating."""
+    CIF_TOKEN = re.compile(rb"'.*?'(?=\s|$)|\".*?\"(?=\s|$)|\S+")
+    """CIF values. Quotes only end a value if followed by white space, e.g. in atom names like "O5'"."""
 
     axes: list[Axes3D]
 
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
-        self.previewFileTypes = ['.pdb', '.pdb1']
+        self.previewFileTypes = ['.pdb', '.pdb1', '.cif']
+
+    def supportsFile(self, file: Path) -> bool:
+        if super().supportsFile(file):
+            if file.suffix.lower() != '.cif':
+                return True
+            try:  # small molecule CIF files use fractional coordinates and are not supported
+                with file.open('rb') as cifFile, mmap.mmap(cifFile.fileno(), 0, access=mmap.ACCESS_READ) as cifMap:
+                    return cifMap.find(b'_atom_site.Cartn_x') != -1
+            except (OSError, ValueError):  # ValueError for empty files
+                return False
+        return False
 
     def initGUI(self) -> None:
         self.file = Path()
         self._x = self._y = self.z = None
+        self.fullScatter = self.lodScatter = None
         super().initGUI()
         self.initFig()
 
@@ -46,6 +67,9 @@ class PDB(Plugin):
         self.provideFig()
         if self.fig:
             self.axes.append(cast('Axes3D', self.fig.add_subplot(111, projection='3d')))
+        if self.canvas:
+            self.canvas.mpl_connect('button_press_event', self.mouseEvent)
+            self.canvas.mpl_connect('button_release_event', self.mouseEvent)
 
     def provideDock(self) -> bool:
         if super().provideDock():
@@ -65,22 +89,86 @@ class PDB(Plugin):
         super().runTestParallel()
 
     def get_structure(self, pdb_file: Path) -> 'tuple[Structure, np.ndarray] | tuple[None, None]':  # read PDB file
-        """Get structure and XYZ coordinates from pdb file.
+        """Get structure and XYZ coordinates from pdb or mmCIF file.
 
         :param pdb_file: PDB input file.
         :type pdb_file: pathlib.Path
         :return: PDBParser object, XYZ
         :rtype: PDBParser, np.ndarray
         """
-        structure = PDBParser(QUIET=True).get_structure('', pdb_file)
+        parser = MMCIFParser(QUIET=True) if pdb_file.suffix.lower() == '.cif' else PDBParser(QUIET=True)
+        structure = parser.get_structure('', pdb_file)
         if structure:
             return structure, np.array([atom.get_coord() for atom in structure.get_atoms()])
         return None, None
 
+    def read_coordinates(self, file: Path) -> 'np.ndarray | None':
+        """Read XYZ coordinates of all atoms without creating a structure.
+
+        :param file: PDB or mmCIF input file.
+        :type file: pathlib.Path
+        :return: XYZ, None if the file format is not supported.
+        :rtype: np.ndarray
+        """
+        content = file.read_bytes()
+        if file.suffix.lower() == '.cif':
+            return self.read_cif_coordinates(content)
+        lines = [line for line in content.splitlines() if line[:6] in {b'ATOM  ', b'HETATM'} and line[16:17] in {b'', b' ', b'A'}]  # skip alternative locations
+        if not lines:
+            return None
+        columns = np.array(lines, dtype='S54').view(np.uint8).reshape(-1, 54)  # fixed columns, shorter lines are padded
+        return np.ascontiguousarray(columns[:, 30:54]).view('S8').astype(np.float32)  # x, y, z are 8 character fields starting at column 31
+
+    def read_cif_coordinates(self, content: bytes) -> 'np.ndarray | None':
+        """Read XYZ coordinates from the atom_site loop of an mmCIF file.
+
+        :param content: mmCIF file content.
+        :type content: bytes
+        :return: XYZ, None if the file does not contain an atom_site loop.
+        :rtype: np.ndarray
+        """
+        lines = content.splitlines()
+        keys = []
+        start = 0
+        for i, line in enumerate(lines):
+            if line.startswith(b'_atom_site.'):
+                keys.append(line.split()[0][len(b'_atom_site.'):])
+                start = i + 1
+            elif keys:
+                break
+        if not keys or any(key not in keys for key in (b'Cartn_x', b'Cartn_y', b'Cartn_z')):
+            return None
+        end = start
+        while end < len(lines) and not lines[end].startswith((b'#', b'loop_', b'_')):
+            end += 1
+        block = b' '.join(lines[start:end])
+        if b"'" in block or b'"' in block:  # quoted values may contain white space
+            tokens = np.array(self.CIF_TOKEN.findall(block))
+        else:
+            tokens = np.array(block.split())
+        if not tokens.size or tokens.size % len(keys):
+            return None
+        table = tokens.reshape(-1, len(keys))
+        columns = [keys.index(key) for key in (b'Cartn_x', b'Cartn_y', b'Cartn_z')]
+        if b'label_alt_id' in keys:  # skip alternative locations
+            altID = table[:, keys.index(b'label_alt_id')]
+            table = table[(altID == b'.') | (altID == b'A')]
+        return table[:, columns].astype(np.float32)
+
     def loadData(self, file, showPlugin=True) -> None:
         self.provideDock()
         self.file = file
-        _, XYZ = self.get_structure(file)
+        try:
+            XYZ = self.read_coordinates(file)
+        except ValueError as e:
+            self.print(f'Using Bio.PDB to read {file.name}: {e}', flag=PRINT.VERBOSE)
+            XYZ = None
+        if XYZ is None:
+            try:
+                _, XYZ = self.get_structure(file)  # fallback for unusual files
+            except Exception as e:  # noqa: BLE001  # Bio.PDB raises various exceptions for unsupported content
+                self.print(f'Could not read {file.name}: {e}', flag=PRINT.WARNING)
+                return
         if XYZ is not None:
             self._x, self._y, self.z = XYZ[:, 0], XYZ[:, 1], XYZ[:, 2]
             self.plot()
@@ -90,8 +178,14 @@ class PDB(Plugin):
 
     def plot(self) -> None:
         self.axes[0].clear()
+        self.fullScatter = self.lodScatter = None
         if self._x is not None:
-            self.axes[0].scatter(self._x, self._y, self.z, marker='.', s=2)  # type: ignore  # noqa: PGH003 # matplotlib type hinting incomplete
+            self.fullScatter = self.axes[0].scatter(self._x, self._y, self.z, marker='.', s=2)  # type: ignore  # noqa: PGH003 # matplotlib type hinting incomplete
+            if self._x.shape[0] > self.lodAtoms:
+                step = int(np.ceil(self._x.shape[0] / self.lodAtoms))
+                self.lodScatter = self.axes[0].scatter(self._x[::step], self._y[::step], self.z[::step], marker='.', s=2 * step**(2 / 3),  # type: ignore  # noqa: PGH003
+                                                       color=self.fullScatter.get_facecolor())
+                self.lodScatter.set_visible(False)
         self.set_axes_equal(self.axes[0])
         self.axes[0].set_autoscale_on(True)
         self.axes[0].relim()
@@ -101,6 +195,19 @@ class PDB(Plugin):
             self.canvas.get_default_filename = lambda: self.file.with_suffix('.pdf').as_posix() if self.file else self.name  # set up save file dialog
             self.canvas.draw_idle()
 
+    def mouseEvent(self, event: MouseEvent) -> None:
+        """Show subset of atoms while rotating large structures and all atoms when released.
+
+        :param event: The mouse event.
+        :type event: MouseEvent
+        """
+        if self.lodScatter and self.fullScatter and self.canvas:
+            rotating = event.name == 'button_press_event' and event.inaxes == self.axes[0]
+            if self.lodScatter.get_visible() != rotating:
+                self.lodScatter.set_visible(rotating)
+                self.fullScatter.set_visible(not rotating)
+                self.canvas.draw_idle()
+
     def set_axes_equal(self, ax) -> None:
         """Make axes of 3D plot have equal scale so that spheres appear as spheres, cubes as cubes, etc.
 
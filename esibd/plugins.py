@@ -11,15 +11,23 @@ import ast
 import configparser
 import contextlib
 import gc
+import hashlib
 import inspect
 import io
 import itertools
+import json
 import os
+import queue
+import re
+import shlex
+import sqlite3
 import sys
+import threading
 import time
 import timeit
+from collections import deque
 from collections.abc import Callable
-from datetime import datetime
+from datetime import datetime, timedelta
 from itertools import islice
 from pathlib import Path
 from threading import Thread, Timer, current_thread, main_thread
@@ -41,7 +49,7 @@ from matplotlib.figure import Figure
 from matplotlib.text import Annotation
 from packaging.version import InvalidVersion
 from PyQt6 import QtCore
-from PyQt6.QtCore import QLoggingCategory, QObject, QRectF, QSize, Qt, QTimer, QUrl, pyqtSignal  # , QRect
+from PyQt6.QtCore import QFileSystemWatcher, QLoggingCategory, QObject, QRectF, QSize, Qt, QTimer, QUrl, pyqtSignal  # , QRect
 from PyQt6.QtGui import QAction, QFont, QIcon, QImage, QTextCursor  # , QPixmap, QScreen, QColor, QKeySequence, QShortcut, QTreeWidget
 from PyQt6.QtWebEngineCore import QWebEnginePage, QWebEngineSettings
 from PyQt6.QtWebEngineWidgets import QWebEngineView
@@ -64,11 +72,11 @@ from PyQt6.QtWidgets import (
     QSizePolicy,
     QSpinBox,
     QSplitter,
+    QTextEdit,
     QToolBar,
     QToolButton,
     QTreeWidget,
     QTreeWidgetItem,
-    QTreeWidgetItemIterator,
     QVBoxLayout,
     QWidget,
     QWidgetAction,
@@ -172,6 +180,9 @@ class Plugin(QWidget):  # noqa: PLR0904
     """Axis used for plot labels."""
     resizing: bool = False
     """Indicate if the plugin is resizing. May be used to increase performance by suppressing updates while resizing."""
+    deferGUI: bool = False
+    """If True, a dock that is hidden behind other tabs on startup only contains the titleBar until it becomes visible for the first time
+       or the application is idle after startup. Only use for plugins whose GUI is not accessed by other plugins during startup."""
     testTimeout: int = 60
     """"""
 
@@ -213,6 +224,7 @@ class Plugin(QWidget):  # noqa: PLR0904
         self.copyAction = None
         self.initializedGUI = False
         self.initializedDock = False  # visible in GUI, some plugins will only appear when needed to display specific content
+        self.deferredGUI = False  # dock has been added as a placeholder, see deferGUI
         self.dependencyPath = dependencyPath
         self.sourceCodePath = sourceCodePath
         self.dataClipboardIcon = self.makeCoreIcon('clipboard-paste-document-text.png')
@@ -562,10 +574,17 @@ class Plugin(QWidget):  # noqa: PLR0904
         Always call from the main_thread.
         """
         mw = self.pluginManager.mainWindow
+        if self.deferredGUI:
+            self.initDeferredGUI()
+            return False  # dock already exists and has been finalized
         if not self.initializedDock:
             self.print('provideDock', flag=PRINT.DEBUG)
             self.loading = True
-            self.initGUI()
+            deferGUI = self.deferGUI and self.pluginManager.loading
+            if deferGUI:
+                Plugin.initGUI(self)  # only create titleBar and layouts required by the dock
+            else:
+                self.initGUI()
             self.initDock()
             if self.pluginType in {PLUGINTYPE.CHANNELMANAGER, PLUGINTYPE.INPUTDEVICE, PLUGINTYPE.OUTPUTDEVICE, PLUGINTYPE.CONTROL, PLUGINTYPE.SCAN}:
                 if self.pluginManager.firstControl:
@@ -589,6 +608,11 @@ class Plugin(QWidget):  # noqa: PLR0904
                 else:
                     self.pluginManager.firstDisplay = self
                     mw.splitDockWidget(self.pluginManager.firstControl.dock, self.dock, Qt.Orientation.Horizontal)
+            if deferGUI and self.dock:
+                self.deferredGUI = True
+                self.loading = False
+                self.dock.visibilityChanged.connect(self.dockVisibilityChanged)
+                return False  # initializedDock remains False until initDeferredGUI, so the placeholder is ignored by finalizeInit and other plugins
             self.initializedDock = True  # only True after initializing and adding dock to GUI
             self.loading = False
             if not self.pluginManager.finalizing and not self.pluginManager.loading:
@@ -597,12 +621,38 @@ class Plugin(QWidget):  # noqa: PLR0904
             return True  # dock has been created
         return False  # dock already exists
 
+    def dockVisibilityChanged(self, visible: bool) -> None:
+        """Build a deferred GUI as soon as the dock becomes visible.
+
+        :param visible: Visibility of the dock.
+        :type visible: bool
+        """
+        if visible and self.deferredGUI and not self.pluginManager.loading and not self.pluginManager.finalizing:
+            QTimer.singleShot(0, self.initDeferredGUI)  # complete visibility change before building GUI
+
+    def initDeferredGUI(self) -> None:
+        """Build the GUI of a plugin that has been added as a placeholder during startup. See :attr:`~esibd.plugins.Plugin.deferGUI`."""
+        if not self.deferredGUI:
+            return
+        self.print('initDeferredGUI', flag=PRINT.DEBUG)
+        self.deferredGUI = False
+        self.loading = True
+        self.initGUI()  # base GUI already exists and will not be created again
+        self.initializedDock = True
+        self.loading = False
+        self.videoRecorder = VideoRecorder(parentPlugin=self)
+        self.finalizeInit()
+        self.afterFinalizeInit()
+        self.toggleTitleBarDelayed()
+
     def raiseDock(self, showPlugin: bool = True) -> None:
         """Raise :attr:`dock<esibd.plugins.Plugin.dock>` if showPlugin is True.
 
         :param showPlugin: Only show one plugin, even though multiple plugins may load a file, defaults to True
         :type showPlugin: bool, optional
         """
+        if showPlugin and self.deferredGUI:
+            self.initDeferredGUI()
         if showPlugin and self.dock and self.initializedDock:
             QTimer.singleShot(0, self.dock.raise_)  # give time for UI to draw before raising the dock
 
@@ -1190,7 +1240,8 @@ class Plugin(QWidget):  # noqa: PLR0904
         """
         self.close()
         self.disconnect_all_signals()
-        if self.dock and self.initializedDock:
+        if self.dock and (self.initializedDock or self.deferredGUI):
+            self.deferredGUI = False
             self.pluginManager.mainWindow.removeDockWidget(self.dock)
             self.dock.setParent(None)
             self.dock.deleteLater()
@@ -2178,6 +2229,9 @@ class ChannelManager(Plugin):  # noqa: PLR0904
     """Use record monitors and compare them to set points."""
     useOnOffLogic = False
     """Creates an Action in the DeviceManager that handles turning key functions on and off."""
+    useVirtualTree = False
+    """Use a :class:`~esibd.core.ChannelTreeView` that only paints visible rows and creates editors on demand instead of a widget per Parameter.
+    Recommended for devices with thousands of channels. Keep disabled if the device accesses Parameter widgets directly."""
 
     class ChannelPlot(Plugin):
         """Simplified version of the Line plugin for plotting channels."""
@@ -2252,7 +2306,7 @@ class ChannelManager(Plugin):  # noqa: PLR0904
         self.staticDisplay = self.StaticDisplay(parentPlugin=self, **kwargs) if self.useDisplays else None  # type: ignore  # noqa: PGH003 # need to initialize to access previewFileTypes
         self.liveDisplay = self.LiveDisplay(parentPlugin=self, **kwargs) if self.useDisplays else None  # type: ignore  # noqa: PGH003
         if self.useDisplays and self.liveDisplay:
-            self.signalComm.plotSignal.connect(self.liveDisplay.plot)
+            self.signalComm.plotSignal.connect(self.plotLiveDisplay)
         self.dataThread = None
 
     def initGUI(self) -> None:  # noqa: D102
@@ -2276,7 +2330,7 @@ class ChannelManager(Plugin):  # noqa: PLR0904
                                               toolTipTrue=f'Hide {self.name} live display.', iconTrue=self.makeCoreIcon('system-monitor--minus.png'),
                                               attr='showLiveDisplay', event=lambda: self.toggleLiveDisplay(visible=None), defaultState=True)
         self.defaultChannel = self.channelType(channelParent=self, tree=None)  # needs to run in main_thread as it creates QWidgets!
-        self.tree = TreeWidget()
+        self.tree = ChannelTreeView() if self.useVirtualTree else TreeWidget()
         self.addContentWidget(self.tree)
         self.loadConfiguration(useDefaultFile=True)
 
@@ -2537,6 +2591,16 @@ class ChannelManager(Plugin):  # noqa: PLR0904
         if self.liveDisplayActive() and self.liveDisplay:
             self.liveDisplay.plot(apply=apply)
 
+    def plotLiveDisplay(self, apply: bool = False) -> None:
+        """Plot new data in the liveDisplay. Records the duration as hot path, including overrides of LiveDisplay.plot.
+
+        :param apply: Apply most recent data, otherwise update rate depends on data thinning, defaults to False
+        :type apply: bool, optional
+        """
+        if self.liveDisplay:
+            with hotPathMetrics.measure('LiveDisplay.plot'):
+                self.liveDisplay.plot(apply=apply)
+
     def clearPlot(self) -> None:
         """Clear the plot in the liveDisplay."""
         if self.liveDisplayActive() and self.liveDisplay and not self.pluginManager.closing:
@@ -2593,6 +2657,7 @@ class ChannelManager(Plugin):  # noqa: PLR0904
                 with h5py.File(file, 'a', track_order=True) as h5file:
                     self.hdfUpdateVersion(h5file)
                     group = self.requireGroup(h5file, self.name)
+                    channelDicts = [channel.asDict(includeTempParameters=True) for channel in self.channels]  # collect all values in one pass
                     for parameter in self.defaultChannel.asDict(includeTempParameters=True):
                         if parameter in group:
                             self.print(f'Ignoring duplicate parameter {parameter}.', flag=PRINT.WARNING)
@@ -2600,7 +2665,7 @@ class ChannelManager(Plugin):  # noqa: PLR0904
                         parameterType = self.defaultChannel.getParameterByName(parameter).parameterType
                         # Using default channel data type. If the plugin uses multiple channel specific data types it has to make sure
                         # that saving and restoring works for all of them using the data type of the default channel.
-                        data = [channel.getParameterByName(parameter).value for channel in self.channels]
+                        data = [channelDict.get(parameter) for channelDict in channelDicts]
                         dtype = None
                         if parameterType == PARAMETERTYPE.INT:
                             dtype = np.int32
@@ -2609,13 +2674,13 @@ class ChannelManager(Plugin):  # noqa: PLR0904
                         elif parameterType == PARAMETERTYPE.BOOL:
                             dtype = np.bool_  # used to be bool8
                         elif parameterType == PARAMETERTYPE.COLOR:
-                            data = [channel.getParameterByName(parameter).value for channel in self.channels]
                             dtype = 'S7'
                         else:  # parameterType in [PARAMETERTYPE.EXP, PARAMETERTYPE.COMBO, PARAMETERTYPE.INTCOMBO, PARAMETERTYPE.TEXT, PARAMETERTYPE.LABEL]:
                             # NOTE data = [cast('str', value).encode(UTF8) for value in data]  # keep using ascii for backwards compatibility
                             data = [str(value).replace('°', '') for value in data]  # remove characters that are incompatible with ascii
-                            dtype = f'S{len(max([str(string) for string in data], key=len))}'  # use length of longest string as fixed length is required
-                        group.create_dataset(name=parameter, data=np.asarray(data, dtype=dtype))  # do not save as attributes. very very memory intensive!
+                            dtype = f'S{max(len(string) for string in data)}'  # use length of longest string as fixed length is required
+                        # one typed array per parameter. do not save as attributes. very very memory intensive!
+                        group.create_dataset(name=parameter, data=np.asarray(data, dtype=dtype))
         if not self.pluginManager.loading:
             self.pluginManager.Explorer.populateTree()
 
@@ -2658,6 +2723,7 @@ class ChannelManager(Plugin):  # noqa: PLR0904
         self.lagging = 0  # reset as lag time is calculated based on interval.
         self.interval_tolerance = max(100, self.interval / 5)  # larger margin for error if interval is large.
 
+    @traceStartup
     def loadConfiguration(self, file: 'Path | None' = None, useDefaultFile: bool = False, append: bool = False) -> None:  # noqa: C901, PLR0912, PLR0915
         """Load :class:`channel<esibd.core.Channel>` configuration from file.
 
@@ -2708,22 +2774,7 @@ class ChannelManager(Plugin):  # noqa: PLR0904
             else:  # file.suffix == FILE_H5:
                 with h5py.File(name=file, mode='r', track_order=True) as h5file:
                     if self.name in h5file:
-                        group = cast('h5py.Group', h5file[self.name])
-                        names = cast('h5py.Dataset', group[Parameter.NAME])
-                        items = [{} for _ in range(len(names))]
-                        for i, name in enumerate(datasetToStrList(cast('h5py.Dataset', names))):
-                            items[i][Parameter.NAME] = name
-                        for name, parameter in self.defaultChannel.getSortedDefaultChannel().items():
-                            values = None
-                            if parameter[Parameter.PARAMETER_TYPE] in {PARAMETERTYPE.INT, PARAMETERTYPE.FLOAT}:
-                                values = cast('h5py.Dataset', group[name])
-                            elif parameter[Parameter.PARAMETER_TYPE] == PARAMETERTYPE.BOOL:
-                                values = [str(bool_str) for bool_str in cast('h5py.Dataset', group[name])]
-                            else:
-                                values = datasetToStrList(cast('h5py.Dataset', group[name]))
-                            for i, value in enumerate(values):
-                                items[i][name] = value
-                        self.updateChannelConfig(items, file, append=append)
+                        self.updateChannelConfig(self.readConfigurationColumns(cast('h5py.Group', h5file[self.name])), file, append=append)
                     else:
                         self.print(f'Could not find group with name {self.name} in {file}. Check if this is the correct file.', flag=PRINT.ERROR)
 
@@ -2766,22 +2817,60 @@ class ChannelManager(Plugin):  # noqa: PLR0904
             file = Path(QFileDialog.getOpenFileName(parent=None, caption=SELECTFILE, filter=self.FILTER_INI_H5)[0])
         if file != Path():
             self.changeLog = [f'Change log for loading values for {self.name} from {file.name}:']
-            if file.suffix == FILE_INI:
-                confParser = configparser.ConfigParser()
-                confParser.read(file)
-                for name, item in confParser.items():
-                    if name not in {Parameter.DEFAULT.upper(), VERSION, INFO}:
-                        self.updateChannelValue(cast('str', item.get(Parameter.NAME)), float(item.get(Parameter.VALUE, '0')))
-            else:  # FILE_H5
-                with h5py.File(name=file, mode='r', track_order=True) as h5file:
-                    group = cast('h5py.Group', h5file[self.name])
-                    for name, value in zip(datasetToStrList(cast('h5py.Dataset', group[Parameter.NAME])), cast('h5py.Dataset', group[Parameter.VALUE]), strict=True):
-                        self.updateChannelValue(name, value)
+            with self.changeTransaction():
+                if file.suffix == FILE_INI:
+                    confParser = configparser.ConfigParser()
+                    confParser.read(file)
+                    for name, item in confParser.items():
+                        if name not in {Parameter.DEFAULT.upper(), VERSION, INFO}:
+                            self.updateChannelValue(cast('str', item.get(Parameter.NAME)), float(item.get(Parameter.VALUE, '0')))
+                else:  # FILE_H5
+                    with h5py.File(name=file, mode='r', track_order=True) as h5file:
+                        group = cast('h5py.Group', h5file[self.name])
+                        for name, value in zip(datasetToStrList(cast('h5py.Dataset', group[Parameter.NAME])), cast('h5py.Dataset', group[Parameter.VALUE])[()].tolist(),
+                                               strict=True):
+                            self.updateChannelValue(name, value)
             if len(self.changeLog) == 1:
                 self.changeLog.append('No changes.')
             self.pluginManager.Text.setText('\n'.join(self.changeLog) + '\n', showPlugin=False, append=append)
             self.print('Values updated. Change log available in Text plugin.')
 
+    def readConfigurationColumns(self, group: h5py.Group) -> list[dict[str, ParameterType]]:
+        """Read channel items from a configuration group.
+
+        Each parameter is stored as a column and read with a single access instead of element by element.
+
+        :param group: The group containing one dataset per parameter.
+        :type group: h5py.Group
+        :return: List of channel items.
+        :rtype: list[dict[str, ParameterType]]
+        """
+        columns: dict[str, list] = {Parameter.NAME: datasetToStrList(cast('h5py.Dataset', group[Parameter.NAME]))}
+        for name, parameter in self.defaultChannel.getSortedDefaultChannel().items():
+            if name == Parameter.NAME:
+                continue
+            if name not in group:  # missing parameters will be initialized with default values
+                continue
+            dataset = cast('h5py.Dataset', group[name])
+            if parameter[Parameter.PARAMETER_TYPE] in {PARAMETERTYPE.INT, PARAMETERTYPE.FLOAT}:
+                columns[name] = dataset[()].tolist()
+            elif parameter[Parameter.PARAMETER_TYPE] == PARAMETERTYPE.BOOL:
+                columns[name] = [str(value) for value in dataset[()].tolist()]
+            else:
+                columns[name] = datasetToStrList(dataset)
+        return [dict(zip(columns, values, strict=True)) for values in zip(*columns.values(), strict=True)]
+
+    def changeTransaction(self) -> ChangeTransaction:
+        """Return the shared :class:`~esibd.core.ChangeTransaction`.
+
+        Use ``with channelManager.changeTransaction():`` when changing many channels at once.
+        Events and extraEvents of changed Parameters are dispatched once at the end, followed by a single globalUpdate.
+
+        :return: The transaction.
+        :rtype: ChangeTransaction
+        """
+        return Parameter.changeTransaction
+
     def updateChannelValue(self, name: str, value: float) -> None:
         """Update channel value und adds message to change log if the value has changed.
 
@@ -2823,7 +2912,7 @@ class ChannelManager(Plugin):  # noqa: PLR0904
         self.tree.clear()
         for item in items:
             self.addChannel(item=item)
-            if np.mod(len(self.channels), 5) == 0:
+            if np.mod(len(self.channels), 100 if self.useVirtualTree else 5) == 0:  # virtual channels are cheap, avoid overhead of frequent event processing
                 self.processEvents()
         if not self.pluginManager.loading:
             self.pluginManager.connectAllSources()  # previous channels have become invalid
@@ -2840,8 +2929,9 @@ class ChannelManager(Plugin):  # noqa: PLR0904
         """
         changeLog = []
         changed = True
+        channels = {channel.name.strip().lower(): channel for channel in reversed(self.channels)}  # same result as getChannelByName without searching for every item
         for item in items:
-            channel = self.getChannelByName(cast('str', item[Parameter.NAME]))
+            channel = channels.get(str(item[Parameter.NAME]).strip().lower())
             if channel:
                 for name in self.defaultChannel.getSortedDefaultChannel():
                     if name in channel.tempParameters():
@@ -2855,7 +2945,7 @@ class ChannelManager(Plugin):  # noqa: PLR0904
                         changeLog.append(f'Updating parameter {name} on channel {channel.name} from {parameter.formatValue()} to {parameter.formatValue(item[name])}')
             else:
                 changeLog.append(f'Adding channel {item[Parameter.NAME]}')
-        newNames = [item[Parameter.NAME] for item in items]
+        newNames = {item[Parameter.NAME] for item in items}
         changeLog.extend(f'Removing channel {channel.name}' for channel in self.getChannels() if channel.name not in newNames)
         if len(changeLog) == 0:
             changeLog.append('No changes.')
@@ -3420,6 +3510,7 @@ class Device(ChannelManager):  # noqa: PLR0904
         self.restoreOutputData()
 
     @synchronized()
+    @hotPath
     def exportOutputData(self, useDefaultFile: bool = False, useAllHistory: bool = False) -> None:
         """Export output data.
 
@@ -3447,6 +3538,8 @@ class Device(ChannelManager):  # noqa: PLR0904
             self.exportConfiguration(file=self.file)
         else:
             self.pluginManager.DeviceManager.exportConfiguration(file=self.file)  # save corresponding device settings in measurement file
+            if hasattr(self.pluginManager, 'Catalog'):
+                self.pluginManager.Catalog.addFile(self.file)
             self.pluginManager.Explorer.populateTree()
 
     def appendOutputData(self, h5file: h5py.File, useAllHistory: bool = False) -> None:
@@ -3499,6 +3592,7 @@ class Device(ChannelManager):  # noqa: PLR0904
                                                                  else parameter.values.get(), dtype='f')
                 parameter_dataset.attrs[UNIT] = parameter.unit
 
+    @traceStartup
     def restoreOutputData(self) -> None:  # noqa: C901
         """Restore data from internal restore file."""
         file = Path(self.pluginManager.Settings.configPath) / self.confh5.strip('_')
@@ -3563,6 +3657,20 @@ class Device(ChannelManager):  # noqa: PLR0904
             return
         self.updating = True  # prevent recursive call caused by changing values from here
         channels = self.pluginManager.DeviceManager.channels(inout=INOUT.BOTH)
+        # events are not deferred while evaluating, so relay channels are updated before the next iteration reads them
+        self.evaluateEquations(N, channels)
+        if self.inout == INOUT.IN:
+            self.applyValues(apply)
+        self.updating = False
+
+    def evaluateEquations(self, N: int, channels: list[Channel]) -> None:  # noqa: C901, PLR0912
+        """Assign values of all channels with equations.
+
+        :param N: Number of iterations.
+        :type N: int
+        :param channels: All channels that may be referenced in equations.
+        :type channels: list[esibd.core.Channel]
+        """
         channelNames = [channel.name for channel in channels]
         channelNames.sort(reverse=True, key=len)  # avoid replacing a subset of a longer name with a matching shorter name of another channel
         for _ in range(N):  # go through parsing N times, in case the dependencies are not ordered  # noqa: PLR1702
@@ -3594,9 +3702,6 @@ class Device(ChannelManager):  # noqa: PLR0904
                     else:
                         self.print(f'Could not evaluate equation of {channel.name}: {channel.equation} as {equ}')
                         channel.value = np.nan
-        if self.inout == INOUT.IN:
-            self.applyValues(apply)
-        self.updating = False
 
     def toggleRecording(self, on: 'bool | None' = None, manual: bool = False) -> None:  # noqa: ARG002, D102
         if (on is not None and not on) or (on is None and self.recording):
@@ -3622,6 +3727,7 @@ class Device(ChannelManager):  # noqa: PLR0904
                 channel.clearHistory()
             self.time = DynamicNp(max_size=self.maxDataPoints, dtype=np.float64)
 
+    @hotPath
     def appendData(self, nan: bool = False, skipPlotting: bool = False) -> None:
         """Append data from device acquisition to channels and updates plots.
 
@@ -3794,6 +3900,7 @@ class Scan(Plugin):  # noqa: PLR0904
     SCAN = 'Scan'
     INPUTCHANNELS = INPUTCHANNELS
     OUTPUTCHANNELS = OUTPUTCHANNELS
+    OUTPUTCHANNELSSTD = f'{OUTPUTCHANNELS} Std'
     MYBLUE = '#1f77b4'
     MYGREEN = '#00aa00'
     MYRED = '#d62728'
@@ -3804,8 +3911,6 @@ class Scan(Plugin):  # noqa: PLR0904
        channel data should be displayed."""
     useInvalidWhileWaiting: bool = False
     """Enable setting to ignore values while stabilizing."""
-    measurementsPerStep: int
-    """Number of measurements per step based on the average time and acquisition rate."""
     display: 'Scan.Display'  # | None rather ignore here once that check every where
     """The internal plugin used to display scan data."""
     runThread: 'Thread | None'
@@ -3958,7 +4063,6 @@ class Scan(Plugin):  # noqa: PLR0904
         self.configINI = f'{self.name}.ini'
         self.previewFileTypes = [self.configINI, f'{self.name.lower()}.h5']
         self.useDisplayChannel = False
-        self.measurementsPerStep = 0
         self.oldDisplayItems = ''
         self._dummy_initialization = False
         self.stepProcessed = True
@@ -4272,9 +4376,6 @@ class Scan(Plugin):  # noqa: PLR0904
                 self.print('Not all input channels initialized.', flag=PRINT.WARNING)
             initialized = False
         if initialized:
-            device = self.outputChannels[self.getOutputIndex()].getDevice()
-            if not self.loading and not self._dummy_initialization and isinstance(device, ChannelManager):
-                self.measurementsPerStep = max(int(self.average / device.interval) - 1, 1)
             if not self._dummy_initialization:
                 self.toggleDisplay(visible=True)
             self.updateFile()
@@ -4306,7 +4407,8 @@ class Scan(Plugin):  # noqa: PLR0904
             # note np.zeros works better than np.full(len, np.nan) as some plots give unexpected results when given np.nan
         if self.DISPLAY in self.getDefaultSettings():
             for name in self.settingsMgr.settings[self.DISPLAY].items:
-                self.addOutputChannel(name=name, recordingData=recordingData.copy() if recordingData is not None else None)
+                self.addOutputChannel(name=name, recordingData=recordingData.copy() if recordingData is not None else None,
+                                      recordingDataStd=np.full_like(recordingData, np.nan) if recordingData is not None else None)
             self.channelTree.setHeaderLabels([parameterDict.get(Parameter.HEADER, '') or name.title()
                                             for name, parameterDict in self.headerChannel.getSortedDefaultChannel().items()])
             self.toggleAdvanced(advanced=False)
@@ -4314,7 +4416,7 @@ class Scan(Plugin):  # noqa: PLR0904
             self.channelTree.hide()
 
     def addOutputChannel(self, name: str, unit: str = '', recordingData: 'np.ndarray | DynamicNp | None' = None,  # noqa: C901, PLR0912
-                          recordingBackground: 'np.ndarray | None' = None) -> ScanChannel | None:
+                          recordingBackground: 'np.ndarray | None' = None, recordingDataStd: 'np.ndarray | DynamicNp | None' = None) -> ScanChannel | None:
         """Convert channel to generic output data.
 
         Uses data from file if provided.
@@ -4327,6 +4429,8 @@ class Scan(Plugin):  # noqa: PLR0904
         :type recordingData: np.ndarray, optional
         :param recordingBackground: Recorded background values from previous scan or initialized array for new scan, defaults to None
         :type recordingBackground: np.ndarray, optional
+        :param recordingDataStd: Standard deviation of recorded values from previous scan or initialized array for new scan, defaults to None
+        :type recordingDataStd: np.ndarray, optional
         :return: Generic channel that is used to store and restore scan data.
         :rtype: esibd.core.ScanChannel
         """
@@ -4370,6 +4474,8 @@ class Scan(Plugin):  # noqa: PLR0904
             outputChannel.recordingData = recordingData  # type: ignore  # noqa: PGH003
         if recordingBackground is not None:
             outputChannel.recordingBackground = recordingBackground
+        if recordingDataStd is not None:
+            outputChannel.recordingDataStd = recordingDataStd
         if ((self.loading and outputChannel.recordingData is not None) or sourceInitialized):
             self.outputChannels.append(outputChannel)
         return outputChannel
@@ -4555,6 +4661,22 @@ class Scan(Plugin):  # noqa: PLR0904
                 except ValueError as e:
                     self.print(f'Cannot create dataset for channel {output.name}: {e}', flag=PRINT.ERROR)
 
+            # uncertainties are stored in separate group to keep output group compatible with existing scripts and file formats
+            std_group = None
+            for output in self.outputChannels:
+                outputStd = output.getRecordingDataStd()
+                if outputStd is None:
+                    continue
+                if std_group is None:
+                    std_group = self.requireGroup(top_group, self.OUTPUTCHANNELSSTD)
+                if output.name in std_group:
+                    continue
+                try:
+                    dataset = std_group.create_dataset(name=output.name, data=outputStd, track_order=True)
+                    dataset.attrs[self.UNIT] = output.unit
+                except ValueError as e:
+                    self.print(f'Cannot create standard deviation dataset for channel {output.name}: {e}', flag=PRINT.ERROR)
+
     def loadData(self, file: Path, showPlugin: bool = True) -> None:  # noqa: D102
         if file.name.endswith(self.configINI):
             return  # will be handled by Text plugin
@@ -4594,8 +4716,10 @@ class Scan(Plugin):  # noqa: PLR0904
                 else:
                     self.addInputChannel(name=name, unit=data.attrs[self.UNIT], recordingData=data[:])
             output_group = cast('h5py.Group', group[self.OUTPUTCHANNELS])
+            std_group = cast('h5py.Group', group[self.OUTPUTCHANNELSSTD]) if self.OUTPUTCHANNELSSTD in group else None
             for name, data in output_group.items():
-                self.addOutputChannel(name=name, unit=data.attrs[self.UNIT], recordingData=data[:])
+                self.addOutputChannel(name=name, unit=data.attrs[self.UNIT], recordingData=data[:],
+                                      recordingDataStd=std_group[name][:] if std_group is not None and name in std_group else None)
             self.finalizeChannelTree()
         return True
 
@@ -4659,7 +4783,7 @@ output_index = next((i for i, output in enumerate(outputChannels) if output.name
                     self.finished = False
                     self.stepProcessed = True
                     self.plot(update=False, done=False)  # init plot without data, some widgets may be able to update data only without redrawing the rest
-                    self.runThread = Thread(target=self.runScan, args=(lambda: self.recording,), name=f'{self.name} runThread')
+                    self.runThread = Thread(target=self.measureRunScan, args=(lambda: self.recording,), name=f'{self.name} runThread')
                     self.runThread.daemon = True
                     self.runThread.start()
                     self.display.raiseDock()
@@ -4707,6 +4831,8 @@ output_index = next((i for i, output in enumerate(outputChannels) if output.name
         self.saveData(file=file)  # save data to same file
         self.pluginManager.DeviceManager.exportConfiguration(file=file)  # save corresponding device settings in measurement file
         self.pluginManager.Settings.saveSettings(file=file)
+        if hasattr(self.pluginManager, 'Catalog'):
+            self.pluginManager.Catalog.addFile(file)
         self.signalComm.saveScanCompleteSignal.emit()
         self.print(f'Saved {file.name}')
 
@@ -4746,6 +4872,52 @@ output_index = next((i for i, output in enumerate(outputChannels) if output.name
         """
         self.recording = recording
 
+    def getOutputStepStatistics(self, t_min: float, t_max: float) -> 'list[StepStatistics | None]':
+        """Aggregate the values of all output channels that have been recorded within a time window.
+
+        The values of all recording channels of a device are reduced at once.
+        Channels that are not recording, e.g. virtual output channels, use their current value.
+
+        :param t_min: Start of the time window in s, typically the time at which the step has settled.
+        :type t_min: float
+        :param t_max: End of the time window in s.
+        :type t_max: float
+        :return: Statistics in order of outputChannels. None for channels without device.
+        :rtype: list[StepStatistics | None]
+        """
+        stepStatistics: list[StepStatistics | None] = [None] * len(self.outputChannels)
+        indexWindows = {}  # search time axis only once per device
+        deviceValues: dict[Device, tuple[list[int], list[np.ndarray]]] = {}
+        for j, outputChannel in enumerate(self.outputChannels):
+            outputChannelDevice = outputChannel.getDevice()
+            if not isinstance(outputChannelDevice, Device):
+                continue
+            if outputChannel.recording:
+                values = outputChannel.getStepValues(t_min=t_min, t_max=t_max, subtractBackground=outputChannelDevice.subtractBackgroundActive(), indexWindows=indexWindows)
+                if values is not None:
+                    indices, rows = deviceValues.setdefault(outputChannelDevice, ([], []))
+                    indices.append(j)
+                    rows.append(values)
+            else:  # e.g. a virtual output channel that is not recording
+                stepStatistics[j] = StepStatistics.fromValues(np.array([outputChannel.value], dtype=np.float64))
+        for indices, rows in deviceValues.values():
+            if len({row.shape[0] for row in rows}) == 1:
+                deviceStatistics = StepStatistics.fromRows(np.vstack(rows))
+            else:  # e.g. channel added while recording
+                deviceStatistics = [StepStatistics.fromValues(row) for row in rows]
+            for j, statistics in zip(indices, deviceStatistics, strict=True):
+                stepStatistics[j] = statistics
+        return stepStatistics
+
+    def measureRunScan(self, recording: Callable) -> None:
+        """Run the scan and record its duration as hot path, including overrides of runScan. Executed in runThread.
+
+        :param recording: Queries recording state.
+        :type recording: Callable
+        """
+        with hotPathMetrics.measure('Scan.runScan'):
+            self.runScan(recording)
+
     def runScan(self, recording: Callable) -> None:  # noqa: C901, PLR0912
         """Step through input values, records output values, and triggers plot update.
 
@@ -4767,26 +4939,26 @@ output_index = next((i for i, output in enumerate(outputChannels) if output.name
                 for outputChannel in self.outputChannels:
                     if isinstance(outputChannel, ScanChannel):
                         outputChannel.signalComm.waitUntilStableSignal.emit(self.waitLong if waitLong else self.wait)
-            time.sleep(((self.waitLong if waitLong else self.wait) + self.average) / 1000)  # if step is larger than threshold use longer wait time
+            time.sleep((self.waitLong if waitLong else self.wait) / 1000)  # if step is larger than threshold use longer wait time
+            settledTime = time.time()
+            time.sleep(self.average / 1000)
+            stepTime = time.time()
             self.bufferLagging()
             self.waitForCondition(condition=lambda: self.stepProcessed, timeoutMessage='processing scan step.', timeout=10)
-            for outputChannel in self.outputChannels:
-                outputChannelDevice = outputChannel.getDevice()
-                if isinstance(outputChannelDevice, Device):
-                    if outputChannel.recording:
-                        outputChannelValues = outputChannel.getValues(subtractBackground=outputChannelDevice.subtractBackgroundActive(), length=self.measurementsPerStep)
-                    else:  # e.g. a virtual output channel that is not recording
-                        outputChannelValues = outputChannel.value
-                    if outputChannelValues is not None and outputChannel.recordingData is not None and isinstance(outputChannel, ScanChannel):
-                        if not np.isnan(np.mean(outputChannelValues)):
-                            if len(self.inputChannels) == 1:  # 1D scan
-                                outputChannel.recordingData[i] = np.mean(outputChannelValues)
-                            else:  # 2D scan, higher dimensions not jet supported
-                                inputRecordingData1 = self.inputChannels[1].getRecordingData()
-                                if inputRecordingData1 is not None:
-                                    outputChannel.recordingData[i % len(inputRecordingData1), i // len(inputRecordingData1)] = np.mean(outputChannelValues)
-                        else:
-                            self.print('Ignoring nan value', flag=PRINT.DEBUG)
+            for outputChannel, stepStatistics in zip(self.outputChannels, self.getOutputStepStatistics(t_min=settledTime, t_max=stepTime), strict=True):
+                if stepStatistics is not None and outputChannel.recordingData is not None and isinstance(outputChannel, ScanChannel):
+                    if stepStatistics.count > 0:
+                        if len(self.inputChannels) == 1:  # 1D scan
+                            index = i
+                        else:  # 2D scan, higher dimensions not jet supported
+                            inputRecordingData1 = self.inputChannels[1].getRecordingData()
+                            index = (i % len(inputRecordingData1), i // len(inputRecordingData1)) if inputRecordingData1 is not None else None
+                        if index is not None:
+                            outputChannel.recordingData[index] = stepStatistics.mean
+                            if isinstance(outputChannel.recordingDataStd, np.ndarray):
+                                outputChannel.recordingDataStd[index] = stepStatistics.std
+                    else:
+                        self.print('Ignoring nan value', flag=PRINT.DEBUG)
             if i == len(steps) - 1 or not recording():  # last step
                 for inputChannel in self.inputChannels:
                     if inputChannel.updateValueSignal:
@@ -4846,6 +5018,7 @@ class Browser(Plugin):
     optional = False
     pluginType = PLUGINTYPE.DISPLAY
     iconFile = 'QWebEngine.png'
+    deferGUI = True  # QWebEngineView and version check are only created after startup, all access to the GUI goes through provideDock
 
     def __init__(self, **kwargs) -> None:
         """Initialize a Browser."""
@@ -5062,6 +5235,8 @@ class Text(Plugin):
     In addition, it may contain
     information such as change logs after loading settings or
     configurations from file. It also allows to edit and save simple text files.
+    Files larger than :attr:`~esibd.plugins.Text.largeFileSize` are shown read only, one page at a time.
+    Use the scroll bar next to the text to navigate, the search field to find text, and follow the end of log files that are still being written.
     """
 
     name = 'Text'
@@ -5070,6 +5245,10 @@ class Text(Plugin):
     pluginType = PLUGINTYPE.DISPLAY
     iconFile = 'text.png'
     iconFileDark = 'text_dark.png'
+    largeFileSize = 2 * 1024**2
+    """Files larger than this are memory mapped and shown one page at a time."""
+    pageLines = 1000
+    """Number of lines shown at once for large files."""
 
     signalComm: 'SignalCommunicate'
 
@@ -5077,22 +5256,41 @@ class Text(Plugin):
         """Bundle pyqtSignals."""
 
         setTextSignal = pyqtSignal(str, bool)
+        indexProgressSignal = pyqtSignal()
+        foundSignal = pyqtSignal(int, str, int)
 
     def __init__(self, **kwargs) -> None:  # noqa: D107
         super().__init__(**kwargs)
         self.previewFileTypes = ['.txt', '.dat', '.ter', '.cur', '.tt', '.log', '.py', '.star', '.pdb1', '.css', '.js', '.html', '.tex', '.ini', '.bat']
         self.signalComm.setTextSignal.connect(self.setText)
-        self.lineLimit = 10000
+        self.signalComm.indexProgressSignal.connect(self.indexProgress)
+        self.signalComm.foundSignal.connect(self.showFound)
+        self.mappedFile: 'MappedTextFile | None' = None
+        self.indexThread: 'Thread | None' = None
+        self.firstLine = 0
+        self.searchOffset = 0
+        self.searchId = 0  # incremented for every search to discard results of outdated searches
 
     def initGUI(self) -> None:  # noqa: D102
         super().initGUI()
         self.editor = TextEdit()
         self.editor.setFont(QFont('Courier', 10))
         self.numbers = NumberBar(parent=self.editor)
+        self.pageScrollBar = QScrollBar(Qt.Orientation.Vertical)  # navigates pages of large files
+        self.pageScrollBar.valueChanged.connect(self.showLines)
+        self.pageScrollBar.setVisible(False)
         lay = QHBoxLayout()
         lay.addWidget(self.numbers)
         lay.addWidget(self.editor)
+        lay.addWidget(self.pageScrollBar)
         self.addContentLayout(lay)
+        self.followTimer = QTimer()
+        self.followTimer.timeout.connect(self.followFile)
+        self.followTimer.setInterval(1000)
+        self.searchTimer = QTimer()
+        self.searchTimer.timeout.connect(lambda: self.find(restart=True))
+        self.searchTimer.setSingleShot(True)
+        self.searchTimer.setInterval(300)
 
     def provideDock(self) -> bool:  # noqa: D102
         if super().provideDock():
@@ -5108,6 +5306,20 @@ class Text(Plugin):
                                                   toolTipTrue='Word wrap off.', before=self.aboutAction, attr='wordWrap')
         self.textClipboardAction = self.addAction(event=self.copyTextClipboard,
                        toolTip='Copy text to clipboard.', icon=self.makeCoreIcon('clipboard-paste-document-text.png'), before=self.aboutAction)
+        self.endAction = self.addAction(event=self.showEnd, toolTip='Go to end of file.', icon=self.makeCoreIcon('table-down.png'), before=self.aboutAction)
+        self.followAction = self.addStateAction(event=self.toggleFollow, toolTipFalse='Follow end of file.', iconFalse=self.makeCoreIcon('arrow-circle-315.png'),
+                                                toolTipTrue='Stop following end of file.', before=self.aboutAction, attr='follow', restore=False)
+        self.searchLineEdit = QLineEdit()
+        self.searchLineEdit.setMaximumWidth(100)
+        self.searchLineEdit.setMinimumWidth(50)
+        self.searchLineEdit.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
+        self.searchLineEdit.setPlaceholderText('Find')
+        self.searchLineEdit.setToolTip('Find text. Press enter to find next.')
+        self.searchLineEdit.textChanged.connect(self.searchTimer.start)
+        self.searchLineEdit.returnPressed.connect(self.find)
+        if self.titleBar:
+            self.titleBar.insertWidget(self.aboutAction, self.searchLineEdit)
+        self.updateLargeFileMode()
         self.toggleWordWrap()
 
     def runTestParallel(self) -> None:  # noqa: D102
@@ -5134,21 +5346,182 @@ class Text(Plugin):
 
     def loadData(self, file: Path, showPlugin: bool = True) -> None:  # noqa: D102
         self.provideDock()
+        self.closeMappedFile()
         self.editor.clear()
         if any(file.name.endswith(fileType) for fileType in self.previewFileTypes):
-            try:
-                with file.open(encoding=self.UTF8) as dataFile:
-                    for i, line in enumerate(islice(dataFile, self.lineLimit)):  # dont use f.read() as files could potentially be very large
-                        self.editor.insertPlainText(line)  # always populate text box but only change to tab if no other display method is available
-                        if i == self.lineLimit - 1:
-                            self.print(f'Limited display to {self.lineLimit} lines.', flag=PRINT.WARNING)
-            except UnicodeDecodeError as e:
-                self.print(f'Cant read file: {e}')
+            if file.stat().st_size > self.largeFileSize:
+                self.mappedFile = MappedTextFile(file)
+                self.updateLargeFileMode()
+                self.indexMappedFile()
+                self.showLines(0)  # first page does not require index
+            else:
+                try:
+                    self.editor.setPlainText(file.read_text(encoding=self.UTF8))  # always populate text box but only change to tab if no other display method is available
+                except UnicodeDecodeError as e:
+                    self.print(f'Cant read file: {e}')
         verticalScrollBar = self.editor.verticalScrollBar()
         if verticalScrollBar:
             verticalScrollBar.triggerAction(QScrollBar.SliderAction.SliderToMinimum)   # scroll to top
         self.raiseDock(showPlugin)
 
+    def updateLargeFileMode(self) -> None:
+        """Show controls for large files only when needed."""
+        largeFile = self.mappedFile is not None
+        self.editor.setReadOnly(largeFile)
+        self.pageScrollBar.setVisible(largeFile)
+        if hasattr(self, 'endAction'):
+            self.endAction.setVisible(largeFile)
+            self.followAction.setVisible(largeFile)
+        if not largeFile:
+            self.numbers.lineOffset = 0
+
+    def closeMappedFile(self) -> None:
+        """Return to normal mode after showing a large file."""
+        if self.mappedFile:
+            self.mappedFile.close()  # stops indexThread and searchThread
+            self.mappedFile = None
+            self.indexThread = None
+            self.searchId += 1  # discard pending search results
+            self.followTimer.stop()
+            if hasattr(self, 'followAction'):
+                self.followAction.state = False
+            self.updateLargeFileMode()
+
+    def indexMappedFile(self) -> None:
+        """Index lines of the large file in a separate thread.
+
+        If the indexThread is still running, it will also index parts of the file that have been mapped in the meantime.
+        """
+        mappedFile = self.mappedFile
+        if not mappedFile or (self.indexThread and self.indexThread.is_alive()):
+            return
+
+        def progress() -> None:
+            if not mappedFile.stop and not self.pluginManager.closing:
+                self.signalComm.indexProgressSignal.emit()
+
+        self.indexThread = Thread(target=mappedFile.index, args=(progress,), name=f'{self.name} indexThread')
+        self.indexThread.daemon = True
+        self.indexThread.start()
+
+    def indexProgress(self) -> None:
+        """Update navigation after every indexed chunk of the large file."""
+        if not self.mappedFile:
+            return
+        self.pageScrollBar.blockSignals(True)
+        self.pageScrollBar.setRange(0, max(0, self.mappedFile.lineCount - self.pageLines + 1))
+        self.pageScrollBar.setPageStep(self.pageLines)
+        self.pageScrollBar.blockSignals(False)
+        if self.followAction.state:
+            self.showEnd()
+
+    def showLines(self, firstLine: int) -> None:
+        """Show a page of the large file.
+
+        :param firstLine: Number of the first line starting at 0.
+        :type firstLine: int
+        """
+        if not self.mappedFile:
+            return
+        self.firstLine = max(0, min(firstLine, self.mappedFile.lineCount))
+        self.numbers.lineOffset = self.firstLine
+        self.editor.setPlainText(self.mappedFile.readLines(self.firstLine, self.pageLines))
+        self.numbers.update_width(str(self.firstLine + self.pageLines))
+        self.numbers.update()
+        if self.pageScrollBar.value() != self.firstLine:
+            self.pageScrollBar.blockSignals(True)
+            self.pageScrollBar.setValue(self.firstLine)
+            self.pageScrollBar.blockSignals(False)
+
+    def showEnd(self) -> None:
+        """Show the last page of the large file."""
+        if self.mappedFile:
+            self.showLines(self.mappedFile.lineCount - self.pageLines + 1)
+            verticalScrollBar = self.editor.verticalScrollBar()
+            if verticalScrollBar:
+                verticalScrollBar.triggerAction(QScrollBar.SliderAction.SliderToMaximum)
+
+    def toggleFollow(self) -> None:
+        """Start or stop following the end of a large file that is still being written."""
+        if self.followAction.state and self.mappedFile:
+            self.showEnd()
+            self.followTimer.start()
+        else:
+            self.followTimer.stop()
+
+    def followFile(self) -> None:
+        """Index and show lines that have been added to the large file."""
+        try:
+            if self.mappedFile and self.mappedFile.refresh():
+                self.indexMappedFile()  # shows end of file when complete
+        except OSError as e:
+            self.print(f'Stopped following file: {e}', flag=PRINT.WARNING)
+            self.followAction.state = False
+            self.followTimer.stop()
+
+    def find(self, restart: bool = False) -> None:
+        """Find the next occurrence of the search text.
+
+        Large files are searched in a separate thread and the result is shown by :meth:`~esibd.plugins.Text.showFound`.
+
+        :param restart: Start searching from the beginning of the current page, e.g. while typing. Defaults to False
+        :type restart: bool, optional
+        """
+        text = self.searchLineEdit.text()
+        if not text:
+            return
+        if not self.mappedFile:
+            if restart:
+                self.editor.moveCursor(QTextCursor.MoveOperation.Start)
+            if not self.editor.find(text):
+                self.editor.moveCursor(QTextCursor.MoveOperation.Start)  # wrap around
+                self.editor.find(text)
+            return
+        if restart:
+            self.searchOffset = self.mappedFile.lineStart(self.firstLine)
+        self.searchId += 1
+        mappedFile, searchId, searchOffset = self.mappedFile, self.searchId, self.searchOffset
+
+        def search() -> None:
+            offset = mappedFile.find(text, searchOffset, stop=lambda: searchId != self.searchId or self.pluginManager.closing)
+            if searchId == self.searchId and not mappedFile.stop and not self.pluginManager.closing:
+                self.signalComm.foundSignal.emit(searchId, text, offset)
+
+        searchThread = Thread(target=search, name=f'{self.name} searchThread')
+        searchThread.daemon = True
+        searchThread.start()
+
+    def showFound(self, searchId: int, text: str, offset: int) -> None:
+        """Show the result of a search in a large file.
+
+        :param searchId: Identifies the search. Results of outdated searches are ignored.
+        :type searchId: int
+        :param text: The search text.
+        :type text: str
+        :param offset: Byte offset of the match or -1 if not found.
+        :type offset: int
+        """
+        if searchId != self.searchId or not self.mappedFile:
+            return
+        if offset == -1:
+            self.print(f'{text} not found after line {self.mappedFile.lineAt(self.searchOffset) + 1}.')
+            self.searchOffset = 0  # start from beginning on next search
+            return
+        if offset >= self.mappedFile.indexedBytes:
+            self.print('Found text in part of the file that is still being indexed. Please try again in a moment.', flag=PRINT.WARNING)
+            return
+        self.searchOffset = offset + 1
+        line = self.mappedFile.lineAt(offset)
+        if not self.firstLine <= line < self.firstLine + self.pageLines:
+            self.showLines(max(0, line - self.pageLines // 2))
+        document = self.editor.document()
+        if document:
+            block = document.findBlockByNumber(line - self.firstLine)
+            cursor = document.find(text, block.position())
+            if not cursor.isNull():
+                self.editor.setTextCursor(cursor)
+                self.editor.centerCursor()
+
     def setText(self, text: str, showPlugin: bool = False, append: bool = False) -> None:
         """Set the displayed text.
 
@@ -5160,6 +5533,7 @@ class Text(Plugin):
         :type append: bool, optional
         """
         self.provideDock()
+        self.closeMappedFile()
         if append:
             self.editor.appendPlainText(text)
         else:
@@ -5205,14 +5579,16 @@ class Text(Plugin):
 
 
 class Tree(Plugin):
-    """Give an overview of the content of .py, .hdf5, and .h5 files.
+    """Give an overview of the content of .py, .hdf5, .h5, and .json files.
 
-    This includes configuration or scan files and even python source code.
+    This includes configuration or scan files, python source code, and startup timelines.
+    Timelines in Chrome trace format show nested phases and their durations.
     It can also help inspect any object using Tree.inspect() or give an overview of icons using Tree.iconOverview() from the :ref:`sec:console`.
     """
 
-    documentation = """The Tree plugin gives an overview of the content of .py, .hdf5, and
-    .h5 files. This includes configuration or scan files and even python source code.
+    documentation = """The Tree plugin gives an overview of the content of .py, .hdf5, .h5, and
+    .json files. This includes configuration or scan files, python source code, and startup timelines.
+    Timelines in Chrome trace format show nested phases and their durations.
     It can also help inspect any object using Tree.inspect() or give an overview of icons using Tree.iconOverview() from the Console.
     """
 
@@ -5221,12 +5597,16 @@ class Tree(Plugin):
     optional = False
     pluginType = PLUGINTYPE.DISPLAY
     iconFile = 'tree.png'
+    hdfPageSize = 200
+    """Maximum number of items that are shown at once for each hdf5 group. Further items are shown on request."""
 
     def __init__(self, **kwargs) -> None:  # noqa: D107
         super().__init__(**kwargs)
+        self.hdfFile: 'Path | None' = None  # hdf5 files are only opened to populate expanded groups or generate previews
         self.h5PreviewFileTypes = ['.hdf5', '.h5']
         self.pyPreviewFileTypes = ['.py']
-        self.previewFileTypes = self.h5PreviewFileTypes + self.pyPreviewFileTypes
+        self.jsonPreviewFileTypes = ['.json']
+        self.previewFileTypes = self.h5PreviewFileTypes + self.pyPreviewFileTypes + self.jsonPreviewFileTypes
         self.ICON_ATTRIBUTE = str(self.dependencyPath / 'blue-document-attribute.png')
         self.ICON_DATASET = str(self.dependencyPath / 'database-medium.png')
         self.ICON_FUNCTIONMETHOD = str(self.dependencyPath / 'block-small.png')
@@ -5239,6 +5619,9 @@ class Tree(Plugin):
         self.tree = TreeWidget()
         self.addContentWidget(self.tree)
         self.tree.itemExpanded.connect(self.expandObject)
+        self.tree.itemActivated.connect(self.activateItem)
+        self.tree.setMouseTracking(True)  # required for itemEntered
+        self.tree.itemEntered.connect(self.enterItem)
         self.tree.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.tree.customContextMenuRequested.connect(self.initContextMenu)
 
@@ -5266,11 +5649,26 @@ class Tree(Plugin):
         self.tree.setHeaderHidden(True)
         self.tree.setColumnWidth(0, max(self.tree.columnWidth(0), 200))
         self._inspect = False
+        self.hdfFile = None
         if any(file.name.endswith(fileType) for fileType in self.h5PreviewFileTypes):
             invisibleRootItem = self.tree.invisibleRootItem()
             if invisibleRootItem:
+                self.hdfFile = file
                 with h5py.File(file, 'r', track_order=True) as dataFile:
                     self.hdfShow(dataFile, invisibleRootItem, 0)
+        elif any(file.name.endswith(fileType) for fileType in self.jsonPreviewFileTypes):
+            invisibleRootItem = self.tree.invisibleRootItem()
+            if invisibleRootItem:
+                try:
+                    with file.open(encoding=self.UTF8) as jsonFile:
+                        content = json.load(jsonFile)
+                except json.JSONDecodeError as e:
+                    self.print(f'Could not parse file {file.name}: {e}', flag=PRINT.ERROR)
+                    return
+                if isinstance(content, dict) and 'traceEvents' in content:
+                    self.traceShow(content['traceEvents'], invisibleRootItem)
+                else:
+                    self.jsonShow(content, invisibleRootItem, 0)
         else:  # self.pyPreviewFileTypes
             # """from https://stackoverflow.com/questions/44698193/how-to-get-a-list-of-classes-and-functions-from-a-python-file-without-importing/67840804#67840804"""
             try:
@@ -5298,6 +5696,8 @@ class Tree(Plugin):
     def filterTree(self, parentItem: 'QTreeWidgetItem | None' = None) -> bool:
         """Filter content based on filterLineEdit.text.
 
+        Groups that have not been populated yet and placeholders for further pages stay visible, as their content has not been read.
+
         :param parentItem: The item to be filtered, defaults to None
         :type parentItem: QTreeWidgetItem, optional
         :return: True if widget is visible
@@ -5313,11 +5713,17 @@ class Tree(Plugin):
         for item in children:
             if self.filterTree(item):
                 show = True  # show if filter matches at least one child
+        if ((parentItem.childCount() == 0 and parentItem.childIndicatorPolicy() == QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator)
+                or isinstance(getattr(parentItem, 'obj', None), tuple)):
+            show = True  # content of unpopulated groups and pages that are not yet shown is unknown and may match
         parentItem.setHidden(not show)
         return show
 
-    def hdfShow(self, hdfItem: h5py.Group | h5py.File, tree: QTreeWidgetItem, expansionLevel: int) -> None:
-        """Populate tree based on contents of a hdf5 file.
+    def hdfShow(self, hdfItem: h5py.Group | h5py.File, tree: QTreeWidgetItem, expansionLevel: int, offset: int = 0) -> None:
+        """Populate tree based on contents of a hdf5 group.
+
+        Only the direct children are added. Groups are populated when they are expanded, previews of datasets are generated when they are hovered,
+        and large groups are shown in pages of :attr:`~esibd.plugins.Tree.hdfPageSize` items.
 
         :param hdfItem: HDF Group
         :type hdfItem: h5py.Group | h5py.Dataset | h5py.File, ...
@@ -5325,23 +5731,137 @@ class Tree(Plugin):
         :type tree: QTreeWidgetItem
         :param expansionLevel: Only expand items up to this level.
         :type expansionLevel: int
-        """
-        for name, item in hdfItem.items():
+        :param offset: Index of the first item to be shown, defaults to 0
+        :type offset: int, optional
+        """
+        if offset == 0 and not isinstance(hdfItem, h5py.File):
+            for attribute, value in hdfItem.attrs.items():
+                attribute_str = f'{attribute}: {value}'
+                attribute_widget = QTreeWidgetItem(tree, [attribute_str.split('\n', maxsplit=1)[0]])
+                attribute_widget.setIcon(0, QIcon(self.ICON_ATTRIBUTE))
+                attribute_widget.setToolTip(0, attribute_str)
+        for name in islice(hdfItem, offset, offset + self.hdfPageSize):  # only reads names of items that are shown
+            item = hdfItem.get(name)
             if isinstance(item, h5py.Group):
-                groupItem = QTreeWidgetItem(tree, [name])
+                groupItem = TreeWidgetItem(tree, [name])
                 groupItem.setIcon(0, QIcon(self.ICON_GROUP))
+                groupItem.obj = item.name
+                groupItem.setChildIndicatorPolicy(QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator)  # populated when expanded
                 if expansionLevel < 1:
+                    self.hdfShow(item, groupItem, expansionLevel + 1)
                     groupItem.setExpanded(True)
-                for attribute, value in item.attrs.items():
-                    attribute_str = f'{attribute}: {value}'
-                    attribute_widget = QTreeWidgetItem(groupItem, [attribute_str.split('\n', maxsplit=1)[0]])
-                    attribute_widget.setIcon(0, QIcon(self.ICON_ATTRIBUTE))
-                    attribute_widget.setToolTip(0, attribute_str)
-                self.hdfShow(item, groupItem, expansionLevel + 1)
             elif isinstance(item, h5py.Dataset):
-                dataset_widget = QTreeWidgetItem(tree, [name])
+                dataset_widget = TreeWidgetItem(tree, [name])
                 dataset_widget.setIcon(0, QIcon(self.ICON_DATASET))
-                dataset_widget.setToolTip(0, self.get_hdf5_preview(item))
+                dataset_widget.obj = item.name
+        remaining = len(hdfItem) - offset - self.hdfPageSize
+        if remaining > 0:
+            moreItem = TreeWidgetItem(tree, [f'... {remaining} more items. Double click to show next {min(remaining, self.hdfPageSize)}.'])
+            moreItem.obj = (hdfItem.name, offset + self.hdfPageSize)
+
+    def expandHdfItem(self, item: TreeWidgetItem) -> None:
+        """Populate an expanded hdf5 group.
+
+        :param item: The item representing the group.
+        :type item: TreeWidgetItem
+        """
+        try:
+            with h5py.File(self.hdfFile, 'r', track_order=True) as dataFile:
+                group = dataFile.get(item.obj)
+                if isinstance(group, h5py.Group):
+                    self.hdfShow(group, item, expansionLevel=1)
+        except OSError as e:
+            self.print(f'Could not read {item.obj} from {self.hdfFile}: {e}', flag=PRINT.ERROR)
+        if item.childCount() == 0:
+            item.setChildIndicatorPolicy(QTreeWidgetItem.ChildIndicatorPolicy.DontShowIndicatorWhenChildless)
+        self.filterTree()
+
+    def activateItem(self, item: QTreeWidgetItem, column: int) -> None:  # noqa: ARG002  # pylint: disable = missing-param-doc
+        """Show the next page of items when the placeholder at the end of a large hdf5 group is activated.
+
+        :param item: The activated item.
+        :type item: QTreeWidgetItem
+        """
+        obj = getattr(item, 'obj', None)
+        if not self.hdfFile or not isinstance(obj, tuple):
+            return
+        parent = item.parent() or self.tree.invisibleRootItem()
+        if not parent:
+            return
+        parent.removeChild(item)
+        name, offset = obj
+        try:
+            with h5py.File(self.hdfFile, 'r', track_order=True) as dataFile:
+                group = dataFile.get(name)
+                if isinstance(group, h5py.Group):
+                    self.hdfShow(group, parent, expansionLevel=1, offset=offset)
+        except OSError as e:
+            self.print(f'Could not read {name} from {self.hdfFile}: {e}', flag=PRINT.ERROR)
+        self.filterTree()
+
+    def enterItem(self, item: QTreeWidgetItem, column: int) -> None:  # noqa: ARG002  # pylint: disable = missing-param-doc
+        """Generate the preview of a hdf5 dataset or group before its tooltip is shown.
+
+        :param item: The hovered item.
+        :type item: QTreeWidgetItem
+        """
+        obj = getattr(item, 'obj', None)
+        if not self.hdfFile or not isinstance(obj, str) or item.toolTip(0):
+            return
+        try:
+            with h5py.File(self.hdfFile, 'r', track_order=True) as dataFile:
+                hdfItem = dataFile.get(obj)
+                if isinstance(hdfItem, h5py.Dataset):
+                    item.setToolTip(0, self.get_hdf5_preview(hdfItem))
+                elif isinstance(hdfItem, h5py.Group):
+                    item.setToolTip(0, f'{len(hdfItem)} items, {len(hdfItem.attrs)} attributes')
+        except OSError as e:
+            item.setToolTip(0, f'<Error reading data: {e}>')
+
+    def jsonShow(self, content: Any, tree: QTreeWidgetItem, expansionLevel: int) -> None:  # noqa: ANN401
+        """Populate tree based on contents of a json file.
+
+        :param content: The json content.
+        :type content: Any
+        :param tree: The tree used to display the file contents.
+        :type tree: QTreeWidgetItem
+        :param expansionLevel: Only expand items up to this level.
+        :type expansionLevel: int
+        """
+        children = content.items() if isinstance(content, dict) else enumerate(content)
+        for key, value in children:
+            if isinstance(value, (dict, list)):
+                groupItem = QTreeWidgetItem(tree, [str(key)])
+                groupItem.setIcon(0, QIcon(self.ICON_GROUP))
+                if expansionLevel < 1:
+                    groupItem.setExpanded(True)
+                self.jsonShow(value, groupItem, expansionLevel + 1)
+            else:
+                valueItem = QTreeWidgetItem(tree, [f'{key}: {value}'])
+                valueItem.setIcon(0, QIcon(self.ICON_ATTRIBUTE))
+
+    def traceShow(self, events: list[dict], tree: QTreeWidgetItem) -> None:
+        """Populate tree based on complete events in Chrome trace format.
+
+        Events that are enclosed in other events of the same thread are shown as children.
+
+        :param events: Trace events.
+        :type events: list[dict]
+        :param tree: The tree used to display the timeline.
+        :type tree: QTreeWidgetItem
+        """
+        stacks: dict[int, list[tuple[float, QTreeWidgetItem]]] = {}  # open phases per thread
+        # sort by start time and then by duration to make sure enclosing events come first
+        for event in sorted((event for event in events if event.get('ph') == 'X'), key=lambda event: (event.get('ts', 0), -event.get('dur', 0))):
+            stack = stacks.setdefault(event.get('tid', 0), [])
+            while stack and stack[-1][0] <= event['ts']:
+                stack.pop()  # previous phase ended before this one
+            item = QTreeWidgetItem(stack[-1][1] if stack else tree, [f"{event['name']}: {event['dur'] / 1000:.1f} ms"])
+            item.setIcon(0, QIcon(self.ICON_FUNCTIONMETHOD))
+            item.setToolTip(0, f"{event.get('cat', '')}\nStart: {event['ts'] / 1000:.1f} ms\nDuration: {event['dur'] / 1000:.1f} ms")
+            if len(stack) < 1:
+                item.setExpanded(True)
+            stack.append((event['ts'] + event['dur'], item))
 
     def get_hdf5_preview(self, dataset: h5py.Dataset, max_elements: int = 10) -> str:
         """Return a short string preview of an HDF5 dataset.
@@ -5413,6 +5933,7 @@ class Tree(Plugin):
         """
         self.provideDock()
         self._inspect = True
+        self.hdfFile = None
         self.tree.clear()
         self.tree.setHeaderHidden(False)
         self.tree.setHeaderLabels(['Object', 'Value'])
@@ -5440,6 +5961,8 @@ class Tree(Plugin):
             self.inspect_recursive(tree=item, obj=item.obj)
             self.tree.setUpdatesEnabled(True)
             item.setExpanded(True)
+        elif self.hdfFile and isinstance(getattr(item, 'obj', None), str) and item.childCount() == 0:
+            self.expandHdfItem(item)
 
     RECURSION_DEPTH_DEFAULT = 2
 
@@ -5655,13 +6178,16 @@ class Console(Plugin):
     version = '1.0'
     optional = False
     iconFile = 'terminal.png'
+    maxLines = 10000
+    """Number of lines kept in the Console. Older lines are removed. The full history is available in the log file."""
+    flushInterval = 100
+    """Messages are collected and added to the Console in batches at this interval in ms."""
 
     signalComm: 'SignalCommunicate'
 
     class SignalCommunicate(Plugin.SignalCommunicate):
         """Bundle pyqtSignals."""
 
-        writeSignal = pyqtSignal(str)
         executeSignal = pyqtSignal(str)
         executeSilentSignal = pyqtSignal(str)
 
@@ -5678,6 +6204,14 @@ class Console(Plugin):
             self.historyFile = validConfigPath / 'console_history.bin'
             self.mainConsole = ThemedConsole(parentPlugin=self, historyFile=self.historyFile)
             self.mainConsole.repl._lastCommandRow = 0  # not checking for None if uninitialized! -> initialize  # noqa: SLF001
+            self.mainConsole.output.setMaximumBlockCount(self.maxLines)  # limit cost of document layout
+            # thread safe buffer for messages that have not yet been shown. Older messages would be removed from the Console anyway after flushing.
+            self.pendingMessages: deque[str] = deque(maxlen=self.maxLines)
+            self.filteredMessages: deque[str] = deque(maxlen=self.maxLines)  # recent warnings and errors used to generate filtered views when needed
+            self.flushTimer = QTimer()
+            self.flushTimer.setInterval(self.flushInterval)
+            self.flushTimer.timeout.connect(self.flushMessages)
+            self.flushTimer.start()
             self.vertLayout.addWidget(self.mainConsole, 1)  # https://github.com/pyqtgraph/pyqtgraph/issues/404  # add before hintsTextEdit
             self.commonCommandsComboBox = CompactComboBox()
             self.commonCommandsComboBox.wheelEvent = lambda *_, **__: None
@@ -5711,7 +6245,6 @@ class Console(Plugin):
             self.mainConsole.repl.inputLayout.insertWidget(1, self.commonCommandsComboBox)
             self.mainConsole.historyBtn.deleteLater()
             self.mainConsole.exceptionBtn.deleteLater()
-            self.signalComm.writeSignal.connect(self.write)
             # make sure to use keyword arguments for decorated functions
             self.signalComm.executeSignal.connect(lambda command: self.execute(command=command))
             # make sure to use keyword arguments for decorated functions
@@ -5777,29 +6310,56 @@ class Console(Plugin):
     def write(self, message: str) -> None:
         """Write to integrated console to keep track of message history.
 
+        Messages are buffered and added in batches by :meth:`~esibd.plugins.Console.flushMessages`. Save to call from any thread.
+
         :param message: The message to be added to the console.
         :type message: str
         """
         # avoid using self.mainConsole.repl.write() because stdout is already handled by core.Logger
         if self.initializedGUI:
-            if current_thread() is main_thread():
-                self.mainConsole.output.moveCursor(QTextCursor.MoveOperation.End)
-                self.mainConsole.output.insertPlainText(message)
-                self.mainConsole.scrollToBottom()
-                if '⚠️' in message:  # 🪲⚠️❌ℹ️❖  # noqa: RUF003
-                    self.mainConsole.outputWarnings.moveCursor(QTextCursor.MoveOperation.End)
-                    self.mainConsole.outputWarnings.insertPlainText(message + '\n')
-                    sb = self.mainConsole.outputWarnings.verticalScrollBar()
-                    if sb:
-                        sb.setValue(sb.maximum())
-                elif '❌' in message:
-                    self.mainConsole.outputErrors.moveCursor(QTextCursor.MoveOperation.End)
-                    self.mainConsole.outputErrors.insertPlainText(message + '\n')
-                    sb = self.mainConsole.outputErrors.verticalScrollBar()
-                    if sb:
-                        sb.setValue(sb.maximum())
-            else:
-                self.signalComm.writeSignal.emit(message)
+            self.pendingMessages.append(message)
+
+    def flushMessages(self) -> None:
+        """Add all buffered messages to the Console at once. Filtered views are only updated while they are shown."""
+        if not self.pendingMessages:
+            return
+        messages = [self.pendingMessages.popleft() for _ in range(len(self.pendingMessages))]
+        self.mainConsole.output.moveCursor(QTextCursor.MoveOperation.End)
+        self.mainConsole.output.insertPlainText(''.join(messages))
+        self.mainConsole.scrollToBottom()
+        filteredMessages = [message for message in messages if '⚠️' in message or '❌' in message]  # 🪲⚠️❌ℹ️❖  # noqa: RUF003
+        if filteredMessages:
+            self.filteredMessages.extend(filteredMessages)
+            if self.mainConsole.outputLayout.currentIndex() == 1:
+                self.appendFiltered(self.mainConsole.outputWarnings, [message for message in filteredMessages if '⚠️' in message])
+            elif self.mainConsole.outputLayout.currentIndex() == 2:  # noqa: PLR2004
+                self.appendFiltered(self.mainConsole.outputErrors, [message for message in filteredMessages if '⚠️' not in message])
+
+    def appendFiltered(self, textEdit: QTextEdit, messages: list[str]) -> None:
+        """Append messages to a filtered view.
+
+        :param textEdit: The filtered view.
+        :type textEdit: QTextEdit
+        :param messages: The messages matching the filter.
+        :type messages: list[str]
+        """
+        if messages:
+            textEdit.moveCursor(QTextCursor.MoveOperation.End)
+            textEdit.insertPlainText(''.join(message + '\n' for message in messages))
+            sb = textEdit.verticalScrollBar()
+            if sb:
+                sb.setValue(sb.maximum())
+
+    def updateFilteredView(self, error: bool) -> None:
+        """Generate filtered view from recent messages.
+
+        :param error: Indicates if messages should be filtered for errors or warnings.
+        :type error: bool
+        """
+        self.flushMessages()
+        textEdit = self.mainConsole.outputErrors if error else self.mainConsole.outputWarnings
+        textEdit.clear()
+        self.appendFiltered(textEdit, [message for message in self.filteredMessages if ('⚠️' not in message) == error])
 
     def toggleMessageFilter(self, error: bool = True) -> None:
         """Make sure only one filter is active at a time. Shows outout for selected filter.
@@ -5812,8 +6372,10 @@ class Console(Plugin):
         else:
             self.errorFilterAction.state = False
         if self.warningFilterAction.state:
+            self.updateFilteredView(error=False)
             self.mainConsole.outputLayout.setCurrentIndex(1)
         elif self.errorFilterAction.state:
+            self.updateFilteredView(error=True)
             self.mainConsole.outputLayout.setCurrentIndex(2)
         else:
             self.mainConsole.outputLayout.setCurrentIndex(0)
@@ -6305,6 +6867,7 @@ class Settings(SettingsManager):  # noqa: PLR0904
             self.titleBar.insertWidget(self.aboutAction, self.filterLineEdit)
         self.toggleAdvanced(advanced=False)
 
+    @traceStartup
     def init(self) -> None:
         """Init all internal settings and those of all other plugins."""
         self.addDefaultSettings(plugin=self)  # make settings available via self.attr
@@ -6907,6 +7470,7 @@ class DeviceManager(Plugin):  # noqa: PLR0904
         self.exportOutputData(file=file, useAllHistory=useAllHistory)
 
     @synchronized()
+    @hotPath
     def exportOutputData(self, file: 'Path | None' = None, useAllHistory: bool = False) -> None:
         """Export output data for all active LiveDisplays.
 
@@ -6925,6 +7489,8 @@ class DeviceManager(Plugin):  # noqa: PLR0904
                     liveDisplay.parentPlugin.appendOutputData(h5File, useAllHistory=useAllHistory)
         self.exportConfiguration(file=file)  # save corresponding device settings in measurement file
         self.print(f'Saved {file.name}')
+        if hasattr(self.pluginManager, 'Catalog'):
+            self.pluginManager.Catalog.addFile(file)
         self.pluginManager.Explorer.populateTree()
 
     def updateStaticPlot(self) -> None:
@@ -6959,6 +7525,8 @@ class DeviceManager(Plugin):  # noqa: PLR0904
         # wait until all channels are complete before applying logic. will be called again when loading completed
         if any(device.loading for device in self.getDevices(inout)) or self.pluginManager.loading:
             return
+        if Parameter.changeTransaction.defer(self.globalUpdate, apply=apply, inout=inout):
+            return  # called once after all events of the current round
         if inout in {INOUT.BOTH, INOUT.IN}:
             for device in self.getInputDevices():
                 device.updateValues(apply=apply)
@@ -7044,11 +7612,15 @@ class Notes(Plugin):
                 if self.editor.toPlainText():
                     with self.file.open('w', encoding=self.UTF8) as textFile:
                         textFile.write(self.editor.toPlainText())
+                    if hasattr(self.pluginManager, 'Catalog'):
+                        self.pluginManager.Catalog.addFile(self.file)
             elif file.name.endswith(FILE_H5):
                 with h5py.File(file, 'a', track_order=True) as h5file:
                     h5py.get_config().track_order = True
                     group = self.requireGroup(h5file, self.name)
                     group.attrs[Parameter.VALUE] = self.editor.toPlainText()
+                if hasattr(self.pluginManager, 'Catalog'):
+                    self.pluginManager.Catalog.addFile(file)
 
     def loadData(self, file: Path, showPlugin: bool = True) -> None:  # noqa: D102
         self.provideDock()
@@ -7067,6 +7639,500 @@ class Notes(Plugin):
         self.numbers.updateTheme()
 
 
+class Profiler(Plugin):
+    """Find out where time is spent while the application is running, e.g. to diagnose slowdowns during measurements.
+
+    A sampling profiler periodically records the call stacks of all threads with negligible overhead.
+    Functions are listed by the fraction of samples in which they are executed (Total) or in which they are the innermost function (Self).
+    Calls and durations of known hot paths, such as data acquisition, plotting, scans, data export, and waiting for locks, are recorded continuously.
+    The call stacks can be exported in folded format, which can be shown as a flame graph by https://www.speedscope.app.
+    """
+
+    documentation = """Find out where time is spent while the application is running, e.g. to diagnose slowdowns during measurements.
+    A sampling profiler periodically records the call stacks of all threads with negligible overhead.
+    Functions are listed by the fraction of samples in which they are executed (Total) or in which they are the innermost function (Self).
+    Calls and durations of known hot paths, such as data acquisition, plotting, scans, data export, and waiting for locks, are recorded continuously.
+    The call stacks can be exported in folded format, which can be shown as a flame graph by https://www.speedscope.app.
+    """
+
+    name = 'Profiler'
+    version = '1.0'
+    pluginType = PLUGINTYPE.CONTROL
+    iconFile = 'clock.png'
+    deferGUI = True
+    maxFunctions = 100
+    """Maximum number of functions shown in the table."""
+    updateInterval = 1000
+    """Interval in ms for updating tables while sampling."""
+
+    def __init__(self, **kwargs) -> None:  # noqa: D107
+        super().__init__(**kwargs)
+        self.sampling = False
+        self.samplingThread: 'Thread | None' = None
+        self.stacks: dict[tuple[str, ...], int] = {}  # folded call stacks: number of samples
+        self.stacksLock = threading.Lock()
+        self.sampleCount = 0
+        self.samplingTime = 0  # time spent in samplingThread in s
+        self.samplingDuration = 0  # time during which samples were taken in s
+        self.sampleInterval = 10  # ms, updated in main thread
+        self.samplingStart = 0.0
+
+    def initGUI(self) -> None:  # noqa: D102
+        super().initGUI()
+        self.splitter = QSplitter(Qt.Orientation.Vertical)
+        self.hotPathTree = TreeWidget()
+        self.hotPathTree.setHeaderLabels(['Hot path', 'Calls', 'Total (s)', 'Mean (ms)', 'Max (ms)'])
+        self.hotPathTree.setRootIsDecorated(False)
+        self.hotPathTree.setSortingEnabled(True)
+        self.functionTree = TreeWidget()
+        self.functionTree.setHeaderLabels(['Function', 'Total (%)', 'Self (%)'])
+        self.functionTree.setRootIsDecorated(False)
+        self.functionTree.setSortingEnabled(True)
+        self.splitter.addWidget(self.hotPathTree)
+        self.splitter.addWidget(self.functionTree)
+        self.addContentWidget(self.splitter)
+        self.updateTimer = QTimer()
+        self.updateTimer.timeout.connect(self.updateTables)
+
+    def finalizeInit(self) -> None:  # noqa: D102
+        self.samplingAction = self.addStateAction(event=self.toggleSampling, toolTipFalse='Start sampling call stacks.', iconFalse=self.makeCoreIcon('play.png'),
+                                                  toolTipTrue='Stop sampling call stacks.', iconTrue=self.makeCoreIcon('pause.png'), restore=False)
+        self.resetAction = self.addAction(event=self.reset, toolTip='Reset samples and hot path metrics.', icon=self.makeCoreIcon('arrow-circle-315.png'))
+        self.exportAction = self.addAction(event=self.exportProfile, toolTip='Export call stacks for flame graphs and hot path metrics.',
+                                           icon=self.makeCoreIcon('blue-folder-export.png'))
+        super().finalizeInit()
+        self.sampleIntervalComboBox = RestoreIntComboBox(parentPlugin=self, default='10', items='1,5,10,20,50,100', attr='sampleInterval',
+                                                         event=self.sampleIntervalChanged, minimum=1, maximum=1000, toolTip='Sampling interval in ms.')
+        if self.titleBar:
+            self.titleBar.insertWidget(self.aboutAction, self.sampleIntervalComboBox)
+        self.sampleIntervalChanged()
+        self.updateTables()
+
+    def sampleIntervalChanged(self) -> None:
+        """Store sampling interval for use in samplingThread."""
+        self.sampleInterval = int(self.sampleIntervalComboBox.currentText())
+
+    def toggleSampling(self) -> None:
+        """Start or stop sampling call stacks."""
+        if self.samplingAction.state:
+            if not self.sampling:
+                self.stopSamplingThread()  # make sure previous thread has completed before starting a new one
+                self.sampling = True
+                self.samplingStart = time.perf_counter()
+                self.samplingThread = Thread(target=self.runSampling, name=f'{self.name} samplingThread')
+                self.samplingThread.daemon = True
+                self.samplingThread.start()
+                self.updateTimer.start(self.updateInterval)
+        else:
+            self.stopSamplingThread()
+            self.updateTimer.stop()
+            self.updateTables()  # includes samplingDuration of completed thread
+
+    def stopSamplingThread(self) -> None:
+        """Stop sampling and wait until samplingThread has added its sampling duration."""
+        self.sampling = False
+        if self.samplingThread and self.samplingThread.is_alive():
+            self.samplingThread.join(timeout=2)  # sampleInterval is at most 1 s
+        self.samplingThread = None
+
+    def runSampling(self) -> None:
+        """Record call stacks of all other threads until sampling is stopped. Runs in samplingThread."""
+        ownID = threading.get_ident()
+        threadNames: dict[int, str] = {}
+        codeNames: dict[Any, str] = {}  # formatting is done once per code object
+        namesUpdated = 0
+        while self.sampling:
+            begin = time.perf_counter()
+            if begin - namesUpdated > 1:
+                threadNames = {thread.ident: thread.name for thread in threading.enumerate() if thread.ident is not None}
+                namesUpdated = begin
+            samples = []
+            frame = current = None
+            for threadID, frame in sys._current_frames().items():  # noqa: SLF001
+                if threadID == ownID:
+                    continue
+                stack = []
+                current = frame
+                while current is not None:
+                    code = current.f_code
+                    codeName = codeNames.get(code)
+                    if codeName is None:
+                        codeName = codeNames[code] = f'{code.co_qualname} ({Path(code.co_filename).name}:{code.co_firstlineno})'
+                    stack.append(codeName)
+                    current = current.f_back
+                stack.append(threadNames.get(threadID, str(threadID)))
+                samples.append(tuple(reversed(stack)))
+            frame = current = None  # do not keep frames alive while sleeping
+            with self.stacksLock:
+                for stack in samples:
+                    self.stacks[stack] = self.stacks.get(stack, 0) + 1
+                self.sampleCount += 1
+                self.samplingTime += time.perf_counter() - begin
+            time.sleep(self.sampleInterval / 1000)
+        with self.stacksLock:
+            self.samplingDuration += time.perf_counter() - self.samplingStart
+
+    def getStacks(self) -> tuple[dict[tuple[str, ...], int], int, float, float]:
+        """Return a copy of the recorded call stacks.
+
+        :return: stacks, number of samples, time spent sampling in s, sampling duration in s
+        :rtype: tuple[dict[tuple[str, ...], int], int, float, float]
+        """
+        with self.stacksLock:
+            return dict(self.stacks), self.sampleCount, self.samplingTime, self.samplingDuration
+
+    def updateTables(self) -> None:
+        """Show current hot path metrics and most frequently sampled functions."""
+        if not self.initializedDock:
+            return
+        self.hotPathTree.setSortingEnabled(False)
+        self.hotPathTree.clear()
+        for name, (count, total, maximum) in hotPathMetrics.snapshot().items():
+            item = QTreeWidgetItem()
+            for column, value in enumerate((name, int(count), total, total / count * 1000, maximum * 1000)):
+                item.setData(column, Qt.ItemDataRole.DisplayRole, value if column < 2 else round(value, 3))  # numbers are sorted numerically  # noqa: PLR2004
+            self.hotPathTree.addTopLevelItem(item)
+        self.hotPathTree.setSortingEnabled(True)
+        stacks, sampleCount, samplingTime, samplingDuration = self.getStacks()
+        totalSamples: dict[str, int] = {}
+        selfSamples: dict[str, int] = {}
+        threadSamples = 0
+        for stack, count in stacks.items():
+            threadSamples += count
+            if len(stack) > 1:
+                selfSamples[stack[-1]] = selfSamples.get(stack[-1], 0) + count
+            for function in set(stack[1:]):  # count recursive functions once, first entry is the thread name
+                totalSamples[function] = totalSamples.get(function, 0) + count
+        self.functionTree.setSortingEnabled(False)
+        self.functionTree.clear()
+        for function, count in sorted(totalSamples.items(), key=lambda item: item[1], reverse=True)[:self.maxFunctions]:
+            item = QTreeWidgetItem()
+            item.setData(0, Qt.ItemDataRole.DisplayRole, function)
+            item.setData(1, Qt.ItemDataRole.DisplayRole, round(count / threadSamples * 100, 1))
+            item.setData(2, Qt.ItemDataRole.DisplayRole, round(selfSamples.get(function, 0) / threadSamples * 100, 1))
+            self.functionTree.addTopLevelItem(item)
+        self.functionTree.setSortingEnabled(True)
+        self.functionTree.sortByColumn(1, Qt.SortOrder.DescendingOrder)
+        if sampleCount:
+            duration = samplingDuration + (time.perf_counter() - self.samplingStart if self.sampling else 0)
+            self.functionTree.headerItem().setToolTip(0, f'{sampleCount} samples of all threads, sampling overhead: '  # type: ignore  # noqa: PGH003
+                                                     f'{samplingTime / max(duration, 1e-9) * 100:.2f} % of one core.')
+
+    def reset(self) -> None:
+        """Remove all samples and hot path metrics."""
+        with self.stacksLock:
+            self.stacks = {}
+            self.sampleCount = 0
+            self.samplingTime = 0
+            self.samplingDuration = 0
+        hotPathMetrics.reset()
+        self.updateTables()
+
+    def exportProfile(self) -> None:
+        """Save call stacks in folded format and hot path metrics as json."""
+        stacks, sampleCount, samplingTime, samplingDuration = self.getStacks()
+        self.pluginManager.Settings.incrementMeasurementNumber()
+        file = self.pluginManager.Settings.getMeasurementFileName(f'_{self.name}.folded')
+        with file.open('w', encoding=self.UTF8) as foldedFile:
+            foldedFile.writelines(f"{';'.join(stack)} {count}\n" for stack, count in stacks.items())
+        with file.with_suffix('.json').open('w', encoding=self.UTF8) as jsonFile:
+            json.dump({'samples': sampleCount, 'samplingTime': samplingTime, 'samplingDuration': samplingDuration, 'sampleInterval': self.sampleInterval,
+                       'hotPaths': {name: {'calls': count, 'total': total, 'max': maximum} for name, (count, total, maximum) in hotPathMetrics.snapshot().items()}},
+                      jsonFile, indent=4)
+        self.print(f'Saved {file.name} and {file.with_suffix(".json").name}')
+        self.pluginManager.Explorer.populateTree()
+
+    def close(self) -> bool:  # noqa: D102
+        self.sampling = False
+        return super().close()
+
+
+class Catalog(Plugin):
+    """Index metadata of all measurement files in a local database to find measurements across sessions.
+
+    Every measurement file written by *ESIBD Explorer* is added automatically and existing files in the
+    :ref:`data path<data_path>` are indexed in the background. The catalog can be searched from the :ref:`sec:explorer`.
+    Search terms can be combined: after:2024-01-31, before:2024-02-28, plugin:Energy, channel:RT_Grid,
+    setting:"Session/Measurement number=5", and notes:calibration. Use * as a wildcard. Other words are
+    matched against file paths, plugin names, notes, and channel names.
+    """
+
+    documentation = """Index metadata of all measurement files in a local database to find measurements across sessions.
+    Every measurement file written by ESIBD Explorer is added automatically and existing files in the
+    data path are indexed in the background. The catalog can be searched from the Explorer.
+    Search terms can be combined: after:2024-01-31, before:2024-02-28, plugin:Energy, channel:RT_Grid,
+    setting:"Session/Measurement number=5", and notes:calibration. Use * as a wildcard. Other words are
+    matched against file paths, plugin names, notes, and channel names.
+    """
+
+    name = 'Catalog'
+    version = '1.0'
+    pluginType = PLUGINTYPE.INTERNAL
+    iconFile = 'database-medium.png'
+    maxResults = 1000
+    crawlDelay = 60
+    """Files modified within this time in s are not indexed by the crawler, as they may still be written. They are added once saving is complete."""
+    NOTESFILE = 'notes.txt'
+    AFTER = 'after'
+    BEFORE = 'before'
+    CHANNEL = 'channel'
+    NOTES = 'notes'
+    SETTING = 'setting'
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS files (id INTEGER PRIMARY KEY, path TEXT UNIQUE, size INTEGER, mtime INTEGER, plugin TEXT COLLATE NOCASE,
+                                          measurementNumber INTEGER, started REAL, ended REAL, notes TEXT);
+        CREATE TABLE IF NOT EXISTS channels (file INTEGER, plugin TEXT COLLATE NOCASE, name TEXT COLLATE NOCASE);
+        CREATE TABLE IF NOT EXISTS settings (file INTEGER, plugin TEXT COLLATE NOCASE, name TEXT COLLATE NOCASE, value TEXT COLLATE NOCASE);
+        CREATE INDEX IF NOT EXISTS filesStarted ON files (started);
+        CREATE INDEX IF NOT EXISTS filesEnded ON files (ended);
+        CREATE INDEX IF NOT EXISTS filesPlugin ON files (plugin);
+        CREATE INDEX IF NOT EXISTS channelsFile ON channels (file);
+        CREATE INDEX IF NOT EXISTS channelsName ON channels (name);
+        CREATE INDEX IF NOT EXISTS settingsFile ON settings (file);
+        CREATE INDEX IF NOT EXISTS settingsName ON settings (name, value);
+    """
+
+    def __init__(self, **kwargs) -> None:
+        """Initialize the Catalog."""
+        super().__init__(**kwargs)
+        self.file = getValidConfigPath() / 'catalog.sqlite'
+        self.connection = self.connect()  # used for queries in the main thread
+        self.indexQueue: queue.Queue[tuple[bool, Path] | None] = queue.Queue()  # (crawl, path)
+        self.indexerThread = Thread(target=self.runIndexer, name=f'{self.name} indexerThread')
+        self.indexerThread.daemon = True
+        self.indexerThread.start()
+
+    def connect(self) -> sqlite3.Connection:
+        """Open a connection to the catalog database. Connections can only be used in the thread that created them.
+
+        :return: The connection.
+        :rtype: sqlite3.Connection
+        """
+        connection = sqlite3.connect(self.file, timeout=10)
+        connection.execute('PRAGMA journal_mode=WAL')  # allow queries while the indexer is writing
+        connection.executescript(self.SCHEMA)
+        return connection
+
+    def addFile(self, file: Path) -> None:
+        """Add or update a measurement file in the background.
+
+        :param file: The measurement file.
+        :type file: pathlib.Path
+        """
+        self.indexQueue.put((False, file))
+
+    def crawl(self, path: Path) -> None:
+        """Index all new and modified measurement files in a directory and its subdirectories in the background.
+
+        :param path: The directory.
+        :type path: pathlib.Path
+        """
+        self.indexQueue.put((True, path))
+
+    def runIndexer(self) -> None:
+        """Index queued files and directories. Runs in indexerThread until None is queued."""
+        connection = self.connect()
+        while True:
+            request = self.indexQueue.get()
+            if request is None:
+                break
+            crawl, path = request
+            try:
+                if crawl:
+                    self.crawlDirectory(connection, path)
+                else:
+                    self.indexFile(connection, path)
+                    connection.commit()
+            except Exception as e:  # pylint: disable = broad-except  # keep indexing other files, malformed files can raise many different exceptions  # noqa: BLE001
+                self.print(f'Could not index {path}: {e}', flag=PRINT.WARNING)
+        connection.close()
+
+    def crawlDirectory(self, connection: sqlite3.Connection, path: Path) -> None:
+        """Index new and modified files and remove deleted files.
+
+        :param connection: Connection of the indexerThread.
+        :type connection: sqlite3.Connection
+        :param path: The directory.
+        :type path: pathlib.Path
+        """
+        prefix = path.as_posix().rstrip('/') + '/'
+        indexed = {Path(row[0]): (row[1], row[2]) for row in connection.execute('SELECT path, size, mtime FROM files WHERE substr(path, 1, ?) = ?',
+                                                                                  (len(prefix), prefix))}
+        found = set()
+        count = 0
+        for directory, directories, files in os.walk(path):
+            directories[:] = [name for name in directories if not name.startswith(('.', '$'))]
+            for name in files:
+                if self.pluginManager.closing:
+                    return
+                if not self.isMeasurementFile(name):
+                    continue
+                file = Path(directory) / name
+                found.add(file)
+                try:
+                    stat = file.stat()
+                except OSError:
+                    continue
+                if indexed.get(file) == (stat.st_size, stat.st_mtime_ns) or time.time() - stat.st_mtime < self.crawlDelay:
+                    continue
+                try:
+                    self.indexFile(connection, file, stat)
+                except sqlite3.Error:
+                    raise  # database problems affect all files
+                except Exception as e:  # pylint: disable = broad-except  # skip malformed files  # noqa: BLE001
+                    self.print(f'Could not index {file}: {e}', flag=PRINT.WARNING)
+                    continue
+                count += 1
+                if count % 100 == 0:
+                    connection.commit()  # make results available while crawling
+        for file in indexed.keys() - found:
+            self.removeFile(connection, file)
+        connection.commit()
+        self.print(f'Indexed {count} new or modified measurement files in {path}.', flag=PRINT.DEBUG)
+
+    def isMeasurementFile(self, name: str) -> bool:
+        """Test if a file should be added to the catalog.
+
+        :param name: The file name.
+        :type name: str
+        :return: True if the file is a measurement file or contains notes.
+        :rtype: bool
+        """
+        return name.endswith(FILE_H5) or name == self.NOTESFILE
+
+    def removeFile(self, connection: sqlite3.Connection, file: Path) -> None:
+        """Remove a file from the catalog.
+
+        :param connection: Connection of the indexerThread.
+        :type connection: sqlite3.Connection
+        :param file: The file.
+        :type file: pathlib.Path
+        """
+        row = connection.execute('SELECT id FROM files WHERE path = ?', (file.as_posix(),)).fetchone()
+        if row:
+            connection.execute('DELETE FROM channels WHERE file = ?', row)
+            connection.execute('DELETE FROM settings WHERE file = ?', row)
+            connection.execute('DELETE FROM files WHERE id = ?', row)
+
+    def indexFile(self, connection: sqlite3.Connection, file: Path, stat: 'os.stat_result | None' = None) -> None:
+        """Read metadata from a file and add it to the catalog.
+
+        :param connection: Connection of the indexerThread.
+        :type connection: sqlite3.Connection
+        :param file: The file.
+        :type file: pathlib.Path
+        :param stat: Result of file.stat() if already available, defaults to None
+        :type stat: os.stat_result, optional
+        """
+        self.removeFile(connection, file)
+        if not file.exists():
+            return
+        stat = stat or file.stat()
+        plugin, notes, times, channels, settings = self.readMetadata(file)
+        match = re.search(r'_(\d+)\.\w+$', file.name)
+        cursor = connection.execute('INSERT INTO files (path, size, mtime, plugin, measurementNumber, started, ended, notes) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                                    (file.as_posix(), stat.st_size, stat.st_mtime_ns, plugin, int(match.group(1)) if match else None,
+                                     min(times, default=stat.st_mtime), max(times, default=stat.st_mtime), notes))
+        connection.executemany('INSERT INTO channels (file, plugin, name) VALUES (?, ?, ?)', [(cursor.lastrowid, *channel) for channel in channels])
+        connection.executemany('INSERT INTO settings (file, plugin, name, value) VALUES (?, ?, ?, ?)', [(cursor.lastrowid, *setting) for setting in settings])
+
+    def readMetadata(self, file: Path) -> tuple[str, str, list[float], list[tuple[str, str]], list[tuple[str, str, str]]]:
+        """Read metadata without loading any data.
+
+        :param file: The file.
+        :type file: pathlib.Path
+        :return: plugin, notes, start and end times, (plugin, channel name), and (plugin, setting name, value).
+        :rtype: tuple[str, str, list[float], list[tuple[str, str]], list[tuple[str, str, str]]]
+        """
+        if file.name == self.NOTESFILE:
+            return Notes.name, file.read_text(encoding=self.UTF8, errors='replace'), [], [], []
+        plugin = ''
+        notes = ''
+        times: list[float] = []
+        channels: list[tuple[str, str]] = []
+        settings: list[tuple[str, str, str]] = []
+        with h5py.File(file, 'r') as h5File:
+            for groupName, group in h5File.items():
+                if groupName == INFO or not isinstance(group, h5py.Group):
+                    continue
+                plugin = plugin or groupName  # the first group belongs to the plugin that created the file
+                if groupName == Notes.name:
+                    notes = str(group.attrs.get(Parameter.VALUE, ''))
+                for channelGroupName in (INPUTCHANNELS, OUTPUTCHANNELS):
+                    channelGroup = group.get(channelGroupName)
+                    if isinstance(channelGroup, h5py.Group):
+                        for name, dataset in channelGroup.items():
+                            channels.append((groupName, name))
+                            if name == self.TIME and isinstance(dataset, h5py.Dataset) and dataset.ndim == 1 and dataset.shape[0] > 0:
+                                times.extend((float(dataset[0]), float(dataset[-1])))  # only read first and last time stamp
+                settingsGroup = group if groupName == SettingsManager.SETTINGS else group.get(SettingsManager.SETTINGS)
+                if isinstance(settingsGroup, h5py.Group):
+                    settingsGroup.visititems(lambda name, item, groupName=groupName: settings.append((groupName, name, str(item.attrs[Parameter.VALUE])))
+                                             if Parameter.VALUE in item.attrs else None)
+        return plugin, notes, times, channels, settings
+
+    def query(self, text: str) -> list[tuple[Path, str, float, float]]:  # noqa: C901, PLR0912
+        """Search the catalog.
+
+        :param text: The search terms. See :class:`~esibd.plugins.Catalog` for the syntax.
+        :type text: str
+        :return: Matching files with plugin name, start, and end time, latest first.
+        :rtype: list[tuple[pathlib.Path, str, float, float]]
+        """
+        try:
+            terms = shlex.split(text)
+        except ValueError:  # unmatched quotes while typing
+            terms = text.split()
+        conditions = []
+        parameters: list[str | float | int] = []
+        for term in terms:
+            key, _, value = term.partition(':')
+            key = key.lower()
+            if not value or key not in {self.AFTER, self.BEFORE, PLUGIN.lower(), self.CHANNEL, self.SETTING, self.NOTES}:
+                key, value = '', term
+            pattern = value.replace('*', '%')
+            if key in {self.AFTER, self.BEFORE}:
+                try:
+                    date = datetime.fromisoformat(value)
+                except ValueError:
+                    self.print(f'Could not interpret date {value}, use YYYY-MM-DD.', flag=PRINT.WARNING)
+                    continue
+                if key == self.AFTER:
+                    conditions.append('ended >= ?')
+                    parameters.append(date.timestamp())
+                else:
+                    conditions.append('started < ?')
+                    parameters.append((date + timedelta(days=1) if len(value) == len('YYYY-MM-DD') else date).timestamp())  # include entire day
+            elif key == PLUGIN.lower():
+                conditions.append('plugin LIKE ?')
+                parameters.append(pattern)
+            elif key == self.CHANNEL:
+                conditions.append('id IN (SELECT file FROM channels WHERE name LIKE ?)')
+                parameters.append(pattern)
+            elif key == self.SETTING:
+                name, _, settingValue = pattern.partition('=')
+                if settingValue:
+                    conditions.append('id IN (SELECT file FROM settings WHERE name LIKE ? AND value LIKE ?)')
+                    parameters.extend((name, settingValue))
+                else:
+                    conditions.append('id IN (SELECT file FROM settings WHERE name LIKE ?)')
+                    parameters.append(name)
+            elif key == self.NOTES:
+                conditions.append('notes LIKE ?')
+                parameters.append(f'%{pattern}%')
+            else:
+                conditions.append('(path LIKE ? OR plugin LIKE ? OR notes LIKE ? OR id IN (SELECT file FROM channels WHERE name LIKE ?))')
+                parameters.extend((f'%{pattern}%', pattern, f'%{pattern}%', pattern))
+        statement = f"SELECT path, plugin, started, ended FROM files {'WHERE ' + ' AND '.join(conditions) if conditions else ''} ORDER BY ended DESC LIMIT ?"  # noqa: S608
+        return [(Path(path), plugin, started, ended) for path, plugin, started, ended in self.connection.execute(statement, [*parameters, self.maxResults])]
+
+    def close(self) -> bool:  # noqa: D102
+        response = super().close()
+        self.indexQueue.put(None)  # stop indexerThread
+        self.connection.close()
+        return response
+
+
 class Explorer(Plugin):  # noqa: PLR0904
     """Navigate all results and complementary data.
 
@@ -7141,6 +8207,19 @@ class Explorer(Plugin):  # noqa: PLR0904
     optional = False
     iconFile = 'folder.png'
     displayContentSignal = pyqtSignal()
+    cacheDelay = 2e9
+    """Directories modified within this time in ns are not cached, as the file system may not resolve further changes in their modification time."""
+    maxFileTypesFiles = 1000
+    """Maximum number of directories for which file types are persisted. Files of the least recently classified directories are removed on startup."""
+
+    signalComm: 'SignalCommunicate'
+
+    class SignalCommunicate(Plugin.SignalCommunicate):
+        """Bundle pyqtSignals."""
+
+        directoryIndexedSignal = pyqtSignal(object, list, list, int)
+        fileTypesSignal = pyqtSignal(object, int)
+        indexingCompleteSignal = pyqtSignal()
 
     def __init__(self, **kwargs) -> None:
         """Initialize the central Explorer."""
@@ -7166,11 +8245,38 @@ class Explorer(Plugin):  # noqa: PLR0904
         self.displayContentSignal.connect(self.displayContent)
         self.populating = False
         self.loadingContent = False
+        self.directoryCache: dict[Path, tuple[int, list[str], list[str]]] = {}  # path: (modification time in ns, directories, files), only accessed by indexerThread
+        self.directoryItems: dict[Path, QTreeWidgetItem] = {}  # path: tree item of all directories shown in the tree
+        self.populatedDirectories: set[Path] = set()  # directories whose tree items have received their content since the tree was cleared
+        self.changedDirectories: set[Path] = set()
+        self.fileTypes: dict[Path, dict[str, list]] = {}  # directory: {file name: [size, modification time in ns, names of supporting plugins]}
+        self.indexQueue: queue.Queue[tuple[Path, int, bool, int] | None] = queue.Queue()
+        self.classifyQueue: queue.Queue[tuple[Path, list[str], int] | None] = queue.Queue()  # (directory, files, generation)
+        self.indexGeneration = 0  # incremented whenever the tree is cleared to discard results of outdated requests
+        self.pendingIndexRequests = 0
+        self.indexCondition = threading.Condition()  # wakes classifierThread when indexing completes, requests become outdated, or on closing
+        self.appliedSearchTerm = ''
+        self.catalogAction: 'StateAction | None' = None
+        self.signalComm.directoryIndexedSignal.connect(self.updateDirectory)
+        self.signalComm.fileTypesSignal.connect(self.updateFileIcons)
+        self.signalComm.indexingCompleteSignal.connect(self.indexingComplete)
 
     def initGUI(self) -> None:  # noqa: D102
         super().initGUI()
         if not self.titleBar:
             return
+        self.indexerThread = Thread(target=self.runIndexer, name=f'{self.name} indexerThread')
+        self.indexerThread.daemon = True
+        self.indexerThread.start()
+        self.classifierThread = Thread(target=self.runClassifier, name=f'{self.name} classifierThread')
+        self.classifierThread.daemon = True
+        self.classifierThread.start()
+        self.watcher = QFileSystemWatcher()
+        self.watcher.directoryChanged.connect(self.directoryChanged)
+        self.watcherTimer = QTimer()
+        self.watcherTimer.timeout.connect(self.indexChangedDirectories)
+        self.watcherTimer.setSingleShot(True)
+        self.watcherTimer.setInterval(500)
         self.tree = TreeWidget()
         self.addContentWidget(self.tree)
         self.tree.currentItemChanged.connect(self.treeItemClicked)
@@ -7206,10 +8312,15 @@ class Explorer(Plugin):  # noqa: PLR0904
         self.filterLineEdit.textChanged.connect(self.searchTimer.start)
         self.filterLineEdit.setPlaceholderText('Search')
         self.titleBar.addWidget(self.filterLineEdit)
+        if hasattr(self.pluginManager, 'Catalog'):
+            self.catalogAction = self.addStateAction(event=self.toggleCatalog, toolTipFalse='Search measurement catalog.', iconFalse=self.pluginManager.Catalog.getIcon(),
+                                                     toolTipTrue='Browse directories.', attr='searchCatalog', restore=False)
 
     def finalizeInit(self) -> None:  # noqa: D102
         # Load directory after all other plugins loaded, to allow use icons for supported files
         self.updateRoot(self.pluginManager.Settings.dataPath, addHistory=True, loading=True)  # do not trigger populate tree here, will be done when updating theme
+        if hasattr(self.pluginManager, 'Catalog'):
+            self.pluginManager.Catalog.crawl(self.pluginManager.Settings.dataPath)  # add existing measurements in the background
         super().finalizeInit()
         self.stretch.deleteLater()
 
@@ -7425,6 +8536,8 @@ class Explorer(Plugin):  # noqa: PLR0904
         :return: Corresponding full path.
         :rtype: Path
         """
+        if item and self.catalogAction and self.catalogAction.state:
+            return item.path_info  # catalog results are not nested
         if item and self.root:
             out = item.text(0)
             parent = cast('TreeWidgetItem', item.parent())
@@ -7472,16 +8585,33 @@ class Explorer(Plugin):  # noqa: PLR0904
     def populateTree(self, clear: bool = False) -> None:  # noqa: C901, PLR0912
         """Populate or updates fileTree.
 
+        Directories are indexed in the background and the tree is updated as results arrive.
+        Only directories that have been modified since they were last indexed are updated.
+
         :param clear: If True all items will be deleted and new items will be created from scratch. Defaults to False
         :type clear: bool, optional
         """
         if self.pluginManager.closing or not self.root:
             return
+        if self.catalogAction and self.catalogAction.state:
+            self.showCatalogResults()
+            return
+        searchTerm = self.filterLineEdit.text()
+        force = clear or searchTerm != self.appliedSearchTerm  # apply new search term also to unchanged directories
+        self.appliedSearchTerm = searchTerm
         self.populating = True
         for action in [self.backAction, self.forwardAction, self.upAction, self.refreshAction]:
             action.setEnabled(False)
         if clear:  # otherwise existing tree will be updated (much more efficient)
             self.tree.clear()
+            self.indexGeneration += 1
+            self.notifyClassifier()
+            if self.watcher.directories():
+                self.watcher.removePaths(self.watcher.directories())
+            self.watcher.addPath(self.root.as_posix())
+            invisibleRootItem = self.tree.invisibleRootItem()
+            self.directoryItems = {self.root: invisibleRootItem} if invisibleRootItem else {}
+            self.populatedDirectories = set()
         # update navigation arrows
         if self.indexHistory == len(self.history) - 1:
             self.forwardAction.setIcon(self.ICON_FORWARD_GRAY)
@@ -7495,20 +8625,385 @@ class Explorer(Plugin):  # noqa: PLR0904
             self.upAction.setIcon(self.ICON_UP_GRAY)
         else:
             self.upAction.setIcon(self.ICON_UP)
-        invisibleRootItem = self.tree.invisibleRootItem()
-        if invisibleRootItem:
-            self.load_project_structure(startPath=self.root, tree=invisibleRootItem, search_term=self.filterLineEdit.text(), clear=clear)  # populate tree widget
-
-        it = QTreeWidgetItemIterator(self.tree, QTreeWidgetItemIterator.IteratorFlag.HasChildren)
-        while it.value():
-            value = cast('TreeWidgetItem', it.value())
-            if value and value.isExpanded():
+        self.requestIndex(self.root, force=force)  # populate tree widget
+        for path, item in list(self.directoryItems.items()):
+            if path != self.root and item.isExpanded():
                 # populate expanded dirs, independent of recursion depth
-                self.load_project_structure(startPath=value.path_info, tree=value, search_term=self.filterLineEdit.text(), clear=clear)
-            it += 1
-        self.populating = False
-        for action in [self.backAction, self.forwardAction, self.upAction, self.refreshAction]:
-            action.setEnabled(True)
+                self.requestIndex(path, force=force)
+
+    def toggleCatalog(self) -> None:
+        """Switch between browsing directories and searching the measurement catalog."""
+        self.filterLineEdit.setPlaceholderText('after:2024-01-31 channel:RT_Grid ...' if self.catalogAction and self.catalogAction.state else 'Search')
+        self.filterLineEdit.setToolTip(self.pluginManager.Catalog.documentation if self.catalogAction and self.catalogAction.state else '')
+        self.populateTree(clear=True)
+
+    def showCatalogResults(self) -> None:
+        """Show files from the measurement catalog that match the search terms."""
+        self.tree.clear()
+        self.indexGeneration += 1  # discard pending results from directory indexing
+        self.notifyClassifier()
+        self.directoryItems = {}
+        self.populatedDirectories = set()
+        start = time.perf_counter()
+        results = self.pluginManager.Catalog.query(self.filterLineEdit.text())
+        populating = self.populating
+        self.populating = True  # avoid displaying content while updating tree
+        for file, pluginName, started, ended in results:
+            item = TreeWidgetItem(self.tree, [file.relative_to(self.root).as_posix() if file.is_relative_to(self.root) else file.as_posix()])
+            item.path_info = file
+            plugin = getattr(self.pluginManager, pluginName, None) if pluginName else None
+            item.setIcon(0, plugin.getIcon() if isinstance(plugin, Plugin) else self.getFileIcon(file, classify=False))
+            item.setToolTip(0, f"{pluginName}: {datetime.fromtimestamp(started).strftime('%Y-%m-%d %H:%M')} - {datetime.fromtimestamp(ended).strftime('%Y-%m-%d %H:%M')}")
+        self.populating = populating
+        self.print(f'Found {len(results)} measurements in {(time.perf_counter() - start) * 1000:.0f} ms.')
+
+    def requestIndex(self, path: Path, recursionDepth: int = 2, force: bool = False) -> None:
+        """Queue a directory for indexing in the background.
+
+        :param path: The directory to be indexed.
+        :type path: pathlib.Path
+        :param recursionDepth: How many levels will be indexed. Further levels will be indexed as they are expanded. Defaults to 2
+        :type recursionDepth: int, optional
+        :param force: Update the tree even if directories have not been modified, e.g. after changing the search term. Defaults to False
+        :type force: bool, optional
+        """
+        with self.indexCondition:
+            self.pendingIndexRequests += 1
+        self.indexQueue.put((path, recursionDepth, force, self.indexGeneration))
+
+    def notifyClassifier(self) -> None:
+        """Wake classifierThread to check if it can continue."""
+        with self.indexCondition:
+            self.indexCondition.notify_all()
+
+    def indexingComplete(self) -> None:
+        """Enable navigation after all pending requests have been indexed."""
+        with self.indexCondition:
+            self.pendingIndexRequests -= 1
+            self.indexCondition.notify_all()
+        if self.pendingIndexRequests == 0 and self.populating:
+            self.populating = False
+            for action in [self.backAction, self.forwardAction, self.upAction, self.refreshAction]:
+                action.setEnabled(True)
+
+    def runIndexer(self) -> None:
+        """Index queued directories. Runs in indexerThread until None is queued."""
+        while True:
+            request = self.indexQueue.get()
+            if request is None:
+                break
+            path, recursionDepth, force, generation = request
+            indexed: list[tuple[Path, list[str]]] = []
+            self.indexDirectory(path=path, recursionDepth=recursionDepth, force=force, generation=generation, indexed=indexed)
+            for directory, files in indexed:
+                self.classifyQueue.put((directory, files, generation))
+            if not self.pluginManager.closing:
+                self.signalComm.indexingCompleteSignal.emit()
+
+    def runClassifier(self) -> None:
+        """Classify files of indexed directories. Runs in classifierThread until None is queued.
+
+        Classifying may require to open every file. It has lower priority than indexing and waits while directories are being indexed.
+        """
+        self.pruneFileTypes()
+        while True:
+            request = self.classifyQueue.get()
+            if request is None:
+                break
+            directory, files, generation = request
+            with self.indexCondition:  # let indexerThread show directories first
+                self.indexCondition.wait_for(lambda generation=generation: self.pendingIndexRequests == 0 or generation != self.indexGeneration or self.pluginManager.closing)
+            if generation != self.indexGeneration or self.pluginManager.closing:
+                continue  # skip outdated requests
+            if self.classifyFiles(directory, files):
+                self.signalComm.fileTypesSignal.emit(directory, generation)
+
+    def indexDirectory(self, path: Path, recursionDepth: int, force: bool, generation: int, indexed: list[tuple[Path, list[str]]]) -> None:
+        """Recursively index a directory and send its content to the tree if it has been modified or its tree item has not been populated yet.
+
+        :param path: The directory to be indexed.
+        :type path: pathlib.Path
+        :param recursionDepth: How many levels will be indexed.
+        recursionDepth of more than 2 can lead to very long indexing times.
+        :type recursionDepth: int
+        :param force: Send content even if the directory has not been modified.
+        :type force: bool
+        :param generation: The indexGeneration at the time of the request. Outdated requests are discarded.
+        :type generation: int
+        :param indexed: Collects directories and files that have been sent to the tree.
+        :type indexed: list[tuple[pathlib.Path, list[str]]]
+        """
+        if recursionDepth == 0 or generation != self.indexGeneration or self.pluginManager.closing:  # limit depth to avoid indexing entire storage (can take minutes)
+            return
+        try:
+            directories, files, modified = self.scanDirectory(path)
+        except PermissionError as e:
+            self.print(f'{e}')
+            return  # skip directories that we cannot access
+        except OSError:
+            if path == self.root:
+                self.print(f'{path} is not a valid directory', flag=PRINT.ERROR)
+            return  # subdirectories may have been removed since their parent was indexed
+        if modified or force or path not in self.populatedDirectories:  # cached directories still need to populate new tree items
+            self.signalComm.directoryIndexedSignal.emit(path, directories, files, generation)
+            indexed.append((path, files))
+        for directory in directories:
+            self.indexDirectory(path=path / directory, recursionDepth=recursionDepth - 1, force=force, generation=generation, indexed=indexed)
+
+    def scanDirectory(self, path: Path) -> tuple[list[str], list[str], bool]:
+        """Return the sorted directories and files of a directory.
+
+        Uses the cached content if the directory has not been modified since it was last scanned.
+
+        :param path: The directory to be scanned.
+        :type path: pathlib.Path
+        :return: directories, files, and True if the content has been scanned instead of taken from the cache.
+        :rtype: tuple[list[str], list[str], bool]
+        """
+        modificationTime = path.stat().st_mtime_ns
+        cached = self.directoryCache.get(path)
+        if cached and cached[0] == modificationTime:
+            return cached[1], cached[2], False
+        directories = []
+        files = []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.name.startswith('.'):
+                    continue
+                try:
+                    isDir = entry.is_dir()  # uses file type provided by scandir on most platforms, no additional system call
+                except OSError:
+                    continue
+                if not isDir:
+                    files.append(entry.name)
+                elif not entry.name.startswith('$'):
+                    directories.append(entry.name)
+        directories.sort()
+        files.sort()
+        if time.time_ns() - modificationTime > self.cacheDelay:
+            self.directoryCache[path] = (modificationTime, directories, files)
+        else:
+            self.directoryCache.pop(path, None)
+        return directories, files, True
+
+    def updateDirectory(self, path: Path, directories: list[str], files: list[str], generation: int) -> None:
+        """Update the tree item of an indexed directory, only adding and removing items that changed.
+
+        :param path: The indexed directory.
+        :type path: pathlib.Path
+        :param directories: Names of contained directories.
+        :type directories: list[str]
+        :param files: Names of contained files.
+        :type files: list[str]
+        :param generation: The indexGeneration at the time of the request.
+        :type generation: int
+        """
+        item = self.directoryItems.get(path)
+        if generation != self.indexGeneration or not item:
+            return
+        populating = self.populating
+        self.populating = True  # avoid displaying content if current item is removed
+        searchTerm = self.filterLineEdit.text().lower()
+        names = directories + [file for file in files if not searchTerm or searchTerm in file.lower()]  # don't add files that do not match search_term
+        children = {child.text(0): child for child in [item.child(i) for i in range(item.childCount())] if child}
+        for name in children.keys() - set(names):
+            item.removeChild(children.pop(name))  # remove if does not exist anymore or does not match filter
+            self.forgetDirectory(path / name)
+        for index, name in enumerate(names):
+            if name not in children:  # only add elements that do not exist already, insert at alphabetically correct position
+                child = TreeWidgetItem(None, [name])
+                child.path_info = path / name
+                if index < len(directories):
+                    child.setIcon(0, self.ICON_FOLDER)
+                    self.directoryItems[child.path_info] = child
+                else:
+                    child.setIcon(0, self.getFileIcon(child.path_info, classify=False))  # files that are not classified yet are updated by updateFileIcons
+                item.insertChild(index, child)
+        self.populatedDirectories.add(path)
+        self.populating = populating
+
+    def updateFileIcons(self, path: Path, generation: int) -> None:
+        """Update icons of files after they have been classified.
+
+        :param path: The directory containing the files.
+        :type path: pathlib.Path
+        :param generation: The indexGeneration at the time of the request.
+        :type generation: int
+        """
+        item = self.directoryItems.get(path)
+        if generation != self.indexGeneration or not item:
+            return
+        for child in [item.child(i) for i in range(item.childCount())]:
+            if child and child.path_info not in self.directoryItems:
+                child.setIcon(0, self.getFileIcon(child.path_info, classify=False))
+
+    def getFileTypesFile(self, path: Path) -> Path:
+        """Return the file used to persist file types of a directory.
+
+        :param path: The directory.
+        :type path: pathlib.Path
+        :return: The file in the configuration path.
+        :rtype: pathlib.Path
+        """
+        return getValidConfigPath() / 'fileTypes' / f'{hashlib.sha1(path.as_posix().encode()).hexdigest()}.json'  # noqa: S324
+
+    def getPluginSignature(self) -> list[str]:
+        """Return names and versions of all plugins. Persisted file types are only valid for the same plugins.
+
+        :return: Plugin names and versions.
+        :rtype: list[str]
+        """
+        return [f'{plugin.name} {plugin.version}' for plugin in self.pluginManager.plugins]
+
+    def getDirectoryFileTypes(self, path: Path) -> dict[str, list]:
+        """Return the file types of a directory, loading them from the configuration path if needed.
+
+        :param path: The directory.
+        :type path: pathlib.Path
+        :return: File types of the directory.
+        :rtype: dict[str, list]
+        """
+        if path not in self.fileTypes:
+            fileTypes = {}
+            fileTypesFile = self.getFileTypesFile(path)
+            if fileTypesFile.exists():
+                try:
+                    persisted = json.loads(fileTypesFile.read_text(encoding=self.UTF8))
+                    if persisted.get('plugins') == self.getPluginSignature():
+                        fileTypes = persisted.get('files', {})
+                except (OSError, ValueError) as e:
+                    self.print(f'Could not read file types from {fileTypesFile.name}: {e}', flag=PRINT.DEBUG)
+            self.fileTypes[path] = fileTypes
+        return self.fileTypes[path]
+
+    def classifyFiles(self, path: Path, files: list[str]) -> bool:
+        """Determine and persist which plugins support the files of a directory.
+
+        Only files that are new or have changed size or modification time are classified again.
+
+        :param path: The directory.
+        :type path: pathlib.Path
+        :param files: Names of files in the directory.
+        :type files: list[str]
+        :return: True if any file has been classified.
+        :rtype: bool
+        """
+        fileTypes = self.getDirectoryFileTypes(path)
+        modified = False
+        for name in [name for name in fileTypes if name not in files]:
+            fileTypes.pop(name, None)  # remove files that do not exist anymore
+            modified = True
+        for name in files:
+            if self.pluginManager.closing:
+                break
+            try:
+                stat = (path / name).stat()
+            except OSError:
+                continue
+            fileType = fileTypes.get(name)
+            if not fileType or fileType[0] != stat.st_size or fileType[1] != stat.st_mtime_ns:
+                fileTypes[name] = [stat.st_size, stat.st_mtime_ns, self.getSupportingPluginNames(path / name)]
+                modified = True
+        if modified:
+            fileTypesFile = self.getFileTypesFile(path)
+            try:
+                if not fileTypes:
+                    fileTypesFile.unlink(missing_ok=True)  # nothing to persist for empty directories
+                    return modified
+                fileTypesFile.parent.mkdir(parents=True, exist_ok=True)
+                fileTypesFile.write_text(json.dumps({'directory': path.as_posix(), 'plugins': self.getPluginSignature(), 'files': dict(fileTypes)}), encoding=self.UTF8)
+            except OSError as e:
+                self.print(f'Could not save file types to {fileTypesFile.name}: {e}', flag=PRINT.DEBUG)
+        return modified
+
+    def pruneFileTypes(self) -> None:
+        """Remove persisted file types of directories that do not exist anymore.
+
+        Also removes file types of the least recently classified directories beyond :attr:`~esibd.plugins.Explorer.maxFileTypesFiles`.
+        """
+        try:
+            fileTypesFiles = sorted((getValidConfigPath() / 'fileTypes').glob('*.json'), key=lambda file: file.stat().st_mtime, reverse=True)
+        except OSError:
+            return  # no file types persisted yet or removed in the meantime
+        for i, fileTypesFile in enumerate(fileTypesFiles):
+            if self.pluginManager.closing:
+                break
+            try:
+                directory = json.loads(fileTypesFile.read_text(encoding=self.UTF8)).get('directory') if i < self.maxFileTypesFiles else None
+                if not directory or not Path(directory).is_dir():
+                    fileTypesFile.unlink(missing_ok=True)
+            except (OSError, ValueError, AttributeError) as e:
+                self.print(f'Could not prune file types in {fileTypesFile.name}: {e}', flag=PRINT.DEBUG)
+
+    def getSupportingPluginNames(self, file: Path) -> list[str]:
+        """Test which plugins support a file. May open the file to inspect its content.
+
+        :param file: The file path.
+        :type file: pathlib.Path
+        :return: Names of supporting plugins in order of priority.
+        :rtype: list[str]
+        """
+        names = []
+        for plugin in self.pluginManager.plugins:
+            try:
+                if plugin.supportsFile(file):
+                    names.append(plugin.name)
+            except Exception as e:  # noqa: BLE001
+                self.print(f'{plugin.name} could not inspect {file.name}: {e}', flag=PRINT.DEBUG)
+        return names
+
+    def getSupportingPlugins(self, file: Path, classify: bool = True) -> 'list[Plugin] | None':
+        """Return plugins that support a file, using cached file types if the file has not changed.
+
+        :param file: The file path.
+        :type file: pathlib.Path
+        :param classify: Classify the file if it is not in the cache, otherwise return None. Defaults to True
+        :type classify: bool, optional
+        :return: Supporting plugins in order of priority.
+        :rtype: list[Plugin] | None
+        """
+        fileType = self.fileTypes.get(file.parent, {}).get(file.name)
+        if fileType:
+            try:
+                stat = file.stat()
+            except OSError:
+                stat = None
+            if stat and fileType[0] == stat.st_size and fileType[1] == stat.st_mtime_ns:
+                plugins = {plugin.name: plugin for plugin in self.pluginManager.plugins}
+                return [plugins[name] for name in fileType[2] if name in plugins]
+        if not classify:
+            return None
+        names = self.getSupportingPluginNames(file)
+        return [plugin for plugin in self.pluginManager.plugins if plugin.name in names]
+
+    def forgetDirectory(self, path: Path) -> None:
+        """Stop tracking a directory and its subdirectories after they have been removed from the tree.
+
+        :param path: The removed directory.
+        :type path: pathlib.Path
+        """
+        for directory in [directory for directory in self.directoryItems if directory.is_relative_to(path)]:
+            del self.directoryItems[directory]
+        self.populatedDirectories = {directory for directory in self.populatedDirectories if not directory.is_relative_to(path)}
+        watched = [directory for directory in self.watcher.directories() if Path(directory).is_relative_to(path)]
+        if watched:
+            self.watcher.removePaths(watched)
+
+    def directoryChanged(self, path: str) -> None:
+        """Collect directories modified outside of ESIBD Explorer and index them after changes have settled.
+
+        :param path: The modified directory.
+        :type path: str
+        """
+        self.changedDirectories.add(Path(path))
+        self.watcherTimer.start()
+
+    def indexChangedDirectories(self) -> None:
+        """Index directories that have been modified."""
+        for path in self.changedDirectories:
+            if path in self.directoryItems:
+                self.requestIndex(path, recursionDepth=1)
+        self.changedDirectories.clear()
 
     def browseDir(self) -> None:
         """Set path selected from file dialog as new root directory."""
@@ -7562,7 +9057,7 @@ class Explorer(Plugin):  # noqa: PLR0904
         self.loadingContent = True  # avoid changing activeFileFullPath while previous file is still loading
         handled = False
         try:
-            for plugin in [plugin for plugin in self.pluginManager.plugins if plugin.supportsFile(self.activeFileFullPath)]:
+            for plugin in self.getSupportingPlugins(self.activeFileFullPath) or []:
                 message = f'displayContent {self.activeFileFullPath.name} using {plugin.name}'
                 self.print(shorten_text(message, 86), flag=PRINT.DEBUG)
                 plugin.loadData(file=self.activeFileFullPath, showPlugin=not handled)  # after widget is visible to make sure it is drawn properly
@@ -7574,88 +9069,20 @@ class Explorer(Plugin):  # noqa: PLR0904
         finally:
             self.loadingContent = False
 
-    def load_project_structure(self, startPath: Path, tree: QTreeWidgetItem, search_term: str = '', recursionDepth: int = 2, clear: bool = False) -> None:  # noqa: C901, PLR0912
-        # based on https://stackoverflow.com/questions/5144830/how-to-create-folder-view-in-pyqt-inside-main-window
-        """Recursively map the file structure into the internal Explorer.
-
-        Data from multiple sessions can be accessed from the data path level by expanding the tree.
-
-        :param startPath: The new root directory. The Explorer will show all directories and files contained inside it.
-        :type startPath: pathlib.Path
-        :param tree: The tree that will be used to display directories and files.
-        :type tree: QTreeWidgetItem
-        :param search_term: Content will be filtered using this.
-        :type search_term: str
-        :param recursionDepth: How many levels will be populated. Further levels will be populated as they are expanded.
-        recursionDepth of more than 2 can lead to very long loading times. Defaults to 2
-        :type recursionDepth: int, optional
-        :param clear: If True, all items will be recreated from scratch, otherwise existing items will be updated. Defaults to False
-        :type clear: bool, optional
-        """
-        self.processEvents()
-        # self.tree.update() does not update GUI before completion of event loop
-        if recursionDepth == 0:  # limit depth to avoid indexing entire storage (can take minutes)
-            return
-        recursionDepth -= 1
-        if startPath.is_dir():
-            # List of directories only
-            dirlist = []
-            for x in startPath.iterdir():
-                try:
-                    if (startPath / x).is_dir() and not any(x.name.startswith(sym) for sym in ['.', '$']):
-                        list((startPath / x).iterdir())  # pylint: disable = expression-not-assigned  # raises PermissionError if access is denied, need to use iterator to trigger access
-                        dirlist.append(x)
-                except PermissionError as e:
-                    self.print(f'{e}')
-                    continue  # skip directories that we cannot access
-            # List of files only
-            filelist = [x for x in startPath.iterdir() if not (startPath / x).is_dir() and not x.name.startswith('.')]
-
-            children = [tree.child(i) for i in range(tree.childCount())]  # list of existing children
-            children_text = [child.text(0) for child in children if child]
-            for element in dirlist:  # add all dirs first, then all files
-                path_info = startPath / element
-                if element.name in children_text:  # reuse existing
-                    parent_itm = tree.child(children_text.index(element.name))
-                else:  # add new
-                    parent_itm = TreeWidgetItem(tree, [element.name])
-                    parent_itm.path_info = path_info
-                    parent_itm.setIcon(0, self.ICON_FOLDER)
-                if parent_itm:
-                    self.load_project_structure(startPath=path_info, tree=parent_itm, search_term=search_term, recursionDepth=recursionDepth, clear=clear)
-            for element in [element for element in filelist if ((not search_term or search_term.lower() in element.name.lower()) and element.name not in children_text)]:
-                # don't add files that do not match search_term and only add elements that do not exist already
-                if clear:  # add all items alphabetically
-                    parent_itm = TreeWidgetItem(tree, [element.name])
-                else:  # insert new items at alphabetically correct position
-                    parent_itm = TreeWidgetItem(None, [element.name])
-                    index = next((children_text.index(child_text) for child_text in children_text if child_text > element.name), len(children_text))
-                    tree.insertChild(index, parent_itm)
-                    children_text.insert(index, element.name)
-                if parent_itm:
-                    parent_itm.path_info = startPath / element
-                    parent_itm.setIcon(0, self.getFileIcon(element))
-            for child in children:
-                if child:
-                    if not (startPath / child.text(0)).exists():
-                        tree.removeChild(child)  # remove if does not exist anymore
-                    if (startPath / child.text(0)).is_file() and search_term and search_term.lower() not in child.text(0).lower():
-                        tree.removeChild(child)  # remove files if they do not match filter
-        else:
-            self.print(f'{startPath} is not a valid directory', flag=PRINT.ERROR)
-
-    def getFileIcon(self, file: Path) -> Icon:
+    def getFileIcon(self, file: Path, classify: bool = True) -> Icon:
         """Get the icon of the plugin that will handle the file.
 
         :param file: The file path.
         :type file: pathlib.Path
+        :param classify: Classify the file if it is not in the cache, otherwise use the default icon. Defaults to True
+        :type classify: bool, optional
         :return: The corresponding icon.
         :rtype: esibd.core.Icon
         """
-        plugin = next((plugin for plugin in self.pluginManager.plugins if plugin.supportsFile(file)
-                       if plugin not in {self.pluginManager.Tree, self.pluginManager.Text}), None)
+        plugins = self.getSupportingPlugins(file, classify=classify) or []
+        plugin = next((plugin for plugin in plugins if plugin not in {self.pluginManager.Tree, self.pluginManager.Text}), None)
         if not plugin:  # only use Tree or Text if no other supporting Plugin has been found
-            plugin = next((plugin for plugin in {self.pluginManager.Tree, self.pluginManager.Text} if plugin.supportsFile(file)), None)
+            plugin = next((plugin for plugin in plugins if plugin in {self.pluginManager.Tree, self.pluginManager.Text}), None)
         if plugin:
             return plugin.getIcon()
         return self.ICON_DOCUMENT
@@ -7666,7 +9093,8 @@ class Explorer(Plugin):  # noqa: PLR0904
         :param _dir: The directory to be expanded.
         :type _dir: TreeWidgetItem
         """
-        self.load_project_structure(startPath=_dir.path_info, tree=_dir, search_term=self.filterLineEdit.text())
+        self.requestIndex(_dir.path_info)
+        self.watcher.addPath(_dir.path_info.as_posix())
         _dir.setExpanded(True)
 
     def rootChanging(self, oldRoot: 'Path | None', newRoot: 'Path | None') -> None:
@@ -7687,6 +9115,9 @@ class Explorer(Plugin):  # noqa: PLR0904
     def close(self) -> bool:  # noqa: D102
         response = super().close()
         self.rootChanging(self.pluginManager.Explorer.root, None)
+        self.indexQueue.put(None)  # stop indexerThread
+        self.classifyQueue.put(None)  # stop classifierThread
+        self.notifyClassifier()
         return response
 
     def updateTheme(self) -> None:  # noqa: D102
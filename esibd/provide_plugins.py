@@ -5,7 +5,7 @@ Define all other plugins in devices, scans, examples, displays, or a user plugin
 """
 
 from esibd.extended import ESIBDSettings
-from esibd.plugins import PID, UCM, Browser, Console, DeviceManager, Explorer, Notes, Plugin, Text, Tree
+from esibd.plugins import PID, UCM, Browser, Catalog, Console, DeviceManager, Explorer, Notes, Plugin, Profiler, Text, Tree
 
 
 def providePlugins() -> 'list[type[Plugin]]':
@@ -18,4 +18,4 @@ def providePlugins() -> 'list[type[Plugin]]':
     """
     # with current docking system first four plugins have to be of type DeviceManager, control, console, display, in this order for correct UI layout!
     # make sure optional plugins are at the end of this list
-    return [DeviceManager, ESIBDSettings, Console, Browser, Explorer, Text, Tree, Notes, UCM, PID]
+    return [DeviceManager, ESIBDSettings, Console, Browser, Explorer, Text, Tree, Notes, UCM, PID, Catalog, Profiler]
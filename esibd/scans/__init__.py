@@ -1,6 +1,7 @@
 """Label this directory as a Python package."""
 
 from .beam.beam import Beam  # noqa: F401
+from .bo.bo import BOScan  # noqa: F401
 from .depo.depo import Depo  # noqa: F401
 from .energy.energy import Energy  # noqa: F401
 from .ga.ga import GAScan  # noqa: F401
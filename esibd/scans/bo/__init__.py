@@ -0,0 +1 @@
+"""Label this directory as a Python package."""
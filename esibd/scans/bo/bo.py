@@ -0,0 +1,67 @@
+from typing import TYPE_CHECKING
+
+from esibd.core import PARAMETERTYPE, Parameter, dynamicImport, parameterDict
+from esibd.scans.ga.ga import GAScan
+
+if TYPE_CHECKING:
+    from esibd.plugins import Plugin
+
+
+def providePlugins() -> 'list[type[Plugin]]':
+    """Return list of provided plugins. Indicates that this module provides plugins."""
+    return [BOScan]
+
+
+class BOScan(GAScan):
+    """Sample efficient alternative to the GA scan based on Bayesian optimization.
+
+    Uses the same input channel selection and limits as the GA scan, but a Gaussian process surrogate model and
+    the expected improvement acquisition function decide which settings to evaluate next.
+    This typically requires far fewer evaluations, which is important when every evaluation costs seconds of beam time.
+    Multiple settings can be proposed at once (Batch size) before the surrogate is updated.
+    Evaluations stored by previous GA and BO runs on the same channel in the current session folder can be used as a warm start.
+    """
+
+    documentation = """Sample efficient alternative to the GA scan based on Bayesian optimization.
+    Uses the same input channel selection and limits as the GA scan, but a Gaussian process surrogate model and
+    the expected improvement acquisition function decide which settings to evaluate next.
+    This typically requires far fewer evaluations, which is important when every evaluation costs seconds of beam time.
+    Multiple settings can be proposed at once (Batch size) before the surrogate is updated.
+    Evaluations stored by previous GA and BO runs on the same channel in the current session folder can be used as a warm start.
+    """
+
+    # inherits from GAScan to share channel selection, plotting, and change log. Only the optimizer is replaced.
+
+    name = 'BO'
+    version = '1.0'
+    iconFile = 'BO_light.png'
+    iconFileDark = 'BO_dark.png'
+
+    BATCHSIZE = 'Batch size'
+    WARMSTART = 'Warm start'
+    batchSize: int
+    warmStart: bool
+
+    def loadOptimizer(self) -> None:
+        Module = dynamicImport('bo_standalone', self.dependencyPath / 'bo_standalone.py')
+        if Module:
+            self.ga = Module.BO()
+
+    def getDefaultSettings(self) -> dict[str, dict]:
+        defaultSettings = super().getDefaultSettings()
+        defaultSettings[self.GACHANNEL][Parameter.TOOLTIP] = 'Bayesian optimization optimizes on this channel'
+        defaultSettings[self.BATCHSIZE] = parameterDict(value=4, parameterType=PARAMETERTYPE.INT, minimum=1, maximum=50, attr='batchSize',
+                                                        toolTip='Number of settings that are evaluated before the surrogate model is updated.')
+        defaultSettings[self.WARMSTART] = parameterDict(value=True, parameterType=PARAMETERTYPE.BOOL, attr='warmStart',
+                                                        toolTip='Reuse evaluations stored by previous GA and BO runs on the same channel in the current session folder.')
+        return defaultSettings
+
+    def initScan(self) -> bool:
+        self.ga.batch_size = self.batchSize
+        if super().initScan():
+            if self.warmStart:
+                files = sorted([*self.file.parent.glob('*_restore.npz'), *self.file.parent.glob('*_history.npz')])
+                if files:
+                    self.print(f'Warm start using {self.ga.warm_start(files)} evaluations from {len(files)} previous runs.')
+            return True
+        return False
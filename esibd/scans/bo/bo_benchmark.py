@@ -0,0 +1,94 @@
+# pylint: disable=[missing-module-docstring]  # see function docstrings
+import argparse
+import importlib.util
+from pathlib import Path
+
+import numpy as np
+
+# Offline comparison of Bayesian optimization and the GA on synthetic landscapes. Does not require any hardware or the GUI.
+# Run with: python esibd/scans/bo/bo_benchmark.py --parameters 4 --evaluations 200
+
+
+def loadModule(name, path):
+    """Load a module directly from file to avoid importing the GUI via the esibd.scans package.
+
+    :param name: Module name.
+    :type name: str
+    :param path: Module path.
+    :type path: pathlib.Path
+    :return: The module.
+    :rtype: ModuleType
+    """
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def runOptimizer(optimizer, objective, parameters, evaluations, target, seed):  # noqa: PLR0913
+    """Minimize objective using an optimizer with the GA interface.
+
+    :param optimizer: Instance of GA or BO.
+    :type optimizer: object
+    :param objective: Function that maps a parameter vector to a fitness value.
+    :type objective: Callable
+    :param parameters: Number of optimized parameters.
+    :type parameters: int
+    :param evaluations: Maximum number of evaluations.
+    :type evaluations: int
+    :param target: Fitness that has to be reached.
+    :type target: float
+    :param seed: Random seed for reproducible results.
+    :type seed: int
+    :return: Evaluations needed to reach target (None if not reached), best fitness.
+    :rtype: tuple[int | None, float]
+    """
+    optimizer.init(seed=seed)
+    optimizer.save(False)  # noqa: FBT003
+    optimizer.maximize(False)  # noqa: FBT003
+    rng = np.random.default_rng(seed)
+    labels = [f'p{i}' for i in range(parameters)]
+    for label in labels:
+        optimizer.optimize(rng.uniform(2, 4), -5, 5, .2, 1, label)  # same start and limits for both optimizers
+    optimizer.genesis()
+    if optimizer.current_being < 0:  # GA starts with current_being = -1
+        optimizer.check_restart()
+    evaluationsToTarget = None
+    best = np.inf
+    for evaluation in range(1, evaluations + 1):
+        fitness = objective(np.array([optimizer.GAget(label) for label in labels]))
+        optimizer.fitness(fitness)
+        best = min(best, fitness)
+        if evaluationsToTarget is None and fitness <= target:
+            evaluationsToTarget = evaluation
+            break
+        optimizer.check_restart()
+    return evaluationsToTarget, float(best)
+
+
+if __name__ == '__main__':
+    gaPath = Path(__file__).parent.parent / 'ga'
+    gaBenchmark = loadModule('ga_benchmark', gaPath / 'ga_benchmark.py')
+    GA = loadModule('ga_standalone', gaPath / 'ga_standalone.py').GA
+    BO = loadModule('bo_standalone', Path(__file__).parent / 'bo_standalone.py').BO
+    parser = argparse.ArgumentParser(description='Compare evaluations to target for BO and GA on synthetic objectives.')
+    parser.add_argument('--objective', choices=[*gaBenchmark.OBJECTIVES.keys(), 'all'], default='all')
+    parser.add_argument('--parameters', type=int, default=4)
+    parser.add_argument('--evaluations', type=int, default=200)
+    parser.add_argument('--target', type=float, default=1)
+    parser.add_argument('--batch', type=int, default=4)
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+    for name, function in gaBenchmark.OBJECTIVES.items():
+        if args.objective in {name, 'all'}:
+            for optimizerName, Optimizer in (('GA', GA), ('BO', BO)):
+                results = []
+                for seed in range(args.repeats):
+                    optimizer = Optimizer()
+                    if optimizerName == 'BO':
+                        optimizer.batch_size = args.batch
+                    results.append(runOptimizer(optimizer, function, args.parameters, args.evaluations, args.target, seed))
+                reached = [evaluations for evaluations, _ in results if evaluations is not None]
+                print(f'{name:>12} {optimizerName}: reached target in {len(reached)}/{args.repeats} runs, '  # noqa: T201
+                      f'median evaluations to target: {np.median(reached) if reached else np.nan:8.1f}, '
+                      f'median best fitness: {np.median([best for _, best in results]):10.3e}')
@@ -0,0 +1,491 @@
+# pylint: disable=[missing-module-docstring]  # see class docstrings
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+from scipy.linalg import cho_factor, cho_solve
+from scipy.stats import norm
+
+
+class GaussianProcess:
+    """Minimal CPU-only Gaussian process regression with a Matern 5/2 kernel.
+
+    Inputs are expected to be normalized to the unit hypercube and outputs to be standardized.
+    Hyperparameters are chosen from a small grid by maximizing the log marginal likelihood,
+    which is robust and fast for the few hundred evaluations that are feasible on real hardware.
+    """
+
+    LENGTHSCALES = (0.05, 0.1, 0.2, 0.3, 0.5, 0.8, 1.2)
+    NOISES = (1e-4, 1e-3, 1e-2, 1e-1)
+
+    def __init__(self) -> None:
+        """Initialize an empty Gaussian process."""
+        self.lengthscale = 0.3
+        self.noise = 1e-3
+        self.x = np.zeros((0, 0))
+        self.y = np.zeros(0)
+        self.factor = None
+        self.alpha = np.zeros(0)
+
+    def kernel(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """Return the Matern 5/2 covariance between two sets of points.
+
+        :param a: Points with shape (n, d).
+        :type a: np.ndarray
+        :param b: Points with shape (m, d).
+        :type b: np.ndarray
+        :return: Covariance matrix with shape (n, m).
+        :rtype: np.ndarray
+        """
+        distance = np.sqrt(np.maximum(((a[:, None, :] - b[None, :, :])**2).sum(axis=2), 0)) / self.lengthscale
+        return (1 + np.sqrt(5) * distance + 5 / 3 * distance**2) * np.exp(-np.sqrt(5) * distance)
+
+    def fit(self, x: np.ndarray, y: np.ndarray, optimize: bool = True) -> None:
+        """Condition the Gaussian process on observations.
+
+        :param x: Normalized inputs with shape (n, d).
+        :type x: np.ndarray
+        :param y: Standardized outputs with shape (n,).
+        :type y: np.ndarray
+        :param optimize: Select hyperparameters by maximizing the log marginal likelihood, defaults to True
+        :type optimize: bool, optional
+        """
+        self.x, self.y = x, y
+        if optimize:
+            best = -np.inf
+            bestParameters = (self.lengthscale, self.noise)
+            for lengthscale in self.LENGTHSCALES:
+                for noise in self.NOISES:
+                    self.lengthscale, self.noise = lengthscale, noise
+                    likelihood = self.logMarginalLikelihood()
+                    if likelihood > best:
+                        best, bestParameters = likelihood, (lengthscale, noise)
+            self.lengthscale, self.noise = bestParameters
+        self.logMarginalLikelihood()  # update factor and alpha for selected hyperparameters
+
+    def logMarginalLikelihood(self) -> float:
+        """Factorize the covariance matrix for the current hyperparameters and return the log marginal likelihood.
+
+        :return: Log marginal likelihood, -inf if the covariance matrix is not positive definite.
+        :rtype: float
+        """
+        covariance = self.kernel(self.x, self.x) + self.noise * np.eye(len(self.x))
+        try:
+            self.factor = cho_factor(covariance, lower=True)
+        except np.linalg.LinAlgError:
+            return -np.inf
+        self.alpha = cho_solve(self.factor, self.y)
+        return float(-0.5 * self.y @ self.alpha - np.log(np.diag(self.factor[0])).sum())
+
+    def predict(self, x: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Return posterior mean and standard deviation.
+
+        :param x: Normalized inputs with shape (m, d).
+        :type x: np.ndarray
+        :return: mean, std
+        :rtype: tuple[np.ndarray, np.ndarray]
+        """
+        if self.factor is None or len(self.x) == 0:
+            return np.zeros(len(x)), np.ones(len(x))
+        crossCovariance = self.kernel(x, self.x)
+        mean = crossCovariance @ self.alpha
+        variance = 1 - (crossCovariance * cho_solve(self.factor, crossCovariance.T).T).sum(axis=1)
+        return mean, np.sqrt(np.maximum(variance, 1e-12))
+
+
+class BO:
+    """Sample efficient Bayesian optimization using a Gaussian process surrogate and expected improvement.
+
+    Provides the same interface as the genetic algorithm in ga_standalone so it can be used as a drop in replacement by scans.
+    A generation corresponds to a batch of proposals that are evaluated before the surrogate is updated.
+    Batches are generated using the kriging believer heuristic, i.e. pending proposals are added with their predicted mean.
+    """
+
+    def __init__(self) -> None:
+        """Initialize optimizer."""
+        self.batch_size = 4  # number of proposals evaluated before the surrogate is updated
+        self.initial_samples = 0  # number of space filling samples before the surrogate is used. 0 -> 2 * active parameters + 2
+        self.candidates = 2000  # number of candidates evaluated by the acquisition function
+        self.xi = 0.01  # exploration parameter of expected improvement
+        self._save = True
+        self.session_saved = False  # True if the session has been saved at the end of the last batch
+        self._objective = ''  # name of the optimized quantity, saved to history to identify compatible runs
+        self.init()
+
+    def init(self, seed: 'int | None' = None) -> None:
+        """Restore initial state. Configuration like batch_size is kept.
+
+        :param seed: Random seed for reproducible results, defaults to None
+        :type seed: int, optional
+        """
+        self.rng = np.random.default_rng(seed)
+        self.labels = []
+        self.initial = []
+        self.min = []
+        self.max = []
+        self.active = []
+        self.observedValues = np.zeros((0, 0))  # all evaluated settings, one row per evaluation
+        self.observedFitnesses = np.zeros(0)
+        self.values = np.zeros((0, 0))  # current batch of proposals
+        self.fitnesses = np.zeros(0)
+        self.current_being = 0
+        self.current_generation = 1
+        self.gp = GaussianProcess()
+        self._maximize = True
+        self._file_path = ''
+        self._file_name = 'BO'
+        self.historyfile = ''
+        self.bestfile = ''
+        self.first_run = True
+
+    def maximize(self, maximize: 'bool | None' = None) -> 'bool | None':
+        """Set or get optimization direction.
+
+        :param maximize: True to maximize, False to minimize, None to get current setting, defaults to None
+        :type maximize: bool, optional
+        :return: Current setting if maximize is None.
+        :rtype: bool | None
+        """
+        if maximize is None:
+            return self._maximize
+        self._maximize = maximize
+        return None
+
+    def optimize(self, initial: float = 0, _min: float = 0, _max: float = 100, _rate: float = .2, _range: float = 10, label: str = '') -> None:  # noqa: ARG002, PLR0913
+        """Add a parameter for optimization. Same signature as GA.optimize, _range is ignored.
+
+        :param initial: Initial value.
+        :type initial: float
+        :param _min: Lower limit.
+        :type _min: float
+        :param _max: Upper limit.
+        :type _max: float
+        :param _rate: Parameters with a rate of 0 are kept at their initial value.
+        :type _rate: float
+        :param _range: Not used.
+        :type _range: float
+        :param label: Parameter name.
+        :type label: str
+        """
+        if label in self.labels:
+            index = self.labels.index(label)
+            self.initial[index], self.min[index], self.max[index], self.active[index] = initial, _min, _max, _rate > 0
+        else:
+            self.labels.append(label)
+            self.initial.append(initial)
+            self.min.append(_min)
+            self.max.append(_max)
+            self.active.append(_rate > 0)
+
+    def genesis(self) -> None:
+        """Prepare first batch of proposals. The first proposal always corresponds to the initial settings."""
+        self.initial = np.array(self.initial, dtype=np.float64)
+        self.min = np.array(self.min, dtype=np.float64)
+        self.max = np.array(self.max, dtype=np.float64)
+        self.active = np.array(self.active, dtype=bool)
+        self.observedValues = np.zeros((0, len(self.labels)))
+        self.observedFitnesses = np.zeros(0)
+        self.values = np.vstack([self.initial, self.propose(self.batch_size - 1)]) if self.batch_size > 1 else self.initial[None, :]
+        self.fitnesses = np.full(len(self.values), np.nan)
+        self.current_being = 0
+        print(f'BO: Starting Generation {self.current_generation}:')  # noqa: T201
+
+    def normalize(self, values: np.ndarray) -> np.ndarray:
+        """Map active parameters to the unit hypercube.
+
+        :param values: Parameter values with shape (n, parameters).
+        :type values: np.ndarray
+        :return: Normalized active parameters with shape (n, active parameters).
+        :rtype: np.ndarray
+        """
+        span = np.where(self.max > self.min, self.max - self.min, 1)
+        return ((values - self.min) / span)[:, self.active]
+
+    def denormalize(self, x: np.ndarray) -> np.ndarray:
+        """Map normalized active parameters back to full parameter vectors. Inactive parameters keep their initial value.
+
+        :param x: Normalized active parameters with shape (n, active parameters).
+        :type x: np.ndarray
+        :return: Parameter values with shape (n, parameters).
+        :rtype: np.ndarray
+        """
+        values = np.tile(self.initial, (len(x), 1))
+        values[:, self.active] = self.min[self.active] + np.clip(x, 0, 1) * (self.max - self.min)[self.active]
+        return values
+
+    def propose(self, n: int) -> np.ndarray:
+        """Propose n new settings based on all observations.
+
+        :param n: Number of proposals.
+        :type n: int
+        :return: Proposed settings with shape (n, parameters).
+        :rtype: np.ndarray
+        """
+        dimensions = int(self.active.sum())
+        if n < 1:
+            return np.zeros((0, len(self.labels)))
+        if dimensions == 0:
+            return np.tile(self.initial, (n, 1))
+        initialSamples = self.initial_samples or 2 * dimensions + 2
+        if len(self.observedFitnesses) < initialSamples:  # latin hypercube sampling until the surrogate has enough data
+            x = (np.argsort(self.rng.random((n, dimensions)), axis=0) + self.rng.random((n, dimensions))) / n
+            return self.denormalize(x)
+        x = self.normalize(self.observedValues)
+        y = self.observedFitnesses if self._maximize else -self.observedFitnesses
+        offset, scale = y.mean(), y.std() or 1
+        y = (y - offset) / scale
+        self.gp.fit(x, y)
+        proposals = []
+        for i in range(n):
+            candidates = self.candidatePoints(x[np.argmax(y)], dimensions)
+            mean, std = self.gp.predict(candidates)
+            improvement = mean - y.max() - self.xi
+            z = improvement / std
+            expectedImprovement = improvement * norm.cdf(z) + std * norm.pdf(z)
+            best = candidates[np.argmax(expectedImprovement)]
+            proposals.append(best)
+            if i < n - 1:  # kriging believer: assume predicted mean for pending proposal to diversify batch
+                x = np.vstack([x, best])
+                y = np.append(y, mean[np.argmax(expectedImprovement)])
+                self.gp.fit(x, y, optimize=False)
+        return self.denormalize(np.array(proposals))
+
+    def candidatePoints(self, best: np.ndarray, dimensions: int) -> np.ndarray:
+        """Return random candidates that cover the whole space and the neighborhood of the best observation.
+
+        :param best: Normalized best observation.
+        :type best: np.ndarray
+        :param dimensions: Number of active parameters.
+        :type dimensions: int
+        :return: Normalized candidates.
+        :rtype: np.ndarray
+        """
+        global_candidates = self.rng.random((self.candidates // 2, dimensions))
+        local_candidates = np.clip(best + self.rng.normal(scale=0.05, size=(self.candidates - self.candidates // 2, dimensions)), 0, 1)
+        return np.vstack([global_candidates, local_candidates])
+
+    def fitness(self, fitness: 'float | None' = None) -> 'float | None':
+        """Set or get fitness of current proposal.
+
+        :param fitness: Fitness value to assign, defaults to None
+        :type fitness: float, optional
+        :return: Fitness if fitness is None.
+        :rtype: float | None
+        """
+        if fitness is None:
+            return self.fitnesses[self.current_being]
+        self.fitnesses[self.current_being] = fitness
+        return None
+
+    def check_restart(self, _terminate: bool = False) -> tuple[bool, bool]:
+        """Advance to the next proposal. Updates the surrogate and proposes a new batch once the current batch is evaluated.
+
+        :param _terminate: Save and stop after current batch, defaults to False
+        :type _terminate: bool, optional
+        :return: True if the next setting should be applied and tested, True if a batch has been completed. session_saved indicates if the session has been saved.
+        :rtype: tuple[bool, bool]
+        """
+        if self.current_being < len(self.values) - 1 and not _terminate:
+            self.current_being += 1
+            return True, False
+        evaluated = ~np.isnan(self.fitnesses)
+        self.observedValues = np.vstack([self.observedValues, self.values[evaluated]])
+        self.observedFitnesses = np.append(self.observedFitnesses, self.fitnesses[evaluated])
+        self.session_saved = self.save_session()
+        if _terminate:
+            self.values, self.fitnesses = self.values[:0], self.fitnesses[:0]  # GAget(index=0) returns best observation
+            self.current_being = 0
+            return False, True
+        self.current_generation += 1
+        print(f'BO: Starting Generation {self.current_generation}:')  # noqa: T201
+        self.values = self.propose(self.batch_size)
+        self.fitnesses = np.full(len(self.values), np.nan)
+        self.current_being = 0
+        return True, True
+
+    def ranking(self) -> np.ndarray:
+        """Return indices of observations sorted from best to worst.
+
+        :return: Sorted indices.
+        :rtype: np.ndarray
+        """
+        return np.argsort(-self.observedFitnesses if self._maximize else self.observedFitnesses, kind='stable')
+
+    def GAget(self, label: str, default: float = 0, index: int = -1, initial: bool = False) -> float:  # noqa: N802
+        """Return value of a parameter.
+
+        :param label: Parameter name.
+        :type label: str
+        :param default: Returned if the parameter is not optimized, defaults to 0
+        :type default: float, optional
+        :param index: -1 for current proposal, otherwise rank of observation (0 is best), defaults to -1
+        :type index: int, optional
+        :param initial: Return initial value, defaults to False
+        :type initial: bool, optional
+        :return: Parameter value.
+        :rtype: float
+        """
+        if label not in self.labels:
+            return default
+        column = self.labels.index(label)
+        if initial:
+            return float(self.initial[column])
+        if index == -1 and len(self.values) > 0:
+            return float(self.values[self.current_being, column])
+        if len(self.observedFitnesses) == 0:
+            return float(self.initial[column])
+        return float(self.observedValues[self.ranking()[max(index, 0)], column])
+
+    def best_fitness(self) -> float:
+        """Return best observed fitness.
+
+        :return: Best fitness.
+        :rtype: float
+        """
+        if len(self.observedFitnesses) == 0:
+            return np.nan
+        return float(self.observedFitnesses.max() if self._maximize else self.observedFitnesses.min())
+
+    def average_fitness(self) -> float:
+        """Return average fitness of the last evaluated batch.
+
+        :return: Average fitness.
+        :rtype: float
+        """
+        batch = self.observedFitnesses[-self.batch_size:]
+        return float(np.mean(batch)) if len(batch) > 0 else np.nan
+
+    def step_string(self) -> str:
+        """Return a description of the current step.
+
+        :return: Step description.
+        :rtype: str
+        """
+        return f'BO: {self.current_generation}.{self.current_being} Fitness = {self.fitnesses[self.current_being]:6.2f}'
+
+    def file_path(self, file_path: 'str | None' = None) -> 'str | None':
+        """Set or get directory used to store results.
+
+        :param file_path: Directory, defaults to None
+        :type file_path: str, optional
+        :return: Directory if file_path is None.
+        :rtype: str | None
+        """
+        if file_path is None:
+            return self._file_path
+        self._file_path = file_path
+        Path(file_path).mkdir(parents=True, exist_ok=True)
+        self.updatePaths()
+        return None
+
+    def file_name(self, file_name: 'str | None' = None) -> 'str | None':
+        """Set or get file name used to store results.
+
+        :param file_name: File name, defaults to None
+        :type file_name: str, optional
+        :return: File name if file_name is None.
+        :rtype: str | None
+        """
+        if file_name is None:
+            return self._file_name
+        self._file_name = file_name
+        self.updatePaths()
+        return None
+
+    def updatePaths(self) -> None:
+        """Update paths of result files."""
+        self.bestfile = f'{self._file_path}/{self._file_name}_best.txt'
+        self.historyfile = f'{self._file_path}/{self._file_name}_history.npz'
+
+    def save(self, save: 'bool | None' = None) -> 'bool | None':
+        """Enable or disable writing files, e.g. for benchmarks.
+
+        :param save: Indicates if files should be written, defaults to None
+        :type save: bool, optional
+        :return: Current setting if save is None.
+        :rtype: bool | None
+        """
+        if save is None:
+            return self._save
+        self._save = save
+        return None
+
+    def objective(self, objective: 'str | None' = None) -> 'str | None':
+        """Set or get the name of the optimized quantity, e.g. a channel name.
+
+        :param objective: Name of the objective, defaults to None
+        :type objective: str, optional
+        :return: Current objective if objective is None.
+        :rtype: str | None
+        """
+        if objective is None:
+            return self._objective
+        self._objective = objective
+        return None
+
+    def save_session(self) -> bool:
+        """Save all observations and append best result to a text log.
+
+        The history uses the same keys as the GA restore file so that both can be used for warm starts.
+
+        :return: True if the session has been saved.
+        :rtype: bool
+        """
+        if not self._save or not self._file_path or len(self.observedFitnesses) == 0:
+            return False
+        try:
+            np.savez(self.historyfile, generation=self.current_generation, labels=np.array(self.labels),
+                     values=self.observedValues, fitnesses=self.observedFitnesses, objective=self._objective)
+            with Path(self.bestfile).open('a', encoding='utf-8') as bestFile:
+                if self.first_run:
+                    bestFile.write(f"{'gen':>4}{'date     time':>20}{'avg fit':>10}{'best fit':>10}{''.join([f'{label:>15}' for label in self.labels])}\n")
+                best = self.ranking()[0]
+                bestFile.write(f"{self.current_generation:4d}{datetime.now().strftime('%m/%d/%Y %H:%M:%S'):>20}{self.average_fitness():10.2f}"
+                               f"{self.observedFitnesses[best]:10.2f}{''.join([f'{value:15.3e}' for value in self.observedValues[best]])}\n")
+        except OSError as e:
+            print(f'BO: could not save session: {e}')  # noqa: T201
+            return False
+        self.first_run = False
+        return True
+
+    def warm_start(self, files: 'list[Path]') -> int:
+        """Reuse evaluations from previous GA restore files or BO history files.
+
+        Parameters are matched by label. Parameters missing in a file use their initial value. Evaluations outside the current limits are ignored.
+        Files are skipped if they optimized a different objective, do not specify their objective, or share no active parameter with the current run.
+        Call after genesis. The current batch is replaced by proposals that take the loaded evaluations into account.
+
+        :param files: Files containing labels, values, and fitnesses.
+        :type files: list[pathlib.Path]
+        :return: Number of loaded evaluations.
+        :rtype: int
+        """
+        loaded = 0
+        for file in files:
+            try:
+                with np.load(file) as data:
+                    labels, values, fitnesses = [str(label) for label in data['labels']], data['values'], data['fitnesses']
+                    objective = str(data['objective']) if 'objective' in data.files else None
+            except (OSError, KeyError, ValueError) as e:
+                print(f'BO: could not load {file}: {e}')  # noqa: T201
+                continue
+            if objective != self._objective:
+                print(f'BO: skipping {file}: objective {objective} does not match {self._objective}')  # noqa: T201
+                continue
+            if not any(label in labels for label, active in zip(self.labels, self.active, strict=True) if active):
+                print(f'BO: skipping {file}: no matching parameters')  # noqa: T201
+                continue
+            rows = min(len(values), len(fitnesses))
+            mapped = np.tile(self.initial, (rows, 1))
+            for j, label in enumerate(labels):
+                if label in self.labels:
+                    mapped[:, self.labels.index(label)] = values[:rows, j]
+            valid = np.all((mapped >= self.min) & (mapped <= self.max), axis=1) & np.isfinite(fitnesses[:rows])
+            self.observedValues = np.vstack([self.observedValues, mapped[valid]])
+            self.observedFitnesses = np.append(self.observedFitnesses, fitnesses[:rows][valid])
+            loaded += int(valid.sum())
+        if loaded > 0:
+            self.values = self.propose(self.batch_size)
+            self.fitnesses = np.full(len(self.values), np.nan)
+            self.current_being = 0
+        return loaded
@@ -254,7 +254,6 @@ class Depo(Scan):
         """
         if super().initScan() and self.displayActive() and not self._dummy_initialization:
             if len([outputChannel for outputChannel in self.outputChannels if outputChannel.unit == 'pA']) > 0:  # at least one current channel
-                self.measurementsPerStep = max(int(self.average / self.interval) - 1, 1)
                 self.display.progressAnnotation.set_text('')
                 self.display.updateDepoTarget()  # flip axes if needed
                 return True
@@ -266,7 +265,7 @@ class Depo(Scan):
     def addOutputChannels(self) -> None:
         if self.channelTree:
             for name in self.settingsMgr.settings[self.DISPLAY].items:
-                channel = self.addOutputChannel(name=name, recordingData=DynamicNp())
+                channel = self.addOutputChannel(name=name, recordingData=DynamicNp(), recordingDataStd=DynamicNp())
                 if channel and channel.sourceChannel and hasattr(channel.sourceChannel, 'resetCharge'):
                     cast('Depo.ChargeChannel', channel.sourceChannel).resetCharge()
                     self.addOutputChannel(name=f'{name}_{self.CHARGE}', unit='pAh', recordingData=DynamicNp())
@@ -330,22 +329,25 @@ class Depo(Scan):
                             else:
                                 self.print(f'Line not initialized for channel {outputChannel.name}', flag=PRINT.WARNING)
                 time_done_str = 'unknown'
-                end_str = 'end'
+                predicting = False
                 if len(time_stamp_axis) > self.MIN_FIT_DATA_POINTS or (len(time_stamp_axis) > 0 and done):  # predict scan based on last 10 data points
-                    if len(time_stamp_axis) > self.MIN_FIT_DATA_POINTS and update and np.abs(charge[-1]) < np.abs(float(self.target)) and np.abs(charge[-1]) > np.abs(charge[-10]):
+                    if (len(time_stamp_axis) > self.MIN_FIT_DATA_POINTS and update and np.abs(charge[-1]) < np.abs(float(self.target)) and
+                        np.abs(charge[-1]) > np.abs(charge[-self.MIN_FIT_DATA_POINTS])):
                         # only predict if below target and charge is increasing
-                        # Pseudo code: t_t=t_i + dt/dQ * Q_remaining
-                        time_done = datetime.fromtimestamp(float(time_axis[-1] + (time_axis[-1] - time_axis[-10]) / (charge[-1] - charge[-10]) * (float(self.target) - charge[-1])))
-                        self.display.chargePredictionLine.set_data([time_stamp_axis[-1], time_done], [charge[-1], self.target])  # type: ignore  # noqa: PGH003
-                        time_done_str = self.roundDateTime(time_done).strftime('%H:%M')
-                        end_str = 'estimated end'
+                        predicting = True  # prediction line and annotation will be updated when prediction is available
+                        self.pluginManager.analysisPool.submit(key=f'{self.name}.chargePrediction',
+                            job=lambda _, t=time_axis[-self.MIN_FIT_DATA_POINTS:].copy(), q=np.array(charge[-self.MIN_FIT_DATA_POINTS:]), target=float(self.target):
+                                self.predictionJob(t, q, target),
+                            callback=lambda result, start=time_stamp_axis[0], t=float(time_axis[-1]), q=float(charge[-1]), deposited=float(charge[-1] - charge[0]):
+                                self.plotPrediction(result, start, t, q, deposited))
                     else:
                         # hide at beginning and end of scan or if loaded from file
+                        self.pluginManager.analysisPool.cancel(key=f'{self.name}.chargePrediction')
                         self.display.chargePredictionLine.set_data([[time_stamp_axis[0]]], [0])  # type: ignore  # noqa: PGH003
                     if done:
                         time_done_str = self.roundDateTime(time_stamp_axis[-1]).strftime('%H:%M')
-                if len(time_stamp_axis) > 0:  # predict scan based on last 10 data points
-                    self.display.progressAnnotation.set_text(f"start: {self.roundDateTime(time_stamp_axis[0]).strftime('%H:%M')}, {end_str}: {time_done_str}\n"
+                if len(time_stamp_axis) > 0 and not predicting:
+                    self.display.progressAnnotation.set_text(f"start: {self.roundDateTime(time_stamp_axis[0]).strftime('%H:%M')}, end: {time_done_str}\n"
                                             f"{charge[-1] - charge[0]:2.1f} pAh deposited")
         else:  # no data
             self.removeAnnotations(self.display.axes[1])
@@ -360,6 +362,53 @@ class Depo(Scan):
         self.updateToolBar(update=update)
         self.defaultLabelPlot()
 
+    def predictionJob(self, time_axis, charge, target) -> float | None:
+        """Predict when the target charge will be reached. Executed by :class:`~esibd.core.AnalysisPool` in a worker thread.
+
+        Uses a linear least squares fit of the charge to be robust against noise on individual data points.
+
+        :param time_axis: Recent time stamps.
+        :type time_axis: np.ndarray
+        :param charge: Corresponding charge values.
+        :type charge: np.ndarray
+        :param target: Target charge.
+        :type target: float
+        :return: Time stamp at which target will be reached or None if charge is not approaching target.
+        :rtype: float | None
+        """
+        slope, _ = np.polyfit(time_axis - time_axis[-1], charge, 1)  # time relative to last point for numerical stability
+        if slope == 0 or np.sign(slope) != np.sign(target - charge[-1]):
+            return None
+        # Pseudo code: t_t=t_i + dt/dQ * Q_remaining
+        return float(time_axis[-1] + (target - charge[-1]) / slope)
+
+    def plotPrediction(self, time_done, start, time_last, charge_last, deposited) -> None:
+        """Plot the prediction of when the target charge will be reached.
+
+        :param time_done: Predicted time stamp or None if not available.
+        :type time_done: float | None
+        :param start: Start of deposition.
+        :type start: datetime.datetime
+        :param time_last: Time stamp of last data point.
+        :type time_last: float
+        :param charge_last: Charge of last data point.
+        :type charge_last: float
+        :param deposited: Deposited charge.
+        :type deposited: float
+        """
+        if not self.displayActive() or not self.display.canvas:
+            return
+        time_done_str = 'unknown'
+        if time_done is not None:
+            time_done_datetime = datetime.fromtimestamp(time_done)
+            self.display.chargePredictionLine.set_data([datetime.fromtimestamp(time_last), time_done_datetime], [charge_last, self.target])  # type: ignore  # noqa: PGH003
+            time_done_str = self.roundDateTime(time_done_datetime).strftime('%H:%M')
+        else:  # hide previous prediction, annotation shows estimated end as unknown
+            self.display.chargePredictionLine.set_data([[start]], [0])  # type: ignore  # noqa: PGH003
+        self.display.progressAnnotation.set_text(f"start: {self.roundDateTime(start).strftime('%H:%M')}, estimated end: {time_done_str}\n"
+                                                 f'{deposited:2.1f} pAh deposited')
+        self.display.canvas.draw_idle()
+
     def pythonPlotCode(self) -> str:
         return f"""# add your custom plot code here
 
@@ -442,16 +491,21 @@ fig.show()
     def runScan(self, recording) -> None:
         while recording():
             time.sleep(self.interval / 1000)
+            stepTime = time.time()
             self.bufferLagging()
             self.waitForCondition(condition=lambda: self.stepProcessed, timeoutMessage='processing scan step.', timeout=10)
-            self.inputChannels[0].recordingData.add(time.time())
+            self.inputChannels[0].recordingData.add(stepTime)
+            indexWindows = {}  # search time axis only once per device
             for outputChannel in self.outputChannels:
                 if outputChannel.isChargeChannel:
                     outputChannel.recordingData.add(cast('Depo.ChargeChannel', outputChannel.sourceChannel).charge)
                 else:
-                    outputValues = outputChannel.getValues(subtractBackground=outputChannel.getDevice().subtractBackgroundActive(), length=self.measurementsPerStep)
-                    if outputValues is not None:
-                        outputChannel.recordingData.add(float(np.mean(outputValues)))
+                    stepStatistics = outputChannel.getStepStatistics(t_min=stepTime - self.average / 1000, t_max=stepTime,
+                                                                     subtractBackground=outputChannel.getDevice().subtractBackgroundActive(), indexWindows=indexWindows)
+                    if stepStatistics is not None:
+                        outputChannel.recordingData.add(stepStatistics.mean)
+                        if isinstance(outputChannel.recordingDataStd, DynamicNp):
+                            outputChannel.recordingDataStd.add(stepStatistics.std)
             if self.warn and winsound:  # Sound only supported for windows
                 outputData = self.getData(self.getOutputIndex(), INOUT.OUT)
                 outputDataPlus1 = self.getData(self.getOutputIndex() + 1, INOUT.OUT)
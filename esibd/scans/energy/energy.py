@@ -1,3 +1,4 @@
+import contextlib
 from typing import TYPE_CHECKING, cast
 
 import h5py
@@ -153,21 +154,13 @@ class Energy(Scan):
                         self.display.seGrad.set_data(x, self.map_percent(-y))
                         for ann in [child for child in self.display.axes[1].get_children() if isinstance(child, Annotation)]:
                             ann.remove()
-                        if done:
-                            try:
-                                x_fit, y_fit, expected_value, fwhm = self.gauss_fit(x, y, np.mean(x))  # use center as starting guess
-                                if inputRecordingData0[0] <= expected_value <= inputRecordingData0[-1]:
-                                    self.display.seFit.set_data(x_fit, self.map_percent(y_fit))
-                                    self.display.axes[1].annotate(text='', xy=(expected_value - fwhm / 2.3, 50), xycoords='data',
-                                                                   xytext=(expected_value + fwhm / 2.3, 50), textcoords='data',
-                                        arrowprops={'arrowstyle': '<->', 'color': self.MYRED}, va='center')
-                                    self.display.axes[1].annotate(text=f'center: {expected_value:2.1f} V\nFWHM: {fwhm:2.1f} V',
-                                                                   xy=(expected_value - fwhm / 1.6, 50), xycoords='data', fontsize=10.0,
-                                        textcoords='data', ha='right', va='center', color=self.MYRED)
-                                else:
-                                    self.print('Fitted mean outside data range. Ignore fit.', flag=PRINT.WARNING)
-                            except (RuntimeError, ValueError) as e:
-                                self.print(f'Fit failed with error: {e}')
+                        if done:  # fit in background and plot when done
+                            outputName = self.outputChannels[self.getOutputIndex()].name
+                            self.pluginManager.analysisPool.submit(key=f'{self.name}.{outputName}', job=lambda lastResult, x=x, y=y: self.fitJob(x, y, lastResult),
+                                                                   callback=lambda result, x_min=inputRecordingData0[0], x_max=inputRecordingData0[-1], outputName=outputName:
+                                                                   self.plotFit(result, x_min, x_max, outputName))
+                        else:
+                            self.pluginManager.analysisPool.cancel(key=f'{self.name}.{self.outputChannels[self.getOutputIndex()].name}')
                         # ControlCursor has to be initialized last, otherwise axis limits may be affected.
                         self.display.axes[-1].cursor = ControlCursor(self.display.axes[-1], colors.highlight, horizOn=False)
                     else:  # no data
@@ -287,7 +280,7 @@ fig.show()
         """
         return amp1 * (1 / (sigma1 * (np.sqrt(2 * np.pi)))) * (np.exp(-((x - cen1)**2) / (2 * (sigma1)**2)))
 
-    def gauss_fit(self, x, y, c) -> tuple[np.ndarray, np.ndarray, float, float]:
+    def gauss_fit(self, x, y, c, p0=None) -> tuple[np.ndarray, np.ndarray, float, float]:
         """Perform simple gaussian fit.
 
         :param x: X values.
@@ -296,13 +289,112 @@ fig.show()
         :type y: np.ndarray
         :param c: Guess of central value.
         :type c: float
+        :param p0: Initial amplitude, center, and width, e.g. from a previous fit. Overwrites c if provided. Defaults to None
+        :type p0: np.ndarray, optional
         :return: X values with fine step size, corresponding fitted Y values, center, full with have maximum
         :rtype: np.ndarray, np.ndarray, float, float
         """
+        gauss = self.gauss_fit_parameters(x, y, c, p0)
+        fwhm = round(2.355 * gauss[2], 1)  # Calculate FWHM
+        x_fine = np.arange(np.min(x), np.max(x), 0.05)
+        return x_fine, -self.gaussian(x_fine, gauss[0], gauss[1], gauss[2]), gauss[1], fwhm
+
+    def gauss_fit_parameters(self, x, y, c, p0=None) -> np.ndarray:
+        """Return optimized amplitude, center, and width of a gaussian.
+
+        :param x: X values.
+        :type x: np.ndarray
+        :param y: Y values.
+        :type y: np.ndarray
+        :param c: Guess of central value.
+        :type c: float
+        :param p0: Initial amplitude, center, and width, e.g. from a previous fit. Overwrites c if provided. Defaults to None
+        :type p0: np.ndarray, optional
+        :return: Amplitude, center, and width.
+        :rtype: np.ndarray
+        """
         # Define a gaussian to start with
         amp1 = 100
         sigma1 = 2
-        gauss, *_ = optimize.curve_fit(self.gaussian, x, y, p0=[amp1, c, sigma1])
-        fwhm = round(2.355 * gauss[2], 1)  # Calculate FWHM
+        gauss, *_ = optimize.curve_fit(self.gaussian, x, y, p0=[amp1, c, sigma1] if p0 is None else p0)
+        return gauss
+
+    def fitJob(self, x, y, lastResult) -> 'tuple[np.ndarray, np.ndarray, float, float, np.ndarray] | None':
+        """Fit a gaussian. Executed by :class:`~esibd.core.AnalysisPool` in a worker thread.
+
+        :param x: X values.
+        :type x: np.ndarray
+        :param y: Y values.
+        :type y: np.ndarray
+        :param lastResult: Result of previous fit used for warm start, if available.
+        :type lastResult: tuple | None
+        :return: X values with fine step size, corresponding fitted Y values, center, full with have maximum, and fit parameters or None if fit failed.
+        :rtype: tuple | None
+        """
+        gauss = None
+        if lastResult is not None:
+            with contextlib.suppress(RuntimeError, ValueError):  # fall back to default starting guess
+                gauss = self.gauss_fit_parameters(x, y, np.mean(x), p0=lastResult[-1])
+        try:
+            if gauss is None or not np.min(x) <= gauss[1] <= np.max(x):
+                gauss = self.gauss_fit_parameters(x, y, np.mean(x))  # use center as starting guess
+        except (RuntimeError, ValueError) as e:
+            self.print(f'Fit failed with error: {e}')
+            return None
         x_fine = np.arange(np.min(x), np.max(x), 0.05)
-        return x_fine, -self.gaussian(x_fine, gauss[0], gauss[1], gauss[2]), gauss[1], fwhm
+        return x_fine, -self.gaussian(x_fine, gauss[0], gauss[1], gauss[2]), gauss[1], round(2.355 * gauss[2], 1), gauss
+
+    def plotFit(self, result, x_min, x_max, outputName: str = '') -> None:
+        """Plot result of gaussian fit.
+
+        :param result: Result of :meth:`~esibd.scans.energy.energy.Energy.fitJob`.
+        :type result: tuple | None
+        :param x_min: First input value of fitted scan.
+        :type x_min: float
+        :param x_max: Last input value of fitted scan.
+        :type x_max: float
+        :param outputName: Name of the fitted output channel. The fit is ignored if another channel is displayed in the meantime. Defaults to ''
+        :type outputName: str, optional
+        """
+        if not self.displayActive() or not self.display.canvas:
+            return
+        if outputName and (len(self.outputChannels) == 0 or self.outputChannels[self.getOutputIndex()].name != outputName):
+            return  # display channel changed while fitting
+        if result is None:
+            self.clearFit()
+            return
+        x_fit, y_fit, expected_value, fwhm, _ = result
+        if x_min <= expected_value <= x_max:
+            self.clearFit()
+            self.display.seFit.set_data(x_fit, self.map_percent(y_fit))
+            self.display.axes[1].annotate(text='', xy=(expected_value - fwhm / 2.3, 50), xycoords='data',
+                                           xytext=(expected_value + fwhm / 2.3, 50), textcoords='data',
+                arrowprops={'arrowstyle': '<->', 'color': self.MYRED}, va='center')
+            self.display.axes[1].annotate(text=f'center: {expected_value:2.1f} V\nFWHM: {fwhm:2.1f} V',
+                                           xy=(expected_value - fwhm / 1.6, 50), xycoords='data', fontsize=10.0,
+                textcoords='data', ha='right', va='center', color=self.MYRED)
+            self.resetCursor()
+            self.display.canvas.draw_idle()
+        else:
+            self.print('Fitted mean outside data range. Ignore fit.', flag=PRINT.WARNING)
+            self.clearFit()
+
+    def clearFit(self) -> None:
+        """Remove fitted line and annotations of a previous fit."""
+        self.display.seFit.set_data([], [])
+        for ann in [child for child in self.display.axes[1].get_children() if isinstance(child, Annotation)]:
+            ann.remove()
+        self.display.canvas.draw_idle()
+
+    def resetCursor(self) -> None:
+        """Recreate the cursor at its current position so it stays the last element added to the axis."""
+        cursor = getattr(self.display.axes[-1], 'cursor', None)
+        if cursor is None:
+            return
+        position = cursor.getPosition()
+        cursor.disconnect_events()
+        cursor.lineh.remove()
+        cursor.linev.remove()
+        # ControlCursor has to be initialized last, otherwise axis limits may be affected.
+        self.display.axes[-1].cursor = ControlCursor(self.display.axes[-1], colors.highlight, horizOn=False)
+        self.display.axes[-1].cursor.setPosition(*position)
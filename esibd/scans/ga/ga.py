@@ -1,9 +1,8 @@
 import time
 from datetime import datetime
+from pathlib import Path
 from typing import TYPE_CHECKING
 
-import numpy as np
-
 from esibd.core import INOUT, PARAMETERTYPE, PRINT, DynamicNp, MetaChannel, Parameter, ScanChannel, dynamicImport, parameterDict, plotting, pyqtSignal
 from esibd.plugins import Scan
 
@@ -87,17 +86,23 @@ class GAScan(Scan):
 
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
+        self.loadOptimizer()
+        self.signalComm.updateValuesSignal.connect(self.updateValues)
+        self.changeLog = []
+
+    def loadOptimizer(self) -> None:
+        """Load the optimizer. Extend to use alternative optimizers that provide the same interface as ga_standalone.GA."""
         Module = dynamicImport('ga_standalone', self.dependencyPath / 'ga_standalone.py')
         if Module:
             self.ga = Module.GA()
-        self.signalComm.updateValuesSignal.connect(self.updateValues)
-        self.changeLog = []
 
     def initGUI(self) -> None:
         super().initGUI()
         self.recordingAction.setToolTip('Toggle optimization.')
-        self.initialAction = self.addStateAction(event=self.toggleInitial, toolTipFalse='Switch to initial settings.', iconFalse=self.makeIcon('switch-medium_on.png'),
-                                                 toolTipTrue='Switch to optimized settings.', iconTrue=self.makeIcon('switch-medium_off.png'),
+        iconPath = Path(__file__).parent  # also used by scans that inherit from GA
+        self.initialAction = self.addStateAction(event=self.toggleInitial,
+                                                 toolTipFalse='Switch to initial settings.', iconFalse=self.makeIcon('switch-medium_on.png', path=iconPath),
+                                                 toolTipTrue='Switch to optimized settings.', iconTrue=self.makeIcon('switch-medium_off.png', path=iconPath),
                                                    attr='applyInitialParameters', restore=False)
 
     def runTestParallel(self) -> None:
@@ -147,6 +152,7 @@ class GAScan(Scan):
             self.ga.genesis()
             self.ga.file_path(self.file.parent.as_posix())
             self.ga.file_name(self.file.name)
+            self.ga.objective(self.outputChannels[0].name)
             self.initialAction.state = False
             return True
         return False
@@ -210,31 +216,38 @@ fig.show()
 
     def runScan(self, recording) -> None:
         # first datapoint before optimization
-        self.inputChannels[0].recordingData.add(time.time())
-        outputChannelValues = self.outputChannels[0].getValues(subtractBackground=self.outputChannels[0].subtractBackgroundActive(), length=self.measurementsPerStep)
-        if outputChannelValues is not None:
-            fitnessStart = float(np.mean(outputChannelValues))
-            self.outputChannels[0].recordingData.add(fitnessStart)
-            self.outputChannels[1].recordingData.add(fitnessStart)
+        stepTime = time.time()
+        self.inputChannels[0].recordingData.add(stepTime)
+        stepStatistics = self.outputChannels[0].getStepStatistics(t_min=stepTime - self.average / 1000, t_max=stepTime,
+                                                                  subtractBackground=self.outputChannels[0].subtractBackgroundActive())
+        if stepStatistics is not None:
+            self.outputChannels[0].recordingData.add(stepStatistics.mean)
+            self.outputChannels[1].recordingData.add(stepStatistics.mean)
             while recording():
-                outputChannelValues = self.outputChannels[0].getValues(subtractBackground=self.outputChannels[0].subtractBackgroundActive(), length=self.measurementsPerStep)
-                if outputChannelValues is None:
-                    self.print('outputChannelValues not defined', flag=PRINT.ERROR)
-                    return
                 self.signalComm.updateValuesSignal.emit(-1, False)  # noqa: FBT003
                 if self.invalidWhileWaiting:
                     for outputChannel in self.outputChannels:
                         if isinstance(outputChannel, ScanChannel):
                             outputChannel.signalComm.waitUntilStableSignal.emit(self.wait)
-                time.sleep((self.wait + self.average) / 1000)
+                time.sleep(self.wait / 1000)
+                settledTime = time.time()
+                time.sleep(self.average / 1000)
+                stepTime = time.time()
                 self.bufferLagging()
                 self.waitForCondition(condition=lambda: self.stepProcessed, timeoutMessage='processing scan step.', timeout=10)
-                self.ga.fitness(np.mean(outputChannelValues))
+                # evaluate only values recorded after the current being has been applied and the signal had time to stabilize
+                stepStatistics = self.outputChannels[0].getStepStatistics(t_min=settledTime, t_max=stepTime,
+                                                                          subtractBackground=self.outputChannels[0].subtractBackgroundActive())
+                if stepStatistics is None:
+                    self.print('outputChannelValues not defined', flag=PRINT.ERROR)
+                    return
+                self.ga.fitness(stepStatistics.mean)
                 if self.log:
-                    self.print(self.ga.step_string().replace('GA: ', ''))
-                _, session_saved = self.ga.check_restart()
-                if session_saved:
-                    self.print(f'Session Saved -- Average Fitness: {self.ga.average_fitness():6.2f} Best Fitness: {self.ga.best_fitness():6.2f}')
+                    self.print(self.ga.step_string().split(': ', 1)[-1])  # remove prefix of GA or BO
+                _, generation_completed = self.ga.check_restart()
+                if generation_completed:
+                    self.print(f"{'Session Saved' if self.ga.session_saved else 'Generation Completed'} -- "
+                               f'Average Fitness: {self.ga.average_fitness():6.2f} Best Fitness: {self.ga.best_fitness():6.2f}')
                     self.print(f'Starting Generation {self.ga.current_generation}:')
                     self.inputChannels[0].recordingData.add(time.time())
                     self.outputChannels[0].recordingData.add(self.ga.best_fitness())
@@ -0,0 +1,102 @@
+# pylint: disable=[missing-module-docstring]  # see function docstrings
+#################### Imports  ##########################################
+import argparse
+import importlib.util
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Offline benchmark for the GA engine using synthetic objectives. Does not require any hardware or the GUI.
+# Run with: python esibd/scans/ga/ga_benchmark.py --parameters 10 --generations 200
+
+
+def loadGA():
+    """Load ga_standalone directly from file to avoid importing the GUI via the esibd.scans package.
+
+    :return: The GA class.
+    :rtype: type
+    """
+    spec = importlib.util.spec_from_file_location('ga_standalone', Path(__file__).parent / 'ga_standalone.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.GA
+
+
+def sphere(x):
+    """Sphere function, minimum 0 at x = 0."""
+    return np.sum(x**2)
+
+
+def rastrigin(x):
+    """Rastrigin function, minimum 0 at x = 0, highly multimodal."""
+    return 10 * len(x) + np.sum(x**2 - 10 * np.cos(2 * np.pi * x))
+
+
+def rosenbrock(x):
+    """Rosenbrock function, minimum 0 at x = 1."""
+    return np.sum(100 * (x[1:] - x[:-1]**2)**2 + (1 - x[:-1])**2)
+
+
+OBJECTIVES = {'sphere': sphere, 'rastrigin': rastrigin, 'rosenbrock': rosenbrock}
+
+
+def runBenchmark(objective, parameters=10, generations=200, target=1e-1, seed=0):  # noqa: PLR0913
+    """Minimize a synthetic objective and report evaluations to target and GA overhead per generation.
+
+    :param objective: Function that maps a parameter vector to a fitness value.
+    :type objective: Callable
+    :param parameters: Number of optimized parameters, defaults to 10
+    :type parameters: int, optional
+    :param generations: Maximum number of generations, defaults to 200
+    :type generations: int, optional
+    :param target: Fitness that has to be reached, defaults to 1e-1
+    :type target: float, optional
+    :param seed: Random seed for reproducible results, defaults to 0
+    :type seed: int, optional
+    :return: Evaluations needed to reach target (None if not reached), best fitness, mean GA overhead per generation in ms.
+    :rtype: tuple[int | None, float, float]
+    """
+    GA = loadGA()
+    ga = GA()
+    ga.init(seed=seed)
+    ga.save(False)  # noqa: FBT003
+    ga.maximize(False)  # noqa: FBT003
+    rng = np.random.default_rng(seed)
+    labels = [f'p{i}' for i in range(parameters)]
+    for label in labels:
+        ga.optimize(rng.uniform(2, 4), -5, 5, .2, 1, label)
+    ga.genesis()
+    evaluations = 0
+    evaluationsToTarget = None
+    overhead = []  # time spent in check_restart (selection, crossover, mutation, sorting) per generation
+    generationOverhead = 0
+    ga.check_restart()  # advance to first being
+    while ga.current_generation <= generations:
+        ga.fitness(objective(np.array([ga.GAget(label) for label in labels])))
+        evaluations += 1
+        if evaluationsToTarget is None and ga.fitness() <= target:
+            evaluationsToTarget = evaluations
+        start = time.perf_counter()
+        _, generation_completed = ga.check_restart()
+        generationOverhead += time.perf_counter() - start
+        if generation_completed:
+            overhead.append(generationOverhead * 1000)
+            generationOverhead = 0
+    ga.check_restart(_terminate=True)
+    return evaluationsToTarget, float(ga.best_fitness()), float(np.mean(overhead)) if overhead else np.nan
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Offline benchmark for the GA optimizer.')
+    parser.add_argument('--objective', choices=[*OBJECTIVES.keys(), 'all'], default='all')
+    parser.add_argument('--parameters', type=int, default=10)
+    parser.add_argument('--generations', type=int, default=200)
+    parser.add_argument('--target', type=float, default=1e-1)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    for name, function in OBJECTIVES.items():
+        if args.objective in {name, 'all'}:
+            evaluations, best, overheadMs = runBenchmark(function, args.parameters, args.generations, args.target, args.seed)
+            print(f'{name:>12}: evaluations to target: {evaluations if evaluations is not None else "not reached":>12}, '  # noqa: T201
+                  f'best fitness: {best:10.3e}, GA overhead per generation: {overheadMs:8.3f} ms')
@@ -9,11 +9,14 @@ import numpy as np
 class GA():
     """Genetic Algorithm for Optimization of Almost Everything
     by ioneater (ioneater.dev@gmail.com)
-    Version: 3.2 (2013-2022 / re implemented in Python in 2020)
-    Adopted for use with PyQt applications"""
+    Version: 3.3 (2013-2025 / re implemented in Python in 2020)
+    Adopted for use with PyQt applications
+    The population is stored as a pop_size x n_params matrix and a fitness vector.
+    Selection, crossover, and mutation operate on the entire population at once."""
     def __init__(self):
         #################### Private Variables  ##################################
-        self.population              = []    # array of all beings
+        self.values                  = np.zeros((0, 0))  # parameters of all beings, one row per being
+        self.fitnesses               = np.zeros(0)  # fitness of all beings
         self.seeds                   = []    # array of all parameters to optimize with restrictions
         self.seed_dict               = {}    # dictionary to relate label to seed
         self.current_being           = 0     # index of current being (counting up during generation)
@@ -27,6 +30,7 @@ class GA():
         self._converged              = 0     # count for how many steps best_fitness has not increased
         self.first_run               = True  # only True during first generation (also first generation after restart)
         self._maximize               = True  # max or minimize
+        self.rng                     = np.random.default_rng()
 
         self.fit_best                = 0     # best fitness since last fitness function change
         self.beststring = ''
@@ -36,9 +40,13 @@ class GA():
         self._file_path              = ''    # file path used to store the results
         self._file_name              = 'GA'  # file name used to store the results
         self._restore                = False  # if True the last saved configuration will be restored
+        self._save                   = True  # if False no files will be written, e.g. for benchmarks
+        self.session_saved           = False  # True if the session has been saved at the end of the last generation
+        self._objective              = ''  # name of the optimized quantity, saved to restore file to identify compatible runs
 
         self.bestfile                = ''
         self.restorefile             = ''
+        self.restorefile_legacy      = ''
         # self.terminate  # Simion specific parameter that is not implemented in python version
         self.init()
 
@@ -47,50 +55,39 @@ class GA():
 
     #################### Private Functions  ################################
 
-    def select_parent(self):
-        parent=0
-        if np.random.rand() < 0.5:  # tournament selection (best of 3 random picked)
-            r = np.random.randint(self.num_elite)  # get random integer in range [1, num_elite]
-            parent=r
-            for i in np.arange(2):
-                r = np.random.randint(self.num_elite)
-                parent = r if r < parent else parent  # keep lowes index==highest fitness as parent
-        else:  # rank weighting
-            r=np.random.rand()
-            for i, p in enumerate(self.p_rank):
-                if p > r:
-                    parent = i
-                    break
-        return parent
-
-
-
-    def mix(self, a, b):  # continuous mixing of parameters from different parents
-        beta=np.random.rand()
-        return beta*a+(1-beta)*b,(1-beta)*a+beta*b
-
-
-    def crossover(self):
-        for i in np.arange(self.pop_size)[self.num_elite::2]:  # iterate over every second child (always generate two at a time)
-            ma=self.select_parent()
-            pa=self.select_parent()
-            while ma == pa:  # make sure to avoid incest
-                pa=self.select_parent()
-            for j in np.arange(len(self.seeds)):
-                self.population[i].values[j], self.population[i+1].values[j]=self.mix(self.population[ma].values[j], self.population[pa].values[j])
+    def select_parents(self, n):  # returns indices of n parents
+        tournament = self.rng.integers(self.num_elite, size=(n, 3)).min(axis=1)  # tournament selection (best of 3 random picked), lowest index==highest fitness
+        rank = np.minimum(np.searchsorted(self.p_rank, self.rng.random(n), side='right'), self.num_elite-1)  # rank weighting
+        return np.where(self.rng.random(n) < 0.5, tournament, rank)
 
 
+    def select_parent(self):
+        return int(self.select_parents(1)[0])
 
 
+    def crossover(self):  # continuous mixing of parameters from different parents, always generate two children at a time
+        n_pairs = (self.pop_size - self.num_elite)//2
+        ma = self.select_parents(n_pairs)
+        pa = self.select_parents(n_pairs)
+        same = ma == pa
+        while same.any():  # make sure to avoid incest
+            pa[same] = self.select_parents(int(same.sum()))
+            same = ma == pa
+        beta = self.rng.random((n_pairs, len(self.seeds)))
+        values_ma, values_pa = self.values[ma], self.values[pa]
+        self.values[self.num_elite:self.num_elite + 2*n_pairs:2] = beta*values_ma + (1-beta)*values_pa
+        self.values[self.num_elite + 1:self.num_elite + 2*n_pairs:2] = (1-beta)*values_ma + beta*values_pa
 
 
 
     def mutate(self):
-        for being in self.population[self.num_elite:]:  # iterate over children
-            for i, seed in enumerate(self.seeds):  # iterate over parameters
-                being.values[i]=noise(being.values[i], seed)
+        self.values[self.num_elite:] = self.noise(self.values[self.num_elite:])  # only mutate children
 
 
+    def noise(self, values):  # changes each parameter with probability rate by up to +/- range within limits
+        mutate = self.rng.random(values.shape) < self._rate
+        delta = self.rng.random(values.shape)*2*self._range - self._range
+        return np.where(mutate, np.clip(values + delta, self._min, self._max), values)
 
 
 
@@ -103,32 +100,32 @@ class GA():
 
 
     def save_session(self):
-        """always save current state in files"""
+        """Save current state in files unless saving is disabled. Returns True if the session has been saved."""
+        if not self._save:
+            return False
         try:
             best_file=open(self.bestfile, 'a', encoding = 'utf-8')  # append
-            restore_file=open(self.restorefile, 'w', encoding = 'utf-8')  # overwrite
         except Exception as e:
             print(f'GA: could not save session: {e}')
-            return
+            return False
         self.beststring = ''# save fitness and chromosome of best candidate of each generation
-        restorestring = '%10s'%'best fit'  # save num_elite best ones fore restoring simulation
+        restorestring = '%10s'%'best fit'
         for label in [s.label for s in self.seeds]:
             restorestring=restorestring + '%15s'%label
-        restore_file.write('generation %i\n'%self.current_generation)
-        restore_file.write(restorestring + '\n')  # write header for columns
         if self.first_run:
             best_file.write('%4s%20s%10s%s\n'%('gen','date     time','avg fit', restorestring))  # write header for columns
-        for i in np.arange(self.num_elite):
-            restorestring='%10.2f'%self.population[i].fitness
-            for j in np.arange(len(self.seeds)):
-                restorestring=restorestring + '%15.3e'%self.population[i].values[j]
-            if i==0:
-                best_file.write('%4d%20s%10.2f%s\n'%(self.current_generation, datetime.now().strftime("%m/%d/%Y %H:%M:%S"), self.average_fitness(), restorestring))
-            restore_file.write(restorestring + '\n')
+        restorestring='%10.2f'%self.fitnesses[0] + ''.join(['%15.3e'%value for value in self.values[0]])
+        best_file.write('%4d%20s%10.2f%s\n'%(self.current_generation, datetime.now().strftime("%m/%d/%Y %H:%M:%S"), self.average_fitness(), restorestring))
         best_file.close()
-        restore_file.close()
+        try:  # save num_elite best ones for restoring simulation in binary checkpoint
+            np.savez(self.restorefile, generation=self.current_generation, labels=np.array([s.label for s in self.seeds]),
+                     values=self.values[:self.num_elite], fitnesses=self.fitnesses[:self.num_elite], objective=self._objective)
+        except Exception as e:
+            print(f'GA: could not save session: {e}')
+            return False
         print('GA: Session Saved -- Average Fitness: %6.2f Best Fitness: %6.2f'%(self.average_fitness(), self.best_fitness()))
         self.first_run=False
+        return True
 
 
 
@@ -137,20 +134,26 @@ class GA():
 
 
     def restore_session(self):  # restore only if activated by user
-        if os.path.exists(self.restorefile):
-            restore_file=open(self.restorefile, 'r', encoding = 'utf-8')
-        else:
-            restore_file=False
-        if restore_file and self._restore:  # adopt parents from file and create children  #  always evaluate parents after restoring session since fitness function might have changed
-            self.current_generation= 1 + int(re.search('(\d+)', restore_file.readline()).group(1))  # additional information from first row
-            restore_file.readline()  #skip header
-            for i in np.arange(self.num_elite):
-                # skip fitness as evaluated in last run -- reject since fitness function and many other things might have cchanged and a fresh evaluation is needed
-                for j, n in enumerate(restore_file.readline().split()[1:]):
-                    self.population[i].values[j]=float(n)
-            restore_file.close()
+        restored_file = ''  # file from which the session has been restored
+        if self._restore and os.path.exists(self.restorefile):
+            with np.load(self.restorefile) as checkpoint:
+                self.current_generation = 1 + int(checkpoint['generation'])
+                values = checkpoint['values']
+                for j, label in enumerate(checkpoint['labels']):  # only restore parameters that are still optimized
+                    if str(label) in self.seed_dict:
+                        self.values[:min(self.num_elite, values.shape[0]), self.seed_dict[str(label)]] = values[:self.num_elite, j]
+            restored_file = self.restorefile
+        elif self._restore and os.path.exists(self.restorefile_legacy):  # text based restore file from previous versions
+            with open(self.restorefile_legacy, 'r', encoding = 'utf-8') as restore_file:
+                self.current_generation= 1 + int(re.search(r'(\d+)', restore_file.readline()).group(1))  # additional information from first row
+                restore_file.readline()  #skip header
+                for i in np.arange(self.num_elite):
+                    self.values[i] = [float(n) for n in restore_file.readline().split()[1:]]
+            restored_file = self.restorefile_legacy
+        if restored_file:  # adopt parents from file and create children  #  always evaluate parents after restoring session since fitness function might have changed
+            # skip fitness as evaluated in last run -- reject since fitness function and many other things might have cchanged and a fresh evaluation is needed
             print('GA: session ' + self._file_name + ' restored')
-            print('GA: ATTENTION: parameters are loaded from ' + self._file_name + '_restore.txt')
+            print('GA: ATTENTION: parameters are loaded from ' + restored_file)
             self.crossover()
             self.mutate()
         else:
@@ -158,6 +161,10 @@ class GA():
 
     ################### Public Variables  ##################################
 
+    @property
+    def population(self):  # read only view of population for backwards compatibility
+        return [Being(values, fitness) for values, fitness in zip(self.values, self.fitnesses)]
+
     def maximize(self, maximize=None):
         if maximize is not None:
             self._maximize = maximize
@@ -175,7 +182,7 @@ class GA():
             if initial:
                 return self.seeds[self.seed_dict[label]].initial  # return initial parameter
             else:
-                return self.round_to_n(self.population[self.current_being if index == -1 else index].values[self.seed_dict[label]], 6)  # return values rounded to 6 significant digits
+                return self.round_to_n(self.values[self.current_being if index == -1 else index, self.seed_dict[label]], 6)  # return values rounded to 6 significant digits
         else:
             return default  # allows to quickly change between optimized parameters without changing the implementation around GAget
 
@@ -183,20 +190,20 @@ class GA():
 
 
     def best_fitness(self):  # make sure to sort population before calling this to incude recent results
-        return self.population[0].fitness  # note python counts from 0
+        return self.fitnesses[0]  # note python counts from 0
 
 
     def average_fitness(self):  # average of parents fitness
-        return np.mean([b.fitness for b in self.population[:self.num_elite]])
+        return np.mean(self.fitnesses[:self.num_elite])
 
 
 
 
     def fitness(self, fitness=None):  # sets or gets fitness of current being
         if fitness is not None:
-            self.population[self.current_being].fitness=fitness
+            self.fitnesses[self.current_being]=fitness
         else:
-            return self.round_to_n(self.population[self.current_being].fitness, 6)  # round to 6 significant digits
+            return self.round_to_n(self.fitnesses[self.current_being], 6)  # round to 6 significant digits
 
 
 
@@ -213,7 +220,7 @@ class GA():
 
 
     def file_path(self, file_path=None):
-        if self.file_path is not None:
+        if file_path is not None:
             self._file_path=file_path
             self.updatePaths()
             if not os.path.isdir(file_path):
@@ -231,7 +238,8 @@ class GA():
 
     def updatePaths(self):
         self.bestfile = self._file_path + '/' + self._file_name + '_best.txt'
-        self.restorefile = self._file_path + '/' + self._file_name + '_restore.txt'
+        self.restorefile = self._file_path + '/' + self._file_name + '_restore.npz'
+        self.restorefile_legacy = self._file_path + '/' + self._file_name + '_restore.txt'
 
 
     def rescan_every(self, rescan_every=None):
@@ -246,6 +254,20 @@ class GA():
             self._restore=restore
 
 
+    def save(self, save=None):  # disable to run without writing files, e.g. for benchmarks
+        if save is not None:
+            self._save=save
+        else:
+            return self._save
+
+
+    def objective(self, objective=None):  # name of optimized quantity, e.g. channel name
+        if objective is not None:
+            self._objective=objective
+        else:
+            return self._objective
+
+
     def converged(self):
         return self._converged
 
@@ -256,9 +278,10 @@ class GA():
 
     ################### Public Functions  ##################################
 
-    def init(self):  # restore initial state
-        np.random.seed()
-        self.population            = []
+    def init(self, seed=None):  # restore initial state, provide seed for reproducible results
+        self.rng                   = np.random.default_rng(seed)
+        self.values                = np.zeros((0, 0))
+        self.fitnesses             = np.zeros(0)
         self.seeds                 = []
         self.seed_dict             = {}
         self.current_being         = -1
@@ -297,33 +320,43 @@ class GA():
     def genesis(self):
         self.pop_size=max(self.pop_size, 10)
         self.num_elite=int(max(self.pop_size/2, 6))
-        self.p_rank=np.zeros(self.num_elite)  ## p_rank[0] is used only for calculation in next line
-        for i in np.arange(self.num_elite):
-            self.p_rank[i]=(self.num_elite-i)/(np.arange(self.num_elite)+1).sum()+(self.p_rank[i-1] if i>0 else 0)
-        for i in np.arange(self.pop_size):
-            self.population.append(Being(self._maximize, self.seeds, i==0))  # keep original settings in first being and add noise to others
+        self.p_rank=np.cumsum(np.arange(self.num_elite, 0, -1)/(np.arange(self.num_elite)+1).sum())  # cumulative probabilities to select parent of certain rank
+        # seed properties as arrays to mutate all parameters at once
+        self._initial = np.array([seed.initial for seed in self.seeds], dtype=np.float64)
+        self._min     = np.array([seed.min for seed in self.seeds], dtype=np.float64)
+        self._max     = np.array([seed.max for seed in self.seeds], dtype=np.float64)
+        self._rate    = np.array([seed.rate for seed in self.seeds], dtype=np.float64)
+        self._range   = np.array([seed.range for seed in self.seeds], dtype=np.float64)
+        self.values = np.tile(self._initial, (self.pop_size, 1))
+        self.values[1:] = self.noise(self.values[1:])  # keep original settings in first being and add noise to others
+        self.fitnesses = np.full(self.pop_size, -np.inf if self._maximize else np.inf)  # make sure that non evaluated beings end up at the bottom of the list after sorting
         self.restore_session()
         print('GA: Starting Generation %i:'%self.current_generation)
 
 
+    def sort(self):  # sort population by fitness, best first
+        order = np.argsort(-self.fitnesses if self._maximize else self.fitnesses, kind='stable')
+        self.values = self.values[order]
+        self.fitnesses = self.fitnesses[order]
 
 
 
     def check_restart(self, _terminate=False):
-        """Returns True if the next setting should be applied and tested. The second return parameter indicates if a new session has started"""
+        """Returns True if the next setting should be applied and tested. The second return parameter indicates if a generation has been completed.
+        session_saved indicates if the session has been saved after completing the generation."""
         if self.current_being < self.pop_size-1 and not _terminate:
             self.current_being=self.current_being+1
             #print('increased current_being to', current_being)
             return True, False  # i.e. fly again with chromosome of current_being
         else:  # initialize new generation
-            self.population.sort(key=lambda being: being.fitness, reverse = self._maximize)
+            self.sort()
             self._converged = self._converged + 1 if self.best_fitness() <= self.fit_best else 0  # count up if fitness not improved otherwise reset
             self.fit_best = self.fit_best if self._converged != 0 else self.best_fitness()
             self._best_fitness_array.append(self.best_fitness())
             self._avg_fitness_array .append(self.average_fitness())
             self._gen_seconds_array .append(int(round(time.time())))  # time in s
             self.at_generation_completed()
-            self.save_session()
+            self.session_saved = self.save_session()
             if _terminate:
                 self.current_being=0  # make sure GAget returns best parameters even without explicit index
                 return False, True
@@ -349,7 +382,7 @@ class GA():
         self.rescan=1
 
     def GAprint(self, a):  # Prints to sdt out and also writes to the GA log file.
-        best=open(self.file_path + '/' + self.file_name + '_best.txt','a', encoding='utf-8')  # append
+        best=open(self.bestfile,'a', encoding='utf-8')  # append
         print('GA: ' + a)
         best.write(a + '\n')
         best.close()
@@ -359,7 +392,7 @@ class GA():
         print(self.step_string())
 
     def step_string(self):  # Prints the index and fitness of the current being to std out
-        return 'GA: %d.%d Fitness = %6.2f'%(self.generation(), self.current_being, self.population[self.current_being].fitness)
+        return 'GA: %d.%d Fitness = %6.2f'%(self.generation(), self.current_being, self.fitnesses[self.current_being])
 
 
     def at_generation_completed(self):
@@ -388,20 +421,7 @@ class Seed():  # contains optimization parameters for each parameter. number of
 
 
 
-class Being():  # contains the parameter set and fitness. number of beings corresponds to population size
-    def __init__(self, maximize, seeds, keep=False):
-        self.values=[]
-        self.fitness= -np.inf if maximize else np.inf  # make sure that non evaluated beings end up at the bottom of the list after sorting
-        for seed in seeds:
-            if keep:
-                self.values.append(seed.initial)
-            else:
-                self.values.append(noise(seed.initial, seed))
-
-##################################### Function  #################################################
-
-def noise(value, seed):
-    if np.random.rand() < seed.rate:
-        return max(min(value+np.random.rand()*2*seed.range-seed.range, seed.max), seed.min)
-    else:
-        return value
+class Being():  # contains the parameter set and fitness of one row of the population
+    def __init__(self, values, fitness):
+        self.values=list(values)
+        self.fitness=fitness
@@ -4,7 +4,6 @@ from typing import TYPE_CHECKING, cast
 import numpy as np
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QSlider  # , QTextEdit  #, QSizePolicy  # QLabel, QMessageBox
-from scipy.stats import binned_statistic
 
 from esibd.core import PARAMETERTYPE, DynamicNp, MetaChannel, Parameter, ScanChannel, parameterDict, plotting
 from esibd.plugins import Scan
@@ -18,6 +17,89 @@ def providePlugins() -> 'list[type[Plugin]]':
     return [Omni]
 
 
+class BinnedStatistic:
+    """Accumulate running sum, count, and sum of squares per bin.
+
+    New samples are added incrementally, thus updating the statistic does not require to bin the entire history again.
+    The statistic is recalculated from scratch only if bins or range change.
+    """
+
+    def __init__(self, bins: int, start: float, stop: float) -> None:
+        """Initialize a BinnedStatistic.
+
+        :param bins: Number of bins.
+        :type bins: int
+        :param start: Lower limit of the binned range.
+        :type start: float
+        :param stop: Upper limit of the binned range. Included in the last bin.
+        :type stop: float
+        """
+        self.bins = bins
+        self.start = min(start, stop)
+        self.stop = max(start, stop)
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all accumulated samples."""
+        self.size = 0  # number of samples that have already been processed
+        self.sum = np.zeros(self.bins, dtype=np.float64)
+        self.count = np.zeros(self.bins, dtype=np.float64)
+        self.sumSquares = np.zeros(self.bins, dtype=np.float64)
+
+    def matches(self, bins: int, start: float, stop: float) -> bool:
+        """Indicate if the statistic has been initialized for the given bins and range.
+
+        :param bins: Number of bins.
+        :type bins: int
+        :param start: Lower limit of the binned range.
+        :type start: float
+        :param stop: Upper limit of the binned range.
+        :type stop: float
+        :return: True if no rebinning is required.
+        :rtype: bool
+        """
+        return self.bins == bins and self.start == min(start, stop) and self.stop == max(start, stop)
+
+    def update(self, x: np.ndarray, y: np.ndarray) -> None:
+        """Add all samples that have been appended since the last update.
+
+        :param x: All recorded values of the independent variable.
+        :type x: np.ndarray
+        :param y: All recorded values of the dependent variable.
+        :type y: np.ndarray
+        """
+        length = min(x.shape[0], y.shape[0])  # input may already contain the value for the next step
+        if length < self.size:  # data has been reset
+            self.reset()
+        x, y = x[self.size:length], y[self.size:length]
+        self.size = length
+        valid = np.isfinite(x) & np.isfinite(y) & (x >= self.start) & (x <= self.stop)
+        x, y = x[valid], y[valid]
+        if x.shape[0] == 0 or self.stop == self.start:
+            return
+        indices = np.minimum(((x - self.start) / (self.stop - self.start) * self.bins).astype(np.int64), self.bins - 1)  # include stop in last bin
+        self.sum += np.bincount(indices, weights=y, minlength=self.bins)
+        self.count += np.bincount(indices, minlength=self.bins)
+        self.sumSquares += np.bincount(indices, weights=y**2, minlength=self.bins)
+
+    def centers(self) -> np.ndarray:
+        """Return the centers of all bins."""
+        edges = np.linspace(self.start, self.stop, self.bins + 1)
+        return (edges[:-1] + edges[1:]) / 2
+
+    def mean(self) -> np.ndarray:
+        """Return the mean per bin. Empty bins are NaN."""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return self.sum / self.count
+
+    def standardError(self) -> np.ndarray:
+        """Return the standard error of the mean per bin. Bins with less than two samples are NaN."""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = self.sum / self.count
+            variance = np.maximum(self.sumSquares / self.count - mean**2, 0) * self.count / (self.count - 1)  # unbiased sample variance
+            return np.where(self.count > 1, np.sqrt(variance / self.count), np.nan)
+
+
 class Omni(Scan):
     """Most basic scan which simply records a number of arbitrary output channels as a function of a single arbitrary input channel.
 
@@ -40,6 +122,7 @@ class Omni(Scan):
     class ScanChannel(ScanChannel):
         # will be DynamicNp in interactive mode and np.ndarray otherwise
         recordingData: 'DynamicNp | np.ndarray'
+        binnedStatistic: 'BinnedStatistic | None' = None
 
     class MetaChannel(MetaChannel):
         recordingData: 'DynamicNp'
@@ -53,11 +136,13 @@ class Omni(Scan):
             super().__init__(**kwargs)
             self.xSlider: QSlider = None  # type: ignore  # noqa: PGH003
             self.lines = None  # type: ignore  # noqa: PGH003
+            self.errorBands = []
 
         def initFig(self) -> None:
             super().initFig()
             if self.fig:
                 self.lines = None  # type: ignore  # noqa: PGH003
+                self.errorBands = []
                 self.axes = []
                 self.axes.append(self.fig.add_subplot(111))
                 if self.xSlider:
@@ -140,6 +225,8 @@ class Omni(Scan):
                 self.inputChannels[0].recordingData = DynamicNp()
                 for outputChannel in self.outputChannels:
                     outputChannel.recordingData = DynamicNp()
+                    outputChannel.recordingDataStd = DynamicNp()
+                    outputChannel.binnedStatistic = None
             return True
         return False
 
@@ -153,6 +240,7 @@ class Omni(Scan):
             inputRecordingData = self.inputChannels[0].getRecordingData()
             if not self.display.lines:
                 self.display.axes[0].clear()
+                self.display.errorBands = []
                 self.display.lines = []  # dummy plots
                 for outputChannel in self.outputChannels:
                     if outputChannel.sourceChannel:
@@ -165,13 +253,21 @@ class Omni(Scan):
                 self.display.axes[0].set_xlabel(f'{self.inputChannels[0].name} ({self.inputChannels[0].unit})')
                 if self.recording:  # show all data if loaded from file
                     self.display.axes[0].set_xlim(self.start, self.stop)
+            for errorBand in self.display.errorBands:
+                errorBand.remove()
+            self.display.errorBands = []
             if self.interactive:
                 for i, output in enumerate(self.outputChannels):
-                    if output.display:
-                        x = inputRecordingData
-                        y = output.getRecordingData()
-                        mean, bin_edges, _ = binned_statistic(x, y, bins=self.bins, range=(int(self.start), int(self.stop)))
-                        self.display.lines[i].set_data((bin_edges[:-1] + bin_edges[1:]) / 2, mean)
+                    outputRecordingData = output.getRecordingData()
+                    if output.display and inputRecordingData is not None and outputRecordingData is not None:
+                        if not output.binnedStatistic or not output.binnedStatistic.matches(self.bins, self.start, self.stop):
+                            output.binnedStatistic = BinnedStatistic(self.bins, self.start, self.stop)
+                        output.binnedStatistic.update(inputRecordingData, outputRecordingData)  # only processes new samples
+                        centers, mean = output.binnedStatistic.centers(), output.binnedStatistic.mean()
+                        standardError = output.binnedStatistic.standardError()
+                        self.display.lines[i].set_data(centers, mean)
+                        self.display.errorBands.append(self.display.axes[0].fill_between(centers, mean - standardError, mean + standardError,
+                                                                                         color=self.display.lines[i].get_color(), alpha=0.3, linewidth=0))
                     else:
                         self.display.lines[i].set_data([], [])
             else:
@@ -215,19 +311,27 @@ fig.show()
                 if self.invalidWhileWaiting:
                     for outputChannel in self.outputChannels:
                         outputChannel.signalComm.waitUntilStableSignal.emit(self.wait)
-                time.sleep((self.wait + self.average) / 1000)  # if step is larger than threshold use longer wait time
+                time.sleep(self.wait / 1000)
+                settledTime = time.time()
+                time.sleep(self.average / 1000)
+                stepTime = time.time()
                 self.bufferLagging()
                 self.waitForCondition(condition=lambda: self.stepProcessed, timeoutMessage='processing scan step.', timeout=10)
-                inputChannelValues0 = self.inputChannels[0].getValues(subtractBackground=self.inputChannels[0].subtractBackgroundActive(), length=self.measurementsPerStep)
-                if inputChannelValues0 is not None:
+                indexWindows = {}  # search time axis only once per device
+                inputStepStatistics = self.inputChannels[0].getStepStatistics(t_min=settledTime, t_max=stepTime,
+                                                                              subtractBackground=self.inputChannels[0].subtractBackgroundActive(), indexWindows=indexWindows)
+                if inputStepStatistics is not None:
                     if self.inputChannels[0].recording:  # get average
-                        cast('DynamicNp', self.inputChannels[0].recordingData).add(float(np.mean(inputChannelValues0)))
+                        cast('DynamicNp', self.inputChannels[0].recordingData).add(inputStepStatistics.mean)
                     else:  # use last value
                         cast('DynamicNp', self.inputChannels[0].recordingData).add(self.inputChannels[0].value)
-                    for j, outputChannel in enumerate(self.outputChannels):
-                        outputChannelValues = outputChannel.getValues(subtractBackground=outputChannel.subtractBackgroundActive(), length=self.measurementsPerStep)
-                        if outputChannelValues is not None:
-                            cast('DynamicNp', self.outputChannels[j].recordingData).add(float(np.mean(outputChannelValues)))
+                    for outputChannel in self.outputChannels:
+                        stepStatistics = outputChannel.getStepStatistics(t_min=settledTime, t_max=stepTime, subtractBackground=outputChannel.subtractBackgroundActive(),
+                                                                         indexWindows=indexWindows)
+                        if stepStatistics is not None:
+                            cast('DynamicNp', outputChannel.recordingData).add(stepStatistics.mean)
+                            if isinstance(outputChannel.recordingDataStd, DynamicNp):
+                                outputChannel.recordingDataStd.add(stepStatistics.std)
                 if not recording():  # last step
                     self.signalComm.scanUpdateSignal.emit(True)  # update graph and save data  # noqa: FBT003
                     self.signalComm.updateRecordingSignal.emit(False)  # noqa: FBT003
@@ -244,14 +348,20 @@ fig.show()
                         waitLong = True
                     if self.inputChannels[0].updateValueSignal:
                         self.inputChannels[0].updateValueSignal.emit(step)
-                    time.sleep(((self.waitLong if waitLong else self.wait) + self.average) / 1000)  # if step is larger than threshold use longer wait time
+                    time.sleep((self.waitLong if waitLong else self.wait) / 1000)  # if step is larger than threshold use longer wait time
+                    settledTime = time.time()
+                    time.sleep(self.average / 1000)
+                    stepTime = time.time()
                     self.bufferLagging()
                     self.waitForCondition(condition=lambda: self.stepProcessed, timeoutMessage='processing scan step.', timeout=10)
+                    indexWindows = {}  # search time axis only once per device
                     for outputChannel in self.outputChannels:
-                        outputRecordingData = outputChannel.getValues(subtractBackground=outputChannel.getDevice().subtractBackgroundActive(),
-                                                                                          length=self.measurementsPerStep)
-                        if outputRecordingData is not None:
-                            cast('np.ndarray', outputChannel.recordingData)[i] = np.mean(outputRecordingData)
+                        stepStatistics = outputChannel.getStepStatistics(t_min=settledTime, t_max=stepTime,
+                                                                         subtractBackground=outputChannel.getDevice().subtractBackgroundActive(), indexWindows=indexWindows)
+                        if stepStatistics is not None:
+                            cast('np.ndarray', outputChannel.recordingData)[i] = stepStatistics.mean
+                            if isinstance(outputChannel.recordingDataStd, np.ndarray):
+                                outputChannel.recordingDataStd[i] = stepStatistics.std
                     if i == len(steps) - 1 or not recording():  # last step
                         if self.inputChannels[0].updateValueSignal:
                             self.inputChannels[0].updateValueSignal.emit(self.inputChannels[0].initialValue)
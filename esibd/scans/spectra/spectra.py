@@ -199,17 +199,25 @@ class Spectra(Beam):
             if self.invalidWhileWaiting:
                 for outputChannel in self.outputChannels:
                     outputChannel.signalComm.waitUntilStableSignal.emit(self.waitLong if waitLong else self.wait)
-            time.sleep(((self.waitLong if waitLong else self.wait) + self.average) / 1000)  # if step is larger than threshold use longer wait time
+            time.sleep((self.waitLong if waitLong else self.wait) / 1000)  # if step is larger than threshold use longer wait time
+            settledTime = time.time()
+            time.sleep(self.average / 1000)
+            stepTime = time.time()
             self.bufferLagging()
             self.waitForCondition(condition=lambda: self.stepProcessed, timeoutMessage='processing scan step.', timeout=10)
+            indexWindows = {}  # search time axis only once per device
             for outputChannel in self.outputChannels:
                 # 2D scan
                 # definition updated to scan along x instead of y axis.
                 outputDevice = outputChannel.getDevice()
                 if isinstance(outputDevice, Device):
-                    outputValues = outputChannel.getValues(subtractBackground=outputDevice.subtractBackgroundActive(), length=self.measurementsPerStep)
-                    if outputChannel.recordingData is not None and inputRecordingData0 is not None and outputValues is not None:
-                        outputChannel.recordingData[i // len(inputRecordingData0), i % len(inputRecordingData0)] = np.mean(outputValues)
+                    stepStatistics = outputChannel.getStepStatistics(t_min=settledTime, t_max=stepTime, subtractBackground=outputDevice.subtractBackgroundActive(),
+                                                                     indexWindows=indexWindows)
+                    if outputChannel.recordingData is not None and inputRecordingData0 is not None and stepStatistics is not None:
+                        index = (i // len(inputRecordingData0), i % len(inputRecordingData0))
+                        outputChannel.recordingData[index] = stepStatistics.mean
+                        if isinstance(outputChannel.recordingDataStd, np.ndarray):
+                            outputChannel.recordingDataStd[index] = stepStatistics.std
             if i == len(steps) - 1 or not recording():  # last step
                 for inputChannel in self.inputChannels:
                     if inputChannel.updateValueSignal:
@@ -0,0 +1,89 @@
+"""Measures how many settings can be changed per second with and without the write-behind cache of qSet.
+
+Each change is followed by processing events, as it would be in the GUI, which allows QSettings to write changes to storage.
+Uses a temporary ini file or, with --native, a temporary entry in the native storage (registry on Windows) that is removed afterwards.
+With --parameter, changes are made by assigning Parameter.value of an internal Parameter, including updating its widget, instead of calling setValue directly.
+
+Run with: python settings_benchmark.py --changes 5000 --parameter
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import cast
+
+from PyQt6.QtCore import QCoreApplication, QSettings
+from PyQt6.QtWidgets import QApplication
+
+from esibd.const import BufferedSettings
+
+
+def run(settings: 'QSettings | BufferedSettings', changes: int, keys: int) -> float:
+    """Change values like a slider drag or scan sweep would and return changes per second.
+
+    :param settings: Settings to be tested.
+    :type settings: QSettings | BufferedSettings
+    :param changes: Number of changes.
+    :type changes: int
+    :param keys: Number of different keys that are changed.
+    :type keys: int
+    :return: Changes per s.
+    :rtype: float
+    """
+    start = time.perf_counter()
+    for i in range(changes):
+        settings.setValue(f'Benchmark/parameter {i % keys}', i * 0.1)
+        QCoreApplication.processEvents()
+    settings.sync()
+    return changes / (time.perf_counter() - start)
+
+
+def runParameter(settings: 'QSettings | BufferedSettings', changes: int, keys: int) -> float:
+    """Change values of internal parameters like a user or scan would and return changes per second.
+
+    :param settings: Settings to be tested. Replaces qSet while testing.
+    :type settings: QSettings | BufferedSettings
+    :param changes: Number of changes.
+    :type changes: int
+    :param keys: Number of different parameters that are changed.
+    :type keys: int
+    :return: Changes per s.
+    :rtype: float
+    """
+    import esibd.core  # noqa: PLC0415
+    parameterParent = cast('esibd.core.SettingsManager', SimpleNamespace(name='Benchmark', loading=False, print=lambda *args, **kwargs: None))  # noqa: ARG005
+    qSet = esibd.core.qSet
+    esibd.core.qSet = settings  # type: ignore[assignment]  # Parameter uses the module level qSet
+    try:
+        parameters = [esibd.core.Parameter(name=f'parameter {i}', parameterParent=parameterParent, parameterType=esibd.core.PARAMETERTYPE.FLOAT,
+                                           internal=True, minimum=0, maximum=changes) for i in range(keys)]
+        start = time.perf_counter()
+        for i in range(changes):
+            parameters[i % keys].value = i * 0.1
+            QCoreApplication.processEvents()
+        settings.sync()
+        return changes / (time.perf_counter() - start)
+    finally:
+        esibd.core.qSet = qSet
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Measure settings throughput with and without write-behind cache.')
+    parser.add_argument('--changes', type=int, default=5000, help='Number of changes.')
+    parser.add_argument('--keys', type=int, default=10, help='Number of different keys.')
+    parser.add_argument('--native', action='store_true', help='Use native storage instead of ini file.')
+    parser.add_argument('--parameter', action='store_true', help='Change values using Parameter.value of internal parameters.')
+    args = parser.parse_args()
+    app = QApplication([]) if args.parameter else QCoreApplication([])  # parameters require widgets
+    with tempfile.TemporaryDirectory() as directory:
+        results = {}
+        for label in ('QSettings', 'BufferedSettings'):
+            qSettings = (QSettings('ESIBD Benchmark', label) if args.native
+                         else QSettings((Path(directory) / f'{label}.ini').as_posix(), QSettings.Format.IniFormat))
+            results[label] = (runParameter if args.parameter else run)(qSettings if label == 'QSettings' else BufferedSettings(qSettings), args.changes, args.keys)
+            qSettings.clear()
+            qSettings.sync()
+    for label, result in results.items():
+        print(f'{label:>16}: {result:12.0f} changes/s')  # noqa: T201
+    print(f"speedup: {results['BufferedSettings'] / results['QSettings']:.1f}x")  # noqa: T201